@@ -0,0 +1,105 @@
+"""
+JSON file helpers shared by the workflow state and the Step 8 modules.
+
+Encodes with orjson when installed and stdlib json otherwise. orjson writes
+inf/NaN as null and rejects the Infinity/NaN tokens stdlib json emits, so
+payloads holding non-finite floats are encoded with stdlib json and input
+orjson cannot parse is retried with stdlib json.
+"""
+
+import json
+import math
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson  # Optional: faster JSON encoding
+except ImportError:
+    orjson = None
+
+
+def has_non_finite(obj: Any) -> bool:
+    """True if obj contains an inf or NaN float anywhere."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(has_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(has_non_finite(v) for v in obj)
+    return False
+
+
+def dumps(payload: Any, indent: bool = True, sort_keys: bool = False) -> bytes:
+    """
+    Encode payload as UTF-8 JSON bytes.
+
+    Args:
+        payload: JSON-serializable object
+        indent: Indent nested values by two spaces
+        sort_keys: Sort object keys (stable output for hashing)
+
+    Returns:
+        Encoded JSON
+    """
+    if orjson is not None and not has_non_finite(payload):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(payload, option=option)
+
+    return json.dumps(
+        payload,
+        indent=2 if indent else None,
+        sort_keys=sort_keys,
+        ensure_ascii=False,
+    ).encode('utf-8')
+
+
+def loads(data: bytes) -> Any:
+    """
+    Decode JSON bytes.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    keep catching the stdlib exception.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. Infinity/NaN tokens written by stdlib json
+    return json.loads(data)
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """Read and parse a JSON file from raw bytes."""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def write_json_atomic(path: Union[str, Path], payload: Any, indent: bool = True) -> None:
+    """
+    Atomically write payload as JSON in a single binary write.
+
+    The bytes go to a sibling .tmp file that is fsynced and renamed over the
+    target, so an interrupted write or a concurrent reader never sees a
+    truncated file.
+    """
+    write_bytes_atomic(path, dumps(payload, indent=indent))
+
+
+def write_bytes_atomic(path: Union[str, Path], data: bytes) -> None:
+    """Atomically replace path with data (sibling .tmp, fsync, os.replace)."""
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
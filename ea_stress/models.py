@@ -4,13 +4,14 @@ Data models for EA Stress Test System.
 Defines the workflow state structure and serialization.
 """
 
-import json
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from enum import Enum
 
+from .jsonio import read_json, write_json_atomic
+
 
 class WorkflowStatus(Enum):
     """Workflow execution status values."""
@@ -21,6 +22,18 @@ class WorkflowStatus(Enum):
     PAUSED = "paused"
 
 
+# Allowed (from, to) workflow status pairs; COMPLETED is terminal.
+_ALLOWED_TRANSITIONS = frozenset({
+    (WorkflowStatus.PENDING, WorkflowStatus.RUNNING),
+    (WorkflowStatus.RUNNING, WorkflowStatus.COMPLETED),
+    (WorkflowStatus.RUNNING, WorkflowStatus.FAILED),
+    (WorkflowStatus.RUNNING, WorkflowStatus.PAUSED),
+    (WorkflowStatus.PAUSED, WorkflowStatus.RUNNING),
+    (WorkflowStatus.PAUSED, WorkflowStatus.FAILED),
+    (WorkflowStatus.FAILED, WorkflowStatus.RUNNING),  # Allow retry
+})
+
+
 class StepStatus(Enum):
     """Individual step execution status."""
     PENDING = "pending"
@@ -30,7 +43,7 @@ class StepStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     """Result of a single workflow step execution."""
     step_id: str
@@ -64,7 +77,7 @@ class StepResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class OptimizationPass:
     """Tracks an optimization pass (Pass 1 or Pass 2)."""
     pass_number: int
@@ -76,7 +89,7 @@ class OptimizationPass:
     selected_for_backtest: List[int] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowState:
     """
     Complete state of an EA stress test workflow.
@@ -167,15 +180,12 @@ class WorkflowState:
     def save(self, path: Path) -> None:
         """Save state to JSON file."""
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        write_json_atomic(path, self.to_dict())
 
     @classmethod
     def load(cls, path: Path) -> 'WorkflowState':
         """Load state from JSON file."""
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return cls.from_dict(data)
+        return cls.from_dict(read_json(path))
 
     def update_step(
         self,
@@ -262,15 +272,7 @@ class WorkflowState:
         - FAILED -> RUNNING (retry)
         - COMPLETED -> (terminal state, no transitions)
         """
-        valid_transitions = {
-            WorkflowStatus.PENDING: {WorkflowStatus.RUNNING},
-            WorkflowStatus.RUNNING: {WorkflowStatus.COMPLETED, WorkflowStatus.FAILED, WorkflowStatus.PAUSED},
-            WorkflowStatus.PAUSED: {WorkflowStatus.RUNNING, WorkflowStatus.FAILED},
-            WorkflowStatus.FAILED: {WorkflowStatus.RUNNING},  # Allow retry
-            WorkflowStatus.COMPLETED: set()  # Terminal state
-        }
-
-        if new_status not in valid_transitions.get(self.status, set()):
+        if (self.status, new_status) not in _ALLOWED_TRANSITIONS:
             self.add_warning(
                 f"Invalid state transition: {self.status.value} -> {new_status.value}"
             )
@@ -80,12 +80,36 @@ class MT5XMLParser:
         Args:
             xml_path: Path to MT5 XML report file
         """
-        self.xml_path = Path(xml_path)
-        if not self.xml_path.exists():
+        xml_path = Path(xml_path)
+        if not xml_path.exists():
             raise FileNotFoundError(f"XML file not found: {xml_path}")
 
-        self.tree = ET.parse(self.xml_path)
-        self.root = self.tree.getroot()
+        self._init_from_root(ET.parse(xml_path).getroot(), xml_path)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "MT5XMLParser":
+        """Create a parser from an in-memory XML report.
+
+        Args:
+            data: Raw XML report content
+
+        Returns:
+            MT5XMLParser with xml_path set to None
+        """
+        parser = cls.__new__(cls)
+        parser._init_from_root(ET.fromstring(data), None)
+        return parser
+
+    def _init_from_root(self, root: ET.Element, xml_path: Optional[Path]) -> None:
+        """Set parser state; shared by __init__ and from_bytes.
+
+        Args:
+            root: Parsed workbook root element
+            xml_path: Source file, or None for in-memory reports
+        """
+        self.xml_path = xml_path
+        self.root = root
+        self.tree = ET.ElementTree(root)
 
     def parse_optimization_results(
         self,
@@ -0,0 +1,54 @@
+"""
+Backtest date window shared by the workflow steps.
+
+Step 5 validation and the Step 8B stat explorer backtest the same period:
+``backtest_years`` fixed 365-day years ending on the local calendar day, with
+the forward split ``forward_years`` before the end.
+"""
+
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Tuple
+
+
+def format_mt5_date(d: date) -> str:
+    """Format a date as MT5's YYYY.MM.DD without going through strftime."""
+    return f"{d.year:04d}.{d.month:02d}.{d.day:02d}"
+
+
+def today_ordinal() -> int:
+    """Ordinal of the local calendar day the backtest window ends on."""
+    return date.today().toordinal()
+
+
+@lru_cache(maxsize=8)
+def backtest_date_range(
+    today_ord: int,
+    backtest_years: int,
+    forward_years: int,
+) -> Tuple[datetime, datetime, datetime, str, str, str]:
+    """
+    Compute the backtest window ending on a given day.
+
+    Keyed on the day's ordinal so back-to-back calls on the same day reuse
+    the result and the cache naturally rolls over at midnight.
+
+    Args:
+        today_ord: Ordinal of the end day (see today_ordinal)
+        backtest_years: Total backtest period
+        forward_years: Out-of-sample period at the end of the window
+
+    Returns:
+        Tuple of (from_date, to_date, split_date, from_str, to_str, split_str)
+    """
+    to_date = datetime.fromordinal(today_ord)
+    from_date = datetime.fromordinal(today_ord - backtest_years * 365)
+    split_date = datetime.fromordinal(today_ord - forward_years * 365)
+    return (
+        from_date,
+        to_date,
+        split_date,
+        format_mt5_date(from_date),
+        format_mt5_date(to_date),
+        format_mt5_date(split_date),
+    )
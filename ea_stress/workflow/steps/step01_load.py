@@ -17,7 +17,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class LoadResult:
     """Result of EA load step."""
     file_exists: bool
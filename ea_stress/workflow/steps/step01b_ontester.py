@@ -30,10 +30,28 @@ Compatibility:
 import os
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
-@dataclass
+# Bare token: the generated header writes it as "//| EA_STRESS_..."
+_SYSTEM_MARKER = b"EA_STRESS_ONTESTER_INJECTED"
+
+# Tail read for the already-injected check; covers the ~4 KiB injected block
+_TAIL_BYTES = 8192
+
+# OnTester definition at the start of a line. [^\S\n] keeps the match on a
+# single line, so a line starting with // can never match.
+_ONTESTER_RE = re.compile(
+    rb'^[^\S\n]*double[^\S\n]+OnTester[^\S\n]*\([^\S\n]*\)', re.MULTILINE
+)
+
+# String literals (group 1, kept) or // and /* */ comments (dropped), so a
+# "//" or "/*" inside a string cannot hide code that follows it
+_COMMENT_RE = re.compile(rb'("(?:\\.|[^"\\\n])*")|//[^\n]*|/\*.*?\*/', re.DOTALL)
+
+
+@dataclass(slots=True)
 class OnTesterResult:
     """Result of OnTester injection step."""
 
@@ -66,45 +84,38 @@ def inject_ontester(ea_path: str, output_dir: str, min_trades: int = 10) -> OnTe
     Inject OnTester function into EA source code.
 
     Args:
-        ea_path: Path to original EA source file
-        output_dir: Directory to save modified EA
+        ea_path: Path to original EA source file (str or path-like)
+        output_dir: Directory to save modified EA (str or path-like)
         min_trades: Minimum trades threshold for OnTester (default: 10)
 
     Returns:
         OnTesterResult with injection status
     """
+    # Result paths are always plain strings so to_dict stays JSON-safe
+    ea_path = os.fspath(ea_path)
+
     try:
-        # Read original EA source
-        with open(ea_path, 'r', encoding='utf-8', errors='ignore') as f:
-            source = f.read()
+        with open(ea_path, 'rb') as f:
+            # Fast path: our block is appended at the end, so a large EA that
+            # was already injected is recognised from its tail alone
+            size = os.fstat(f.fileno()).st_size
+            if size > _TAIL_BYTES:
+                f.seek(size - _TAIL_BYTES)
+                if _is_injected(_whole_lines(f.read())):
+                    return _already_present(ea_path)
+                f.seek(0)
+
+            # Read original EA source; raw bytes are kept for the modified copy
+            raw = f.read()
 
         # Check for existing OnTester function
-        system_marker = "// EA_STRESS_ONTESTER_INJECTED"
-        has_marker = system_marker in source
-
-        # Regex to detect OnTester function (not in comments)
-        ontester_pattern = r'^\s*double\s+OnTester\s*\(\s*\)'
-        has_ontester = False
-
-        # Check line by line to avoid matching commented code
-        for line in source.split('\n'):
-            stripped = line.strip()
-            if stripped.startswith('//'):
-                continue
-            if re.search(ontester_pattern, line, re.MULTILINE):
-                has_ontester = True
-                break
+        has_marker = _SYSTEM_MARKER in raw
+        has_ontester = _has_ontester(raw)
 
         # Determine status
         if has_ontester and has_marker:
             # Already injected by us
-            return OnTesterResult(
-                status="already_present",
-                modified_ea_path=ea_path,
-                original_ea_path=ea_path,
-                has_existing_ontester=True,
-                existing_ontester_is_ours=True
-            )
+            return _already_present(ea_path)
 
         if has_ontester and not has_marker:
             # Conflict: OnTester exists but not injected by us
@@ -126,12 +137,15 @@ def inject_ontester(ea_path: str, output_dir: str, min_trades: int = 10) -> OnTe
         modified_filename = f"{ea_stem}_ontester.mq5"
         modified_path = os.path.join(output_dir, modified_filename)
 
-        # Insert OnTester at end of file (before any potential closing comments)
-        modified_source = source + "\n\n" + ontester_code
+        # Append OnTester at end of file, matching the source's line endings
+        block = "\n\n" + ontester_code
+        if b"\r\n" in raw:
+            block = block.replace("\n", "\r\n")
 
-        # Write modified EA
-        with open(modified_path, 'w', encoding='utf-8') as f:
-            f.write(modified_source)
+        # Write modified EA: original bytes unchanged, then the encoded block
+        with open(modified_path, 'wb') as f:
+            f.write(raw)
+            f.write(block.encode('utf-8'))
 
         return OnTesterResult(
             status="injected",
@@ -149,10 +163,40 @@ def inject_ontester(ea_path: str, output_dir: str, min_trades: int = 10) -> OnTe
         )
 
 
+def _whole_lines(tail: bytes) -> bytes:
+    """Drop the partial first line of a tail read so ^ anchors stay valid."""
+    newline = tail.find(b"\n")
+    return tail[newline + 1:] if newline >= 0 else b""
+
+
+def _has_ontester(data: bytes) -> bool:
+    """Check raw source bytes for an OnTester definition outside comments."""
+    return _ONTESTER_RE.search(_COMMENT_RE.sub(rb'\1', data)) is not None
+
+
+def _is_injected(data: bytes) -> bool:
+    """Check for our marker and an OnTester definition in raw source bytes."""
+    return _SYSTEM_MARKER in data and _has_ontester(data)
+
+
+def _already_present(ea_path: str) -> OnTesterResult:
+    """Result for an EA that already carries our injected OnTester."""
+    return OnTesterResult(
+        status="already_present",
+        modified_ea_path=ea_path,
+        original_ea_path=ea_path,
+        has_existing_ontester=True,
+        existing_ontester_is_ours=True
+    )
+
+
+@lru_cache(maxsize=8)
 def _generate_ontester_code(min_trades: int) -> str:
     """
     Generate the OnTester function code.
 
+    Cached per min_trades; the rendered block only depends on that value.
+
     Formula:
         Score = Profit * R^2 * sqrt(trades/100) * DD_factor * PF_bonus
 
@@ -14,7 +14,7 @@ import json
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 
 @dataclass
@@ -48,6 +48,57 @@ class AnalysisResult:
         }
 
 
+def _llm_paths(workflow_id: str, output_dir: str) -> Tuple[Path, Path, Path]:
+    """
+    Resolve the Step 4 LLM exchange paths for a workflow.
+
+    Returns:
+        Tuple of (llm_dir, request_path, response_path)
+    """
+    llm_dir = Path(output_dir) / workflow_id / "llm"
+    return llm_dir, llm_dir / "step4_request.json", llm_dir / "step4_response.json"
+
+
+def _is_valid(response: Dict[str, Any]) -> bool:
+    """
+    Fast structural check mirroring validate_response_schema.
+
+    Returns at the first failure without building error messages, so the
+    common valid-response path skips all message formatting. Callers fall
+    back to validate_response_schema for the detailed errors.
+    """
+    wide_params = response.get('wide_validation_params')
+    opt_ranges = response.get('optimization_ranges')
+
+    if not isinstance(wide_params, dict) or not isinstance(opt_ranges, list):
+        return False
+
+    for value in wide_params.values():
+        if not isinstance(value, (str, int, float, bool)):
+            return False
+
+    for item in opt_ranges:
+        if not isinstance(item, dict):
+            return False
+        if not isinstance(item.get('name'), str):
+            return False
+        optimize = item.get('optimize')
+        if not isinstance(optimize, bool):
+            return False
+        if optimize:
+            for field_name in ('start', 'step', 'stop'):
+                if not isinstance(item.get(field_name), (int, float)):
+                    return False
+        elif not isinstance(item.get('default'), (int, float)):
+            return False
+        if 'category' in item and not isinstance(item['category'], str):
+            return False
+        if 'rationale' in item and not isinstance(item['rationale'], str):
+            return False
+
+    return True
+
+
 def validate_response_schema(response: Dict[str, Any]) -> List[str]:
     """
     Validate response against schema from PRD Section 3, Step 4.
@@ -140,7 +191,7 @@ def write_analysis_request(
         Path to written request file
     """
     # Create output directory
-    llm_dir = Path(output_dir) / workflow_id / "llm"
+    llm_dir, request_path, _ = _llm_paths(workflow_id, output_dir)
     llm_dir.mkdir(parents=True, exist_ok=True)
 
     # Build request payload
@@ -167,10 +218,12 @@ def write_analysis_request(
         }
     }
 
-    # Write request file
-    request_path = llm_dir / "step4_request.json"
-    with open(request_path, 'w', encoding='utf-8') as f:
-        json.dump(request, f, indent=2, ensure_ascii=False)
+    # Write request file atomically (temp file + rename) so a polling LLM
+    # process never sees a partially-written request
+    payload = json.dumps(request, indent=2, ensure_ascii=False).encode('utf-8')
+    tmp_path = request_path.with_suffix('.json.tmp')
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, request_path)
 
     return str(request_path)
 
@@ -189,7 +242,7 @@ def read_analysis_response(
     Returns:
         Parsed response dict, or None if file not found
     """
-    response_path = Path(output_dir) / workflow_id / "llm" / "step4_response.json"
+    _, _, response_path = _llm_paths(workflow_id, output_dir)
 
     if not response_path.exists():
         return None
@@ -229,6 +282,9 @@ def analyze_parameters(
     Returns:
         AnalysisResult with validation status
     """
+    _, _, response_path = _llm_paths(workflow_id, output_dir)
+    response_path_str = str(response_path)
+
     try:
         # Write request file
         request_path = write_analysis_request(
@@ -248,19 +304,19 @@ def analyze_parameters(
                 wide_validation_params={},
                 optimization_ranges=[],
                 request_path=request_path,
-                response_path=str(Path(output_dir) / workflow_id / "llm" / "step4_response.json"),
+                response_path=response_path_str,
                 status="request_written"
             )
 
-        # Validate response schema
-        validation_errors = validate_response_schema(response)
+        # Validate response schema (detailed errors only when the fast check fails)
+        validation_errors = [] if _is_valid(response) else validate_response_schema(response)
 
         if validation_errors:
             return AnalysisResult(
                 wide_validation_params={},
                 optimization_ranges=[],
                 request_path=request_path,
-                response_path=str(Path(output_dir) / workflow_id / "llm" / "step4_response.json"),
+                response_path=response_path_str,
                 status="error",
                 validation_errors=validation_errors
             )
@@ -270,7 +326,7 @@ def analyze_parameters(
             wide_validation_params=response['wide_validation_params'],
             optimization_ranges=response['optimization_ranges'],
             request_path=request_path,
-            response_path=str(Path(output_dir) / workflow_id / "llm" / "step4_response.json"),
+            response_path=response_path_str,
             status="validated"
         )
 
@@ -291,6 +347,9 @@ def validate_analysis(workflow_id: str, output_dir: str = "runs/analysis") -> An
 
     Used when resuming workflow after external LLM has written response.
     """
+    _, request_path, response_path = _llm_paths(workflow_id, output_dir)
+    response_path_str = str(response_path)
+
     response = read_analysis_response(workflow_id=workflow_id, output_dir=output_dir)
 
     if response is None:
@@ -298,19 +357,19 @@ def validate_analysis(workflow_id: str, output_dir: str = "runs/analysis") -> An
             wide_validation_params={},
             optimization_ranges=[],
             request_path="",
-            response_path=str(Path(output_dir) / workflow_id / "llm" / "step4_response.json"),
+            response_path=response_path_str,
             status="error",
             validation_errors=["Response file not found"]
         )
 
-    validation_errors = validate_response_schema(response)
+    validation_errors = [] if _is_valid(response) else validate_response_schema(response)
 
     if validation_errors:
         return AnalysisResult(
             wide_validation_params={},
             optimization_ranges=[],
             request_path="",
-            response_path=str(Path(output_dir) / workflow_id / "llm" / "step4_response.json"),
+            response_path=response_path_str,
             status="error",
             validation_errors=validation_errors
         )
@@ -318,7 +377,7 @@ def validate_analysis(workflow_id: str, output_dir: str = "runs/analysis") -> An
     return AnalysisResult(
         wide_validation_params=response['wide_validation_params'],
         optimization_ranges=response['optimization_ranges'],
-        request_path=str(Path(output_dir) / workflow_id / "llm" / "step4_request.json"),
-        response_path=str(Path(output_dir) / workflow_id / "llm" / "step4_response.json"),
+        request_path=str(request_path),
+        response_path=response_path_str,
         status="validated"
     )
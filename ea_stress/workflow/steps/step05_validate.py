@@ -5,8 +5,8 @@ Run backtest with wide parameters to confirm EA generates sufficient trades.
 Per PRD Section 3, Step 5.
 """
 
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -25,6 +25,7 @@ from ea_stress.config import (
 )
 from ea_stress.mt5.tester import MT5Tester, BacktestConfig, ForwardMode, OptimizationMode
 from ea_stress.mt5.parser import parse_backtest_xml, BacktestMetrics
+from ea_stress.workflow.dates import backtest_date_range, today_ordinal
 
 
 @dataclass
@@ -136,18 +137,34 @@ def validate_trades(
     Returns:
         ValidationResult with gate status and metrics
     """
-    start_time = datetime.now()
+    # Monotonic clock for duration; wall clock only for the business dates below
+    start_time = time.perf_counter()
 
     try:
-        # Calculate date ranges (ending today) - use datetime objects
-        to_date = datetime.now()
-        from_date = to_date - timedelta(days=backtest_years * 365)
-        split_date = to_date - timedelta(days=forward_years * 365)
+        # Calculate date ranges (ending today) - cached per calendar day
+        (
+            from_date, to_date, split_date,
+            from_date_str, to_date_str, split_date_str,
+        ) = backtest_date_range(today_ordinal(), backtest_years, forward_years)
+        date_fields = {
+            'from_date': from_date_str,
+            'to_date': to_date_str,
+            'split_date': split_date_str,
+        }
 
-        # Format dates as strings for serialization
-        from_date_str = from_date.strftime('%Y.%m.%d')
-        to_date_str = to_date.strftime('%Y.%m.%d')
-        split_date_str = split_date.strftime('%Y.%m.%d')
+        def _fail(error_message: str, **extra: Any) -> ValidationResult:
+            """Build a failed-gate result carrying the shared date fields."""
+            return ValidationResult(
+                total_trades=0,
+                gate_passed=False,
+                net_profit=0.0,
+                profit_factor=0.0,
+                max_drawdown_pct=0.0,
+                win_rate=0.0,
+                error_message=error_message,
+                **date_fields,
+                **extra,
+            )
 
         # Apply safety parameters (loose for validation per PRD Section 3, Step 1C)
         params = wide_validation_params.copy()
@@ -182,51 +199,22 @@ def validate_trades(
         backtest_result = tester.run_backtest(config)
 
         if not backtest_result.success:
-            return ValidationResult(
-                total_trades=0,
-                gate_passed=False,
-                net_profit=0.0,
-                profit_factor=0.0,
-                max_drawdown_pct=0.0,
-                win_rate=0.0,
-                error_message=backtest_result.error_message or "Backtest failed",
-                from_date=from_date_str,
-                to_date=to_date_str,
-                split_date=split_date_str,
-            )
+            return _fail(backtest_result.error_message or "Backtest failed")
 
         # Parse backtest report (XML)
         if not backtest_result.xml_path or not backtest_result.xml_path.exists():
-            return ValidationResult(
-                total_trades=0,
-                gate_passed=False,
-                net_profit=0.0,
-                profit_factor=0.0,
-                max_drawdown_pct=0.0,
-                win_rate=0.0,
-                error_message="Backtest XML report not found",
+            return _fail(
+                "Backtest XML report not found",
                 report_path=str(backtest_result.report_path) if backtest_result.report_path else None,
-                from_date=from_date_str,
-                to_date=to_date_str,
-                split_date=split_date_str,
             )
 
         metrics = parse_backtest_xml(backtest_result.xml_path)
 
         if not metrics:
-            return ValidationResult(
-                total_trades=0,
-                gate_passed=False,
-                net_profit=0.0,
-                profit_factor=0.0,
-                max_drawdown_pct=0.0,
-                win_rate=0.0,
-                error_message="Failed to parse backtest metrics",
+            return _fail(
+                "Failed to parse backtest metrics",
                 xml_path=str(backtest_result.xml_path) if backtest_result.xml_path else None,
                 report_path=str(backtest_result.report_path) if backtest_result.report_path else None,
-                from_date=from_date_str,
-                to_date=to_date_str,
-                split_date=split_date_str,
             )
 
         # Check for forward metrics (required per PRD)
@@ -270,7 +258,7 @@ def validate_trades(
         gate_passed = total_trades >= min_trades
 
         # Calculate duration
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
 
         return ValidationResult(
             total_trades=total_trades,
@@ -283,10 +271,8 @@ def validate_trades(
             forward_metrics=forward_metrics,
             report_path=str(backtest_result.report_path) if backtest_result.report_path else None,
             xml_path=str(backtest_result.xml_path) if backtest_result.xml_path else None,
-            from_date=from_date_str,
-            to_date=to_date_str,
-            split_date=split_date_str,
             duration_seconds=duration,
+            **date_fields,
         )
 
     except Exception as e:
@@ -9,12 +9,62 @@ Per PRD Section 3, Step 6.
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import date
+from functools import lru_cache
+import io
 import os
-
-
-@dataclass
+import re
+
+
+# Standard MT5 timeframes in minutes
+_TF_MINUTES = {
+    "M1": 1,
+    "M5": 5,
+    "M15": 15,
+    "M30": 30,
+    "H1": 60,
+    "H4": 240,
+    "D1": 1440,
+    "W1": 10080,
+    "MN1": 43200,
+}
+
+_TF_GENERIC_PATTERN = re.compile(r"^([MH])(\d+)$")
+
+# Constant tails of [TesterInputs] rows
+_OPTIMIZED_SUFFIX = "||Y\n"
+_FIXED_SUFFIX = "||0||0||0||N\n"
+
+# [Tester] section template (formatted once per INI via str.format_map)
+_TESTER_TEMPLATE = (
+    "[Tester]\n"
+    "Expert={expert}\n"
+    "ExpertParameters={expert_parameters}\n"
+    "Symbol={symbol}\n"
+    "Period={period}\n"
+    "FromDate={from_date}\n"
+    "ToDate={to_date}\n"
+    "ForwardMode=2\n"  # Date-based forward
+    "ForwardDate={forward_date}\n"
+    "Model={model}\n"
+    "ExecutionMode={execution_mode}\n"
+    "Optimization=2\n"  # Genetic algorithm
+    "OptimizationCriterion={optimization_criterion}\n"  # Custom (OnTester)
+    "Report={report}\n"
+    "ReplaceReport=1\n"
+    "UseLocal=1\n"
+    "Visual=0\n"
+    "ShutdownTerminal=1\n"
+    "Deposit={deposit}\n"
+    "Currency={currency}\n"
+    "Leverage={leverage}\n"
+    "\n"
+    "[TesterInputs]\n"
+)
+
+
+@dataclass(slots=True)
 class OptimizationINIResult:
     """Result of Step 6: Create Optimization INI (Pass 1 - Wide)"""
 
@@ -84,6 +134,8 @@ def create_optimization_ini(
     currency: str = "GBP",
     leverage: int = 100,
     optimization_criterion: int = 6,
+    prepare_output_dir: bool = True,
+    fsync: bool = True,
 ) -> OptimizationINIResult:
     """
     Create MT5 optimization INI file for Pass 1.
@@ -110,6 +162,10 @@ def create_optimization_ini(
         currency: Account currency (default: "GBP")
         leverage: Account leverage (default: 100)
         optimization_criterion: MT5 criterion (6=custom OnTester, default: 6)
+        prepare_output_dir: Create output_dir if missing (pass False when the
+            caller already ran ensure_output_dir, e.g. in a batch)
+        fsync: Flush the INI to disk before returning so MT5 never reads a
+            partially persisted file (set False for bulk sweeps)
 
     Returns:
         OptimizationINIResult with INI path and metadata
@@ -117,7 +173,7 @@ def create_optimization_ini(
     try:
         # Validate inputs
         ex5_path_obj = Path(ex5_path)
-        if not ex5_path_obj.exists():
+        if not os.path.exists(ex5_path):
             return OptimizationINIResult(
                 ini_path="",
                 report_name="",
@@ -145,19 +201,18 @@ def create_optimization_ini(
                 error_message="No optimization ranges provided",
             )
 
+        # Resolve path components once
+        ex5_name = ex5_path_obj.name
+        ex5_stem = ex5_path_obj.stem
+
         # Determine EA name
         if ea_name is None:
-            ea_name = ex5_path_obj.stem
+            ea_name = ex5_stem
 
         # Calculate dates (ending today, per PRD Section 3, Step 5)
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=backtest_years * 365)
-        forward_split_date = end_date - timedelta(days=(backtest_years - in_sample_years) * 365)
-
-        # Format dates for MT5 (YYYY.MM.DD)
-        start_date_str = start_date.strftime("%Y.%m.%d")
-        end_date_str = end_date.strftime("%Y.%m.%d")
-        forward_date_str = forward_split_date.strftime("%Y.%m.%d")
+        start_date_str, end_date_str, forward_date_str = _compute_date_strings(
+            date.today().toordinal(), backtest_years, in_sample_years
+        )
 
         # Convert timeframe to minutes for MT5
         timeframe_minutes = _timeframe_to_minutes(timeframe)
@@ -168,7 +223,8 @@ def create_optimization_ini(
 
         # Create output directory if needed
         output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+        if prepare_output_dir:
+            ensure_output_dir(output_path)
 
         # INI file path
         ini_filename = f"{report_name}.ini"
@@ -178,60 +234,50 @@ def create_optimization_ini(
         optimize_count = sum(1 for r in optimization_ranges if r.get("optimize", False))
         fixed_count = len(optimization_ranges) - optimize_count
 
-        # Build INI content
-        ini_lines = []
-
-        # [Tester] section
-        ini_lines.append("[Tester]")
-        ini_lines.append(f"Expert={ex5_path_obj.name}")
-        ini_lines.append(f"ExpertParameters={ex5_path_obj.stem}.set")
-        ini_lines.append(f"Symbol={symbol}")
-        ini_lines.append(f"Period={timeframe_minutes}")
-        ini_lines.append(f"FromDate={start_date_str}")
-        ini_lines.append(f"ToDate={end_date_str}")
-        ini_lines.append("ForwardMode=2")  # Date-based forward
-        ini_lines.append(f"ForwardDate={forward_date_str}")
-        ini_lines.append(f"Model={model}")
-        ini_lines.append(f"ExecutionMode={execution_latency_ms}")
-        ini_lines.append("Optimization=2")  # Genetic algorithm
-        ini_lines.append(f"OptimizationCriterion={optimization_criterion}")  # Custom (OnTester)
-        ini_lines.append(f"Report={report_name}")
-        ini_lines.append("ReplaceReport=1")
-        ini_lines.append("UseLocal=1")
-        ini_lines.append("Visual=0")
-        ini_lines.append("ShutdownTerminal=1")
-        ini_lines.append(f"Deposit={deposit}")
-        ini_lines.append(f"Currency={currency}")
-        ini_lines.append(f"Leverage={leverage}")
-        ini_lines.append("")
-
-        # [TesterInputs] section
-        ini_lines.append("[TesterInputs]")
-
-        for param_range in optimization_ranges:
-            param_name = param_range["name"]
-            optimize = param_range.get("optimize", False)
-
-            if optimize:
-                # Optimized parameter: default||start||step||stop||Y
-                start = param_range.get("start", 0)
-                step = param_range.get("step", 1)
-                stop = param_range.get("stop", 100)
-                default = param_range.get("default", start)
-
-                param_line = f"{param_name}={default}||{start}||{step}||{stop}||Y"
-            else:
-                # Fixed parameter: value||0||0||0||N
-                default = param_range.get("default", 0)
-                param_line = f"{param_name}={default}||0||0||0||N"
-
-            ini_lines.append(param_line)
-
-        ini_lines.append("")
-
-        # Write INI file
-        ini_content = "\n".join(ini_lines)
-        ini_path.write_text(ini_content, encoding="utf-8")
+        # Compose INI text segment by segment in one buffer, encode once
+        sio = io.StringIO()
+
+        # [Tester] section, filled from the precompiled module template
+        sio.write(_TESTER_TEMPLATE.format_map({
+            "expert": ex5_name,
+            "expert_parameters": f"{ex5_stem}.set",
+            "symbol": symbol,
+            "period": timeframe_minutes,
+            "from_date": start_date_str,
+            "to_date": end_date_str,
+            "forward_date": forward_date_str,
+            "model": model,
+            "execution_mode": execution_latency_ms,
+            "optimization_criterion": optimization_criterion,
+            "report": report_name,
+            "deposit": deposit,
+            "currency": currency,
+            "leverage": leverage,
+        }))
+
+        # [TesterInputs] section (header is part of the template above)
+        # Rows come from a template compiled once per parameter schema; only
+        # the default values are substituted per call
+        schema_key, defaults = _split_input_schema(optimization_ranges)
+        sio.write(_compile_inputs_template(schema_key).format(*defaults))
+
+        # Translate newlines as a text-mode write would, so MT5 on Windows
+        # still receives CRLF line endings
+        ini_text = sio.getvalue()
+        if os.linesep != "\n":
+            ini_text = ini_text.replace("\n", os.linesep)
+        ini_bytes = ini_text.encode("utf-8")
+
+        # Write INI file with a single write on a raw descriptor
+        # (O_BINARY stops Windows translating the newlines a second time)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(str(ini_path), flags, 0o644)
+        try:
+            os.write(fd, ini_bytes)
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
 
         return OptimizationINIResult(
             ini_path=str(ini_path),
@@ -274,6 +320,191 @@ def create_optimization_ini(
         )
 
 
+def create_optimization_inis_batch(
+    configs: List[Dict[str, Any]],
+    max_workers: Optional[int] = None,
+) -> List[OptimizationINIResult]:
+    """
+    Create optimization INI files for a parameter sweep in one call.
+
+    Each config is a dict of create_optimization_ini keyword arguments
+    (include ``fsync=False`` to defer disk flushes across a large sweep).
+    Date strings, timeframe lookups and TesterInputs templates are cached,
+    so configs sharing a day and parameter schema only pay for formatting
+    and the file write.
+
+    Args:
+        configs: List of create_optimization_ini keyword argument dicts
+        max_workers: Thread pool size for the (I/O-bound) writes;
+            None or 1 writes sequentially
+
+    Returns:
+        List of OptimizationINIResult, in the same order as configs
+    """
+    # Create each distinct output directory once up front instead of per INI;
+    # configs without an output_dir go through create_optimization_ini as-is
+    dir_errors: Dict[str, OSError] = {}
+    output_dirs = {str(config["output_dir"]) for config in configs if config.get("output_dir") is not None}
+    for output_dir in output_dirs:
+        try:
+            ensure_output_dir(output_dir)
+        except OSError as e:
+            dir_errors[output_dir] = e
+
+    def create(config: Dict[str, Any]) -> OptimizationINIResult:
+        output_dir = config.get("output_dir")
+        if output_dir is None:
+            return create_optimization_ini(**config)
+
+        dir_error = dir_errors.get(str(output_dir))
+        if dir_error is not None:
+            return OptimizationINIResult(
+                ini_path="",
+                report_name="",
+                param_count=0,
+                optimize_count=0,
+                fixed_count=0,
+                start_date="",
+                end_date="",
+                forward_date="",
+                success=False,
+                error_message=f"Error creating output directory {output_dir}: {dir_error}",
+            )
+
+        return create_optimization_ini(**{**config, "prepare_output_dir": False})
+
+    if not max_workers or max_workers <= 1 or len(configs) <= 1:
+        return [create(config) for config in configs]
+
+    # Imported here so sequential batches never load concurrent.futures
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(create, configs))
+
+
+def ensure_output_dir(output_dir: Any) -> Path:
+    """
+    Create an INI output directory (and parents) if it does not exist.
+
+    Workflow drivers writing many INIs into one directory call this once
+    and pass prepare_output_dir=False to create_optimization_ini.
+
+    Args:
+        output_dir: Directory path (str or Path)
+
+    Returns:
+        Directory as a Path
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    return output_path
+
+
+def _split_input_schema(
+    optimization_ranges: List[Dict[str, Any]],
+) -> Tuple[Tuple[Tuple[Any, ...], ...], List[Any]]:
+    """
+    Split optimization ranges into a hashable schema key and default values.
+
+    The key holds everything that shapes the [TesterInputs] rows (names,
+    optimize flags and start/step/stop as rendered text); the defaults are the only per-call
+    values substituted into the compiled template.
+
+    Args:
+        optimization_ranges: Parameter range dicts from Step 4
+
+    Returns:
+        Tuple of (schema_key, defaults)
+    """
+    schema = []
+    defaults = []
+
+    for param_range in optimization_ranges:
+        param_name = param_range["name"]
+
+        if param_range.get("optimize", False):
+            start = param_range.get("start", 0)
+            step = param_range.get("step", 1)
+            stop = param_range.get("stop", 100)
+            # Key on the rendered text: 10 == 10.0 (and True == 1) hash
+            # alike, so raw values would let an int range and a float range
+            # share one cached template
+            schema.append((param_name, True, str(start), str(step), str(stop)))
+            defaults.append(param_range.get("default", start))
+        else:
+            schema.append((param_name, False))
+            defaults.append(param_range.get("default", 0))
+
+    return tuple(schema), defaults
+
+
+@lru_cache(maxsize=32)
+def _compile_inputs_template(schema_key: Tuple[Tuple[Any, ...], ...]) -> str:
+    """
+    Compile a str.format template for the [TesterInputs] rows of a schema.
+
+    Positional field {i} is the default value of the i-th parameter, so
+    regenerating an INI for the same schema (e.g., Pass 2 re-runs) is a
+    single format call.
+
+    Args:
+        schema_key: Key from _split_input_schema
+
+    Returns:
+        Format template producing all rows, each with trailing newline
+    """
+    rows = []
+
+    for i, spec in enumerate(schema_key):
+        # Escape literal braces so they survive str.format
+        name = str(spec[0]).replace("{", "{{").replace("}", "}}")
+
+        if spec[1]:
+            # Optimized parameter: default||start||step||stop||Y
+            start, step, stop = (
+                v.replace("{", "{{").replace("}", "}}") for v in spec[2:]
+            )
+            rows.append(f"{name}={{{i}}}||{start}||{step}||{stop}" + _OPTIMIZED_SUFFIX)
+        else:
+            # Fixed parameter: value||0||0||0||N
+            rows.append(f"{name}={{{i}}}" + _FIXED_SUFFIX)
+
+    return "".join(rows)
+
+
+@lru_cache(maxsize=8)
+def _compute_date_strings(
+    today_ord: int,
+    backtest_years: int,
+    in_sample_years: int,
+) -> Tuple[str, str, str]:
+    """
+    Compute MT5 date strings (YYYY.MM.DD) for the optimization window.
+
+    Keyed on today's ordinal so INIs generated on the same day share one
+    computation and the cache rolls over at midnight.
+
+    Args:
+        today_ord: date.toordinal() of the end date
+        backtest_years: Total backtest period
+        in_sample_years: In-sample period for optimization
+
+    Returns:
+        Tuple of (start_date, end_date, forward_date) strings
+    """
+    end_date = date.fromordinal(today_ord)
+    start_date = date.fromordinal(today_ord - backtest_years * 365)
+    forward_split_date = date.fromordinal(today_ord - (backtest_years - in_sample_years) * 365)
+
+    return (
+        start_date.strftime("%Y.%m.%d"),
+        end_date.strftime("%Y.%m.%d"),
+        forward_split_date.strftime("%Y.%m.%d"),
+    )
+
+
+@lru_cache(maxsize=32)
 def _timeframe_to_minutes(timeframe: str) -> int:
     """
     Convert timeframe string to minutes for MT5.
@@ -297,26 +528,15 @@ def _timeframe_to_minutes(timeframe: str) -> int:
     """
     timeframe = timeframe.upper()
 
-    # Monthly (check first before M check)
-    if timeframe == "MN1":
-        return 43200
-
-    # Weekly
-    if timeframe == "W1":
-        return 10080
-
-    # Daily
-    if timeframe == "D1":
-        return 1440
-
-    # Hour timeframes
-    if timeframe.startswith("H"):
-        hours = int(timeframe[1:])
-        return hours * 60
+    minutes = _TF_MINUTES.get(timeframe)
+    if minutes is not None:
+        return minutes
 
-    # Minute timeframes
-    if timeframe.startswith("M"):
-        return int(timeframe[1:])
+    # Non-standard hour/minute timeframes (e.g., H2, M20)
+    match = _TF_GENERIC_PATTERN.match(timeframe)
+    if match:
+        value = int(match.group(2))
+        return value * 60 if match.group(1) == "H" else value
 
     # Default to 60 (H1) if unknown
     return 60
@@ -335,7 +555,7 @@ def validate_ini_generation(result: OptimizationINIResult) -> bool:
     if not result.success:
         return False
 
-    if not result.ini_path or not Path(result.ini_path).exists():
+    if not result.ini_path or not os.path.exists(result.ini_path):
         return False
 
     if result.param_count == 0:
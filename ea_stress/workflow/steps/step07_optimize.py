@@ -9,17 +9,24 @@ Per PRD Section 3, Step 7:
 - Max passes kept: 1,000
 """
 
+import mmap
 import os
+import time
+import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Optional
-from dataclasses import dataclass, field
-from datetime import datetime
+from dataclasses import dataclass
 
 from ea_stress.mt5.tester import MT5Tester, BacktestResult
 from ea_stress.config import OPTIMIZATION_TIMEOUT
 
 
-@dataclass
+# Streaming pass counter settings
+_MIN_XML_SIZE = 64  # Smaller files cannot hold a header row plus a pass
+_PASSES_SUFFIX = '.passes'  # Sidecar file caching the pass count
+
+
+@dataclass(slots=True)
 class OptimizationResult:
     """Result of optimization execution."""
     success: bool
@@ -70,7 +77,7 @@ def run_optimization(
     Returns:
         OptimizationResult with success status, XML path, and pass count
     """
-    start_time = datetime.now()
+    start_time = time.perf_counter()
 
     # Validate INI file exists
     if not ini_path.exists():
@@ -90,7 +97,7 @@ def run_optimization(
             timeout=timeout
         )
 
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
 
         if not result.success:
             return OptimizationResult(
@@ -122,7 +129,7 @@ def run_optimization(
         )
 
     except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
         return OptimizationResult(
             success=False,
             duration_seconds=duration,
@@ -130,37 +137,94 @@ def run_optimization(
         )
 
 
+def _local_name(tag: str) -> str:
+    """Strip an XML namespace ({uri}Row -> Row)."""
+    return tag.rsplit('}', 1)[-1]
+
+
 def _count_passes_in_xml(xml_path: Path) -> int:
     """Quick count of optimization passes in XML file.
 
     This is a lightweight check to see if we got any results.
     Full parsing happens in Step 8.
 
+    The file is memory-mapped and pull-parsed rather than read, so memory
+    stays flat even for large (1000-pass) reports, and stray ``<Row``
+    text outside the results table is not counted. The count is cached in a ``.passes``
+    sidecar next to the report, together with the report's size and mtime,
+    and reused while both still match.
+
     Args:
         xml_path: Path to MT5 XML report
 
     Returns:
         Number of passes found (rows in optimization table)
     """
+    # Skip the open entirely when MT5 hasn't written the report (or crashed
+    # before writing anything meaningful)
     try:
-        with open(xml_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        xml_stat = os.stat(xml_path)
+    except OSError:
+        return 0
 
-            # Look for <Row> tags in the XML
-            # Each optimization pass is a row in the table
-            # We exclude the header row
-            row_count = content.count('<Row')
+    if xml_stat.st_size < _MIN_XML_SIZE:
+        return 0
 
-            # First row is usually headers, so subtract 1
-            # But check if there are at least 2 rows (header + data)
-            if row_count >= 2:
-                return row_count - 1
-            else:
-                return 0
+    # Reuse a count persisted by an earlier call if the report still has the
+    # size and mtime it was counted at (mtime alone misses same-tick rewrites)
+    sidecar_path = Path(xml_path).with_suffix(_PASSES_SUFFIX)
+    try:
+        size, mtime_ns, cached_passes = map(int, sidecar_path.read_text(encoding='utf-8').split())
+        if size == xml_stat.st_size and mtime_ns == xml_stat.st_mtime_ns:
+            return cached_passes
+    except (OSError, ValueError):
+        pass
+
+    partial = False
+    try:
+        # Pull-parse a read-only memory map (no DOM, no copy of the report
+        # into Python) and count only the rows of the first results table,
+        # stopping as soon as that table closes
+        row_count = 0
+        with open(xml_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                in_table = False
+                try:
+                    for event, elem in ET.iterparse(mm, events=('start', 'end')):
+                        tag = _local_name(elem.tag)
+                        if tag == 'Table':
+                            if event == 'end':
+                                break
+                            in_table = True
+                        elif event == 'end' and tag == 'Row' and in_table:
+                            # Each optimization pass is a row in the table
+                            row_count += 1
+                            elem.clear()
+                except ET.ParseError:
+                    # Truncated or still being written: keep the rows read so far
+                    partial = True
+
+        # First row is usually headers, so subtract 1
+        # But check if there are at least 2 rows (header + data)
+        passes = row_count - 1 if row_count >= 2 else 0
 
     except Exception:
         return 0
 
+    # A partial count may still grow; only cache counts of complete reports
+    if partial:
+        return passes
+
+    # Persist the count for restarts/Step 8 (best effort)
+    try:
+        sidecar_path.write_text(
+            f"{xml_stat.st_size} {xml_stat.st_mtime_ns} {passes}", encoding='utf-8'
+        )
+    except OSError:
+        pass
+
+    return passes
+
 
 def validate_optimization(
     ini_path: Path,
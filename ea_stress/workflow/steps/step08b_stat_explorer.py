@@ -13,14 +13,21 @@ Per PRD Section 3, Step 8B:
 - Compute parameter sensitivity from Pass 1 (correlation of parameter values to result in top decile)
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import json
-from datetime import datetime, timezone
-
-from ...mt5.tester import MT5Tester, BacktestConfig
+from typing import Dict, List, Optional, Any, Tuple, NamedTuple, Union
+from bisect import bisect_right
+import heapq
+from functools import lru_cache
+from collections import deque
+from html.parser import HTMLParser
+from types import MappingProxyType
+from datetime import datetime
+
+from ...mt5.tester import MT5Tester, BacktestConfig, ForwardMode, OptimizationMode
 from ...mt5.parser import MT5XMLParser, BacktestMetrics
+from ...jsonio import write_json_atomic
+from ..dates import backtest_date_range, today_ordinal
 from ...config import (
     STAT_EXPLORER_TIMEZONE,
     STAT_MIN_TRADES_PER_BUCKET,
@@ -36,8 +43,25 @@ from ...config import (
     RUNS_DIR
 )
 
+# Trade duration bucket edges in minutes: <30, <120, <360, 360+
+_DURATION_EDGES = (30, 120, 360)
+
+# Zero-padded hour bucket keys "00".."23"
+_HOUR_KEYS = tuple(f"{hour:02d}" for hour in range(24))
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Dataclass field names for cls, resolved once per class."""
+    return tuple(f.name for f in fields(cls))
 
-@dataclass
+
+def _record_to_dict(record: Any) -> Dict[str, Any]:
+    """Shallow dict of a slotted dataclass record (no __dict__ to copy)."""
+    return {name: getattr(record, name) for name in _field_names(type(record))}
+
+
+@dataclass(slots=True)
 class SessionStats:
     """Statistics for a trading session."""
     trades: int = 0
@@ -46,7 +70,7 @@ class SessionStats:
     win_rate: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class BucketStats:
     """Statistics for a generic bucket (hour, DOW, duration, etc.)."""
     trades: int = 0
@@ -55,7 +79,7 @@ class BucketStats:
     win_rate: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ParameterSensitivity:
     """Parameter sensitivity analysis."""
     name: str
@@ -63,7 +87,7 @@ class ParameterSensitivity:
     top_decile_median: float
 
 
-@dataclass
+@dataclass(slots=True)
 class StatExplorerResult:
     """Result from Stat Explorer analysis."""
     success: bool
@@ -81,23 +105,47 @@ class StatExplorerResult:
     session_bias_flags: List[str] = field(default_factory=list)
     error_message: Optional[str] = None
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        result = asdict(self)
-        # Convert SessionStats and BucketStats to dicts
-        result['session_stats'] = {k: asdict(v) for k, v in self.session_stats.items()}
-        result['hour_stats'] = {k: asdict(v) for k, v in self.hour_stats.items()}
-        result['dow_stats'] = {k: asdict(v) for k, v in self.dow_stats.items()}
-        result['trade_duration_buckets'] = {k: asdict(v) for k, v in self.trade_duration_buckets.items()}
-        result['long_short'] = {k: asdict(v) for k, v in self.long_short.items()}
-        result['parameter_sensitivity'] = [asdict(p) for p in self.parameter_sensitivity]
+    def to_dict(self, minimal: bool = False) -> dict:
+        """
+        Convert to dictionary for JSON serialization.
+
+        Args:
+            minimal: Omit empty dict/list fields (e.g. when no trades were
+                extracted) to keep the LLM evidence pack small
+        """
+        # All nested records hold primitives only, so a shallow field copy
+        # matches asdict() without its recursive deepcopy
+        result = {
+            'success': self.success,
+            'stat_explorer_path': self.stat_explorer_path,
+            'backtest_xml_path': self.backtest_xml_path,
+            'trade_count': self.trade_count,
+            'fallback_to_step5': self.fallback_to_step5,
+            'session_stats': {k: _record_to_dict(v) for k, v in self.session_stats.items()},
+            'hour_stats': {k: _record_to_dict(v) for k, v in self.hour_stats.items()},
+            'dow_stats': {k: _record_to_dict(v) for k, v in self.dow_stats.items()},
+            'trade_duration_buckets': {k: _record_to_dict(v) for k, v in self.trade_duration_buckets.items()},
+            'long_short': {k: _record_to_dict(v) for k, v in self.long_short.items()},
+            'profit_concentration': dict(self.profit_concentration),
+            'parameter_sensitivity': [_record_to_dict(p) for p in self.parameter_sensitivity],
+            'session_bias_flags': list(self.session_bias_flags),
+            'error_message': self.error_message,
+        }
+
+        if minimal:
+            return {k: v for k, v in result.items()
+                    if not (isinstance(v, (dict, list)) and not v)}
+
         return result
 
 
+@lru_cache(maxsize=8)
 def _get_session_windows(timezone: str = "UTC") -> Dict[str, tuple]:
     """
     Get session time windows based on timezone.
 
+    Cached per timezone; callers must treat the returned dict as read-only.
+
     Returns:
         Dict mapping session name to (start_hour, end_hour) in 24h format
     """
@@ -109,157 +157,390 @@ def _get_session_windows(timezone: str = "UTC") -> Dict[str, tuple]:
     }
 
 
+@lru_cache(maxsize=8)
+def _session_lookup(timezone: str = "UTC") -> Tuple[Tuple[str, ...], Tuple[int, ...]]:
+    """
+    Precompute the hour -> session index table for a timezone.
+
+    Overlapping hours go to the first matching window (London before NewYork),
+    hours outside every window map to -1.
+
+    Returns:
+        Tuple of (session_names, lut) where lut has 24 entries
+    """
+    sessions = _get_session_windows(timezone)
+    names = tuple(sessions)
+    lut = [-1] * 24
+
+    for hour in range(24):
+        for idx, (start, end) in enumerate(sessions.values()):
+            if start <= hour < end:
+                lut[hour] = idx
+                break
+
+    return names, tuple(lut)
+
+
+class _TableRowCollector(HTMLParser):
+    """Collect the text of every table row as a list of cell strings."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows: List[List[str]] = []
+        self._row: Optional[List[str]] = None
+        self._cell: Optional[List[str]] = None
+
+    def _close_cell(self) -> None:
+        if self._cell is not None and self._row is not None:
+            self._row.append(''.join(self._cell).strip())
+        self._cell = None
+
+    def _close_row(self) -> None:
+        self._close_cell()
+        if self._row is not None:
+            self.rows.append(self._row)
+        self._row = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'tr':
+            self._close_row()
+            self._row = []
+        elif tag in ('td', 'th') and self._row is not None:
+            self._close_cell()
+            self._cell = []
+
+    def handle_endtag(self, tag):
+        if tag in ('td', 'th'):
+            self._close_cell()
+        elif tag in ('tr', 'table'):
+            self._close_row()
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+
+def _parse_report_number(value: str) -> float:
+    """Parse an MT5 report number ("1 234.56", "-12.00"); blank/invalid -> 0.0."""
+    try:
+        return float(value.replace(' ', '').replace('\xa0', ''))
+    except ValueError:
+        return 0.0
+
+
 def _parse_trade_history_from_html(html_path: Path) -> List[Dict[str, Any]]:
     """
     Parse trade history from MT5 HTML report.
 
-    Note: This is a simplified parser. Full implementation would use BeautifulSoup
-    or similar, but we're keeping stdlib-only for core functionality.
+    Reads the "Deals" table (stdlib html.parser, keeping core stdlib-only) and
+    pairs each "in" deal with the next "out" deal first-in-first-out. Hour,
+    day of week and direction come from the entry deal; profit is the Profit
+    column of the closing deal.
 
     Returns:
-        List of trade dicts with keys: time, type, profit, duration_minutes
+        List of trade dicts with keys: time, hour, dow, type, profit, duration_minutes
     """
-    # TODO: Implement HTML parsing to extract trade list
-    # For now, return empty list (will trigger fallback to Step 5)
-    return []
+    try:
+        raw = Path(html_path).read_bytes()
+    except OSError:
+        return []
 
+    # MT5 writes HTML reports as UTF-16 LE with a BOM
+    if raw[:2] in (b'\xff\xfe', b'\xfe\xff'):
+        text = raw.decode('utf-16', errors='replace')
+    else:
+        text = raw.decode('utf-8', errors='replace')
+
+    collector = _TableRowCollector()
+    collector.feed(text)
+    collector.close()
+    rows = collector.rows
+
+    # Deals header is the only table header starting with a bare "Time" column
+    header_idx = next(
+        (i for i, row in enumerate(rows)
+         if row and row[0] == 'Time' and 'Direction' in row and 'Profit' in row),
+        None,
+    )
+    if header_idx is None:
+        return []
 
-def _compute_session_stats(trades: List[Dict[str, Any]], timezone: str) -> Dict[str, SessionStats]:
-    """Compute statistics by trading session."""
-    sessions = _get_session_windows(timezone)
-    stats = {name: SessionStats() for name in sessions}
-
-    for trade in trades:
-        trade_hour = trade.get('hour', 0)
-        profit = trade.get('profit', 0.0)
-        is_win = profit > 0
-
-        for session_name, (start, end) in sessions.items():
-            if start <= trade_hour < end:
-                stats[session_name].trades += 1
-                stats[session_name].profit += profit
-                if is_win:
-                    stats[session_name].win_rate += 1
+    header = rows[header_idx]
+    time_col = 0
+    type_col = header.index('Type')
+    direction_col = header.index('Direction')
+    profit_col = header.index('Profit')
+    min_cells = max(type_col, direction_col, profit_col) + 1
+
+    trades = []
+    open_entries = deque()
+
+    for row in rows[header_idx + 1:]:
+        if len(row) < min_cells:
+            # A titled single-cell row ("Orders", "Results"...) starts the
+            # next section; spacer and colspan rows inside the table are skipped
+            if row and row[0] and not any(row[1:]):
                 break
+            continue
 
-    # Calculate derived metrics
-    for session_name, stat in stats.items():
-        if stat.trades > 0:
-            stat.win_rate = (stat.win_rate / stat.trades) * 100
-            # PF calculation would require wins/losses separation
-            # Simplified: assume profit > 0 means PF > 1
-            stat.pf = 1.0 if stat.profit > 0 else 0.0
+        direction = row[direction_col].lower()
+        if direction not in ('in', 'out', 'in/out', 'out by'):
+            continue  # balance/credit rows, totals
 
-    return stats
+        try:
+            deal_time = datetime.strptime(row[time_col], '%Y.%m.%d %H:%M:%S')
+        except ValueError:
+            continue
+
+        deal_type = row[type_col].lower()
+        if direction == 'in':
+            open_entries.append((deal_time, deal_type))
+            continue
 
+        if open_entries:
+            entry_time, entry_type = open_entries.popleft()
+        else:
+            # Unmatched close: position direction is opposite of the closing deal
+            entry_time, entry_type = deal_time, 'sell' if deal_type == 'buy' else 'buy'
 
-def _compute_hour_stats(trades: List[Dict[str, Any]]) -> Dict[str, BucketStats]:
-    """Compute statistics by hour of day."""
-    stats = {}
+        trades.append({
+            'time': entry_time,
+            'hour': entry_time.hour,
+            'dow': entry_time.weekday(),
+            'type': 'short' if entry_type == 'sell' else 'long',
+            'profit': _parse_report_number(row[profit_col]),
+            'duration_minutes': int((deal_time - entry_time).total_seconds() // 60),
+        })
 
-    for trade in trades:
-        hour_key = f"{trade.get('hour', 0):02d}"
-        if hour_key not in stats:
-            stats[hour_key] = BucketStats()
+        if direction == 'in/out':
+            # Reversal closes the old position and opens the opposite one
+            open_entries.append((deal_time, deal_type))
 
-        stats[hour_key].trades += 1
-        profit = trade.get('profit', 0.0)
-        stats[hour_key].profit += profit
-        if profit > 0:
-            stats[hour_key].win_rate += 1
+    return trades
 
-    # Calculate win rates
-    for stat in stats.values():
-        if stat.trades > 0:
-            stat.win_rate = (stat.win_rate / stat.trades) * 100
 
-    return stats
+class TradeArrays(NamedTuple):
+    """Per-field parallel lists for a trade list (structure of arrays)."""
+    hours: List[int]
+    dows: List[int]
+    durations: List[int]
+    profits: List[float]
+    is_short: List[bool]
 
 
-def _compute_dow_stats(trades: List[Dict[str, Any]]) -> Dict[str, BucketStats]:
-    """Compute statistics by day of week."""
-    dow_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    stats = {name: BucketStats() for name in dow_names}
+def _trades_to_soa(trades: List[Dict[str, Any]]) -> TradeArrays:
+    """
+    Walk the trade list once into parallel per-field lists.
+
+    The bucket helpers below then aggregate by integer index instead of
+    re-reading and branching on each trade dict.
+    """
+    n = len(trades)
+    hours = [0] * n
+    dows = [0] * n
+    durations = [0] * n
+    profits = [0.0] * n
+    is_short = [False] * n
+
+    for i, trade in enumerate(trades):
+        hours[i] = trade.get('hour', 0)
+        dows[i] = trade.get('dow', 0)  # 0=Monday
+        durations[i] = trade.get('duration_minutes', 0)
+        profits[i] = trade.get('profit', 0.0)
+        # "short"/"sell" in any case; first character is enough
+        is_short[i] = trade.get('type', 'long')[:1] in ('s', 'S')
+
+    return TradeArrays(hours, dows, durations, profits, is_short)
+
+
+def _as_soa(trades: Union[List[Dict[str, Any]], TradeArrays]) -> TradeArrays:
+    """Accept either a trade dict list or prebuilt TradeArrays."""
+    if isinstance(trades, TradeArrays):
+        return trades
+    return _trades_to_soa(trades)
+
+
+def _bin_by_index(
+    indices: List[int],
+    profits: List[float],
+    size: int,
+) -> Tuple[List[int], List[float], List[int]]:
+    """
+    Accumulate trade count, profit and win count per bucket index.
 
-    for trade in trades:
-        dow = trade.get('dow', 0)  # 0=Monday
-        if 0 <= dow < 7:
-            dow_name = dow_names[dow]
-            stats[dow_name].trades += 1
-            stats[dow_name].profit += trade.get('profit', 0.0)
+    Indices outside [0, size) are ignored.
+
+    Returns:
+        Tuple of (counts, profit_sums, wins), each of length size
+    """
+    counts = [0] * size
+    profit_sums = [0.0] * size
+    wins = [0] * size
+
+    for idx, profit in zip(indices, profits):
+        if 0 <= idx < size:
+            counts[idx] += 1
+            profit_sums[idx] += profit
+            if profit > 0:
+                wins[idx] += 1
+
+    return counts, profit_sums, wins
+
+
+def _compute_session_stats(trades: Union[List[Dict[str, Any]], TradeArrays], timezone: str) -> Dict[str, SessionStats]:
+    """Compute statistics by trading session."""
+    session_names, lut = _session_lookup(timezone)
+    n_sessions = len(session_names)
+
+    soa = _as_soa(trades)
+    counts, profit_sums, wins = _bin_by_index(soa.hours, soa.profits, 24)
+
+    # Fold hour buckets into sessions through the lookup table; win counts
+    # stay integers until the final ratio
+    session_trades = [0] * n_sessions
+    session_profit = [0.0] * n_sessions
+    session_wins = [0] * n_sessions
+    for hour, session_idx in enumerate(lut):
+        if session_idx >= 0:
+            session_trades[session_idx] += counts[hour]
+            session_profit[session_idx] += profit_sums[hour]
+            session_wins[session_idx] += wins[hour]
+
+    stats = {}
+    for idx, session_name in enumerate(session_names):
+        n_trades = session_trades[idx]
+        profit = session_profit[idx]
+        stats[session_name] = SessionStats(
+            trades=n_trades,
+            profit=profit,
+            # PF calculation would require wins/losses separation
+            # Simplified: assume profit > 0 means PF > 1
+            pf=1.0 if profit > 0 else 0.0,
+            win_rate=(session_wins[idx] / n_trades) * 100 if n_trades else 0.0,
+        )
 
     return stats
 
 
-def _compute_duration_buckets(trades: List[Dict[str, Any]]) -> Dict[str, BucketStats]:
-    """Compute statistics by trade duration."""
-    buckets = {
-        "0-30m": BucketStats(),
-        "30-120m": BucketStats(),
-        "120-360m": BucketStats(),
-        "360m+": BucketStats()
+def _compute_hour_stats(trades: Union[List[Dict[str, Any]], TradeArrays]) -> Dict[str, BucketStats]:
+    """Compute statistics by hour of day."""
+    soa = _as_soa(trades)
+    counts, profit_sums, wins = _bin_by_index(soa.hours, soa.profits, 24)
+
+    # All 24 buckets are preallocated; only hours that saw trades are reported
+    return {
+        key: BucketStats(
+            trades=counts[hour],
+            profit=profit_sums[hour],
+            win_rate=(wins[hour] / counts[hour]) * 100,
+        )
+        for hour, key in enumerate(_HOUR_KEYS)
+        if counts[hour]
     }
 
-    for trade in trades:
-        duration = trade.get('duration_minutes', 0)
-        profit = trade.get('profit', 0.0)
 
-        if duration < 30:
-            bucket = "0-30m"
-        elif duration < 120:
-            bucket = "30-120m"
-        elif duration < 360:
-            bucket = "120-360m"
-        else:
-            bucket = "360m+"
+def _compute_dow_stats(trades: Union[List[Dict[str, Any]], TradeArrays]) -> Dict[str, BucketStats]:
+    """Compute statistics by day of week."""
+    dow_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+    soa = _as_soa(trades)
+    counts, profit_sums, _ = _bin_by_index(soa.dows, soa.profits, 7)
 
-        buckets[bucket].trades += 1
-        buckets[bucket].profit += profit
+    return {
+        name: BucketStats(trades=counts[i], profit=profit_sums[i])
+        for i, name in enumerate(dow_names)
+    }
 
-    return buckets
 
+def _compute_duration_buckets(trades: Union[List[Dict[str, Any]], TradeArrays]) -> Dict[str, BucketStats]:
+    """Compute statistics by trade duration."""
+    bucket_names = ["0-30m", "30-120m", "120-360m", "360m+"]
+    soa = _as_soa(trades)
+    # Bucket edges at 30/120/360 minutes (left-closed, like np.digitize)
+    indices = [bisect_right(_DURATION_EDGES, d) for d in soa.durations]
+    counts, profit_sums, _ = _bin_by_index(indices, soa.profits, len(bucket_names))
 
-def _compute_long_short_stats(trades: List[Dict[str, Any]]) -> Dict[str, BucketStats]:
-    """Compute statistics for long vs short trades."""
-    stats = {
-        "long": BucketStats(),
-        "short": BucketStats()
+    return {
+        name: BucketStats(trades=counts[i], profit=profit_sums[i])
+        for i, name in enumerate(bucket_names)
     }
 
-    for trade in trades:
-        trade_type = trade.get('type', 'long').lower()
-        if 'short' in trade_type or 'sell' in trade_type:
-            key = "short"
-        else:
-            key = "long"
 
-        stats[key].trades += 1
-        stats[key].profit += trade.get('profit', 0.0)
+def _compute_long_short_stats(trades: Union[List[Dict[str, Any]], TradeArrays]) -> Dict[str, BucketStats]:
+    """Compute statistics for long vs short trades."""
+    soa = _as_soa(trades)
+    # bools index directly as 0=long, 1=short
+    counts, profit_sums, _ = _bin_by_index(soa.is_short, soa.profits, 2)
 
-    return stats
+    return {
+        "long": BucketStats(trades=counts[0], profit=profit_sums[0]),
+        "short": BucketStats(trades=counts[1], profit=profit_sums[1]),
+    }
 
 
-def _compute_profit_concentration(trades: List[Dict[str, Any]]) -> Dict[str, float]:
+def _compute_profit_concentration(trades: Union[List[Dict[str, Any]], TradeArrays]) -> Dict[str, float]:
     """Compute profit concentration (top X% trades vs total profit)."""
-    if not trades:
+    profits = _as_soa(trades).profits
+    if not profits:
         return {}
 
-    # Sort trades by profit descending
-    sorted_trades = sorted(trades, key=lambda t: t.get('profit', 0.0), reverse=True)
-    total_profit = sum(t.get('profit', 0.0) for t in trades)
+    total_profit = sum(profits)
 
     if total_profit <= 0:
         return {"top_20pct_trade_profit_share": 0.0}
 
-    # Calculate top 20% profit share
-    top_20_count = max(1, int(len(trades) * 0.2))
-    top_20_profit = sum(t.get('profit', 0.0) for t in sorted_trades[:top_20_count])
+    # Calculate top 20% profit share (partial selection, no full sort)
+    top_20_count = max(1, int(len(profits) * 0.2))
+    top_20_profit = sum(heapq.nlargest(top_20_count, profits))
 
     return {
-        "top_20pct_trade_profit_share": top_20_profit / total_profit if total_profit > 0 else 0.0
+        "top_20pct_trade_profit_share": top_20_profit / total_profit
     }
 
 
+def _pearson_and_median(
+    values: List[float],
+    results: List[float],
+) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Pearson correlation of values to results plus the (upper) median of values.
+
+    Single fused pass over both series accumulating the five sums needed for
+    mean, covariance and both variances. Sums are taken relative to the first
+    sample so constant series come out with exactly zero variance.
+
+    The median is only computed for non-degenerate series, by sorting values
+    in place once the correlation pass is done (no copy of the list).
+
+    Returns:
+        Tuple of (corr, median); both None if either series is constant
+    """
+    n = len(values)
+    v0 = values[0]
+    r0 = results[0]
+    sum_v = sum_r = sum_vv = sum_rr = sum_vr = 0.0
+
+    for v, r in zip(values, results):
+        dv = v - v0
+        dr = r - r0
+        sum_v += dv
+        sum_r += dr
+        sum_vv += dv * dv
+        sum_rr += dr * dr
+        sum_vr += dv * dr
+
+    mean_v = sum_v / n
+    mean_r = sum_r / n
+    var_v = sum_vv / n - mean_v * mean_v
+    var_r = sum_rr / n - mean_r * mean_r
+
+    if var_v <= 0 or var_r <= 0:
+        return None, None
+
+    cov = sum_vr / n - mean_v * mean_r
+    values.sort()
+    return cov / (var_v * var_r) ** 0.5, values[n // 2]
+
+
 def _compute_parameter_sensitivity(pass1_results: List[dict]) -> List[ParameterSensitivity]:
     """
     Compute parameter sensitivity from Pass 1 results.
@@ -269,12 +550,10 @@ def _compute_parameter_sensitivity(pass1_results: List[dict]) -> List[ParameterS
     if not pass1_results or len(pass1_results) < 10:
         return []
 
-    # Sort by result (OnTester score) descending
-    sorted_passes = sorted(pass1_results, key=lambda p: p.get('result', 0), reverse=True)
-
-    # Get top decile (top 10%)
-    top_decile_count = max(1, int(len(sorted_passes) * 0.1))
-    top_decile = sorted_passes[:top_decile_count]
+    # Get top decile (top 10%) by result (OnTester score), descending.
+    # nlargest matches sorted(..., reverse=True)[:k] without a full sort.
+    top_decile_count = max(1, int(len(pass1_results) * 0.1))
+    top_decile = heapq.nlargest(top_decile_count, pass1_results, key=lambda p: p.get('result', 0))
 
     # Extract parameter names from first pass
     if not top_decile or 'params' not in top_decile[0]:
@@ -283,38 +562,37 @@ def _compute_parameter_sensitivity(pass1_results: List[dict]) -> List[ParameterS
     param_names = [k for k in top_decile[0]['params'].keys()
                    if k not in ['Pass', 'Back Result', 'Forward Result']]
 
-    sensitivities = []
+    # Tied results (common when OnTester returns the same score) have zero
+    # variance, so no parameter can correlate - skip the per-parameter work
+    decile_results = [p.get('result', 0) for p in top_decile]
+    if min(decile_results) == max(decile_results):
+        return []
 
-    for param_name in param_names:
-        # Get parameter values and results from top decile
-        values = []
-        results = []
+    # Fill per-parameter (values, results) columns in one pass over the decile
+    columns = {name: ([], []) for name in param_names}
 
-        for p in top_decile:
-            if 'params' in p and param_name in p['params']:
+    for p in top_decile:
+        params = p.get('params')
+        if not params:
+            continue
+        result = p.get('result', 0)
+        for param_name, (values, results) in columns.items():
+            if param_name in params:
                 try:
-                    val = float(p['params'][param_name])
-                    values.append(val)
-                    results.append(p.get('result', 0))
+                    values.append(float(params[param_name]))
                 except (ValueError, TypeError):
                     continue
+                results.append(result)
+
+    sensitivities = []
 
+    for param_name, (values, results) in columns.items():
         if len(values) < 3:
             continue
 
-        # Calculate simple correlation (Pearson's r)
-        # Simplified: using covariance / (std_x * std_y)
-        mean_val = sum(values) / len(values)
-        mean_res = sum(results) / len(results)
-
-        cov = sum((values[i] - mean_val) * (results[i] - mean_res) for i in range(len(values))) / len(values)
-        std_val = (sum((v - mean_val) ** 2 for v in values) / len(values)) ** 0.5
-        std_res = (sum((r - mean_res) ** 2 for r in results) / len(results)) ** 0.5
-
-        if std_val > 0 and std_res > 0:
-            corr = cov / (std_val * std_res)
-            median_val = sorted(values)[len(values) // 2]
+        corr, median_val = _pearson_and_median(values, results)
 
+        if corr is not None:
             sensitivities.append(ParameterSensitivity(
                 name=param_name,
                 corr_to_result=round(corr, 3),
@@ -347,6 +625,22 @@ def _identify_session_bias(session_stats: Dict[str, SessionStats],
     return flags
 
 
+def _compute_backtest_window(
+    backtest_years: int = BACKTEST_YEARS,
+    in_sample_years: int = IN_SAMPLE_YEARS,
+) -> Tuple[datetime, datetime, datetime]:
+    """
+    Backtest window ending today, identical to Step 5's validation window.
+
+    Returns:
+        Tuple of (start_date, end_date, forward_date)
+    """
+    start_date, end_date, forward_date, _, _, _ = backtest_date_range(
+        today_ordinal(), backtest_years, backtest_years - in_sample_years
+    )
+    return start_date, end_date, forward_date
+
+
 def run_stat_explorer(
     pass1_results: List[dict],
     top_pass_params: dict,
@@ -383,12 +677,7 @@ def run_stat_explorer(
         analysis_dir.mkdir(parents=True, exist_ok=True)
 
         # Compute dates (same as Step 5: 4 years ending today, 3 in-sample, 1 forward)
-        end_date = datetime.now(timezone=timezone.utc)
-        start_date = end_date.replace(year=end_date.year - BACKTEST_YEARS)
-        forward_date = end_date.replace(year=end_date.year - (BACKTEST_YEARS - IN_SAMPLE_YEARS))
-
-        # Generate report name per PRD Section 8
-        report_name = f"S8B_stat_{symbol}_{timeframe}_{workflow_id[:8]}"
+        start_date, end_date, forward_date = _compute_backtest_window()
 
         # Run backtest for top Pass 1 candidate
         config = BacktestConfig(
@@ -397,25 +686,26 @@ def run_stat_explorer(
             period=timeframe,
             from_date=start_date,
             to_date=end_date,
-            forward_mode=2,  # Date-based
+            forward_mode=ForwardMode.DATE_BASED,
             forward_date=forward_date,
             model=DATA_MODEL,
-            execution_mode=EXECUTION_LATENCY_MS,
-            report=report_name,
+            execution_latency_ms=EXECUTION_LATENCY_MS,
             deposit=DEPOSIT,
             currency=CURRENCY,
             leverage=LEVERAGE,
-            optimization=0,  # No optimization, just backtest
-            input_params=top_pass_params
+            optimization=OptimizationMode.DISABLED,  # No optimization, just backtest
+            # Read-only view: the tester only reads inputs, so no defensive copy
+            inputs=MappingProxyType(top_pass_params)
         )
 
         tester = MT5Tester(mt5_terminal_path, mt5_data_path)
         backtest_result = tester.run_backtest(config, timeout=3600)  # 1 hour timeout
 
-        if not backtest_result.success or not backtest_result.xml_report:
+        xml_path = backtest_result.xml_path
+        if not backtest_result.success or not xml_path:
             # Fallback to Step 5 trade list
             if step5_xml_path and step5_xml_path.exists():
-                backtest_result.xml_report = step5_xml_path
+                xml_path = step5_xml_path
                 fallback = True
             else:
                 return StatExplorerResult(
@@ -425,12 +715,11 @@ def run_stat_explorer(
         else:
             fallback = False
 
-        # Parse trade history
-        # Note: For now, we'll use placeholder logic since HTML parsing requires BeautifulSoup
-        # In production, this would parse the HTML report to extract individual trades
-        trades = _parse_trade_history_from_html(backtest_result.html_report) if backtest_result.html_report else []
+        # Parse trade history from the HTML report's Deals table
+        report_path = backtest_result.report_path
+        trades = _parse_trade_history_from_html(report_path) if report_path else []
 
-        # If no trades extracted (parsing not implemented), use empty analysis
+        # If no trades extracted (no HTML report or no closed deals), use empty analysis
         if not trades:
             # Still compute parameter sensitivity from pass1_results
             param_sensitivity = _compute_parameter_sensitivity(pass1_results)
@@ -438,36 +727,36 @@ def run_stat_explorer(
             result = StatExplorerResult(
                 success=True,
                 stat_explorer_path=str(analysis_dir / "stat_explorer.json"),
-                backtest_xml_path=str(backtest_result.xml_report) if backtest_result.xml_report else None,
+                backtest_xml_path=str(xml_path) if xml_path else None,
                 trade_count=0,
                 fallback_to_step5=fallback,
                 parameter_sensitivity=param_sensitivity,
-                error_message="Trade history parsing not yet implemented (requires HTML parsing)"
+                error_message="No trades extracted from backtest HTML report"
             )
 
             # Write stat_explorer.json
-            with open(result.stat_explorer_path, 'w') as f:
-                json.dump(result.to_dict(), f, indent=2)
+            write_json_atomic(result.stat_explorer_path, result.to_dict(minimal=True))
 
             return result
 
-        # Compute all statistics
-        session_stats = _compute_session_stats(trades, timezone)
-        hour_stats = _compute_hour_stats(trades)
-        dow_stats = _compute_dow_stats(trades)
-        duration_buckets = _compute_duration_buckets(trades)
-        long_short = _compute_long_short_stats(trades)
-        profit_concentration = _compute_profit_concentration(trades)
+        # Materialize the trade arrays once and share them across all statistics
+        soa = _trades_to_soa(trades)
+        session_stats = _compute_session_stats(soa, timezone)
+        hour_stats = _compute_hour_stats(soa)
+        dow_stats = _compute_dow_stats(soa)
+        duration_buckets = _compute_duration_buckets(soa)
+        long_short = _compute_long_short_stats(soa)
+        profit_concentration = _compute_profit_concentration(soa)
         param_sensitivity = _compute_parameter_sensitivity(pass1_results)
 
         # Calculate total profit for bias detection
-        total_profit = sum(t.get('profit', 0.0) for t in trades)
+        total_profit = sum(soa.profits)
         session_bias_flags = _identify_session_bias(session_stats, total_profit)
 
         result = StatExplorerResult(
             success=True,
             stat_explorer_path=str(analysis_dir / "stat_explorer.json"),
-            backtest_xml_path=str(backtest_result.xml_report) if backtest_result.xml_report else None,
+            backtest_xml_path=str(xml_path) if xml_path else None,
             trade_count=len(trades),
             fallback_to_step5=fallback,
             session_stats=session_stats,
@@ -481,8 +770,7 @@ def run_stat_explorer(
         )
 
         # Write stat_explorer.json
-        with open(result.stat_explorer_path, 'w') as f:
-            json.dump(result.to_dict(), f, indent=2)
+        write_json_atomic(result.stat_explorer_path, result.to_dict())
 
         return result
 
@@ -13,22 +13,105 @@ Per PRD Section 3, Step 8C:
 - LLM patches must NOT modify injected OnTester or safety guard code
 """
 
-from dataclasses import dataclass, field, asdict
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Union
+import copy
+import hashlib
 import json
+import os
+import threading
 
 
 from ...config import (
     RUNS_DIR,
     LLM_IMPROVEMENT_ENABLED,
-    LLM_REVIEW_REQUIRED,
     LLM_ALLOW_NEW_LOGIC,
     STAT_MIN_SESSION_PROFIT_SHARE
 )
+from ...jsonio import read_json, write_json_atomic
+
+# Response schema per PRD Section 6.7. Sent to the LLM in the request and
+# used to derive the validator's field lists once at import.
+_RESPONSE_SCHEMA = {
+    "type": "object",
+    "required": ["param_actions", "range_refinements", "expected_impact", "risks", "review_required"],
+    "properties": {
+        "param_actions": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["name", "action", "rationale", "evidence"],
+                "properties": {
+                    "name": {"type": "string"},
+                    "action": {"type": "string", "enum": ["narrow_range", "fix", "remove"]},
+                    "rationale": {"type": "string"},
+                    "evidence": {"type": "array", "items": {"type": "string"}}
+                }
+            }
+        },
+        "range_refinements": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["name", "start", "step", "stop"],
+                "properties": {
+                    "name": {"type": "string"},
+                    "start": {"type": "number"},
+                    "step": {"type": "number"},
+                    "stop": {"type": "number"},
+                    "reason": {"type": "string"}
+                }
+            }
+        },
+        "ea_patch": {
+            "type": ["object", "null"],
+            "properties": {
+                "description": {"type": "string"},
+                "diff": {"type": "string"}
+            }
+        },
+        "expected_impact": {"type": "array", "items": {"type": "string"}},
+        "risks": {"type": "array", "items": {"type": "string"}},
+        "review_required": {"type": "boolean"}
+    }
+}
+
+_RESPONSE_PROPERTIES = _RESPONSE_SCHEMA["properties"]
+_REQUIRED_FIELDS = tuple(_RESPONSE_SCHEMA["required"])
+_PARAM_ACTION_REQUIRED = tuple(_RESPONSE_PROPERTIES["param_actions"]["items"]["required"])
+_RANGE_REQUIRED = tuple(_RESPONSE_PROPERTIES["range_refinements"]["items"]["required"])
+_RANGE_NUMERIC = tuple(
+    name for name in _RANGE_REQUIRED
+    if _RESPONSE_PROPERTIES["range_refinements"]["items"]["properties"][name]["type"] == "number"
+)
+
+# Frozen key sets so required-field checks are one C-level set difference
+_REQ_TOP = frozenset(_REQUIRED_FIELDS)
+_REQ_ACTION = frozenset(_PARAM_ACTION_REQUIRED)
+_REQ_REF = frozenset(_RANGE_REQUIRED)
+
+
+def _in_schema_order(missing: frozenset, order: tuple) -> List[str]:
+    """Return missing keys in schema order for stable error messages."""
+    return [name for name in order if name in missing]
+
+
+# Static request rules; the session sizing threshold is injected between
+# them per request so config overrides are honoured
+_EVIDENCE_RULES = (
+    "Every recommendation MUST cite evidence from stat_explorer or pass1_results",
+    "If evidence is weak, return empty lists for that area",
+    "New logic is allowed but MUST be tied to observed patterns (e.g., session bias)",
+)
+_PATCH_RULES = (
+    "Patches MUST NOT modify injected OnTester or safety guard code",
+    "Look for EA_STRESS_ONTESTER_INJECTED and EA_STRESS_SAFETY_INJECTED markers",
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParamAction:
     """Action for a parameter."""
     name: str
@@ -37,7 +120,7 @@ class ParamAction:
     evidence: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class RangeRefinement:
     """Refined optimization range for a parameter."""
     name: str
@@ -47,14 +130,14 @@ class RangeRefinement:
     reason: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class EAPatch:
     """EA code patch proposal."""
     description: str
     diff: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMProposalResult:
     """Result from LLM improvement proposal step."""
     success: bool
@@ -75,20 +158,42 @@ class LLMProposalResult:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        result = {
+        return {
             "success": self.success,
             "status": self.status,
             "request_path": self.request_path,
             "response_path": self.response_path,
-            "param_actions": [asdict(a) for a in self.param_actions],
-            "range_refinements": [asdict(r) for r in self.range_refinements],
-            "ea_patch": asdict(self.ea_patch) if self.ea_patch else None,
-            "expected_impact": self.expected_impact,
-            "risks": self.risks,
+            **_proposal_payload(self),
             "review_required": self.review_required,
             "error_message": self.error_message
         }
-        return result
+
+
+def _proposal_payload(proposal: LLMProposalResult) -> dict:
+    """
+    Proposal content shared by to_dict and the Step 8D review package.
+
+    Returns:
+        Dict with param_actions, range_refinements, ea_patch,
+        expected_impact and risks
+    """
+    ea_patch = proposal.ea_patch
+    return {
+        "param_actions": [
+            {"name": a.name, "action": a.action, "rationale": a.rationale, "evidence": a.evidence}
+            for a in proposal.param_actions
+        ],
+        "range_refinements": [
+            {"name": r.name, "start": r.start, "step": r.step, "stop": r.stop, "reason": r.reason}
+            for r in proposal.range_refinements
+        ],
+        "ea_patch": (
+            {"description": ea_patch.description, "diff": ea_patch.diff}
+            if ea_patch else None
+        ),
+        "expected_impact": proposal.expected_impact,
+        "risks": proposal.risks
+    }
 
 
 def _validate_response_schema(response: dict) -> tuple[bool, str]:
@@ -98,11 +203,12 @@ def _validate_response_schema(response: dict) -> tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    required_fields = ["param_actions", "range_refinements", "expected_impact", "risks", "review_required"]
+    if not isinstance(response, dict):
+        return False, "Response must be a JSON object"
 
-    for field in required_fields:
-        if field not in response:
-            return False, f"Missing required field: {field}"
+    missing = _REQ_TOP - response.keys()
+    if missing:
+        return False, f"Missing required field: {_in_schema_order(missing, _REQUIRED_FIELDS)[0]}"
 
     # Validate param_actions
     if not isinstance(response["param_actions"], list):
@@ -111,9 +217,10 @@ def _validate_response_schema(response: dict) -> tuple[bool, str]:
     for i, action in enumerate(response["param_actions"]):
         if not isinstance(action, dict):
             return False, f"param_actions[{i}] must be an object"
-        for req in ["name", "action", "rationale", "evidence"]:
-            if req not in action:
-                return False, f"param_actions[{i}] missing required field: {req}"
+        missing = _REQ_ACTION - action.keys()
+        if missing:
+            names = ", ".join(_in_schema_order(missing, _PARAM_ACTION_REQUIRED))
+            return False, f"param_actions[{i}] missing required fields: {names}"
         if not isinstance(action["evidence"], list):
             return False, f"param_actions[{i}].evidence must be a list"
 
@@ -124,13 +231,14 @@ def _validate_response_schema(response: dict) -> tuple[bool, str]:
     for i, ref in enumerate(response["range_refinements"]):
         if not isinstance(ref, dict):
             return False, f"range_refinements[{i}] must be an object"
-        for req in ["name", "start", "step", "stop"]:
-            if req not in ref:
-                return False, f"range_refinements[{i}] missing required field: {req}"
+        missing = _REQ_REF - ref.keys()
+        if missing:
+            names = ", ".join(_in_schema_order(missing, _RANGE_REQUIRED))
+            return False, f"range_refinements[{i}] missing required fields: {names}"
         # Validate numeric types
-        for num_field in ["start", "step", "stop"]:
-            if not isinstance(ref[num_field], (int, float)):
-                return False, f"range_refinements[{i}].{num_field} must be a number"
+        if not all(isinstance(ref[f], (int, float)) for f in _RANGE_NUMERIC):
+            num_field = next(f for f in _RANGE_NUMERIC if not isinstance(ref[f], (int, float)))
+            return False, f"range_refinements[{i}].{num_field} must be a number"
 
     # Validate ea_patch (optional)
     if "ea_patch" in response and response["ea_patch"] is not None:
@@ -153,22 +261,63 @@ def _validate_response_schema(response: dict) -> tuple[bool, str]:
     return True, ""
 
 
+# Parsed proposals keyed by response path, stored with the response's
+# (st_mtime_ns, st_size) so workflow polls skip re-parsing an unchanged
+# step8c_response.json (size catches rewrites within one mtime tick).
+# Bounded LRU; entries are private copies, callers always get a fresh copy.
+_PROPOSAL_CACHE_SIZE = 32
+_PROPOSAL_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], LLMProposalResult]]" = OrderedDict()
+_PROPOSAL_CACHE_LOCK = threading.Lock()
+
+
+def _cached_proposal(key: str, stamp: Tuple[int, int]) -> Optional["LLMProposalResult"]:
+    """Return a copy of the cached proposal for key if its (mtime_ns, size) still match."""
+    with _PROPOSAL_CACHE_LOCK:
+        cached = _PROPOSAL_CACHE.get(key)
+        if cached is None or cached[0] != stamp:
+            return None
+        _PROPOSAL_CACHE.move_to_end(key)
+        result = cached[1]
+    return copy.deepcopy(result)
+
+
+def _cache_proposal(key: str, stamp: Tuple[int, int], result: "LLMProposalResult") -> None:
+    """Store a private copy of result, evicting the least recently used entry."""
+    entry = (stamp, copy.deepcopy(result))
+    with _PROPOSAL_CACHE_LOCK:
+        _PROPOSAL_CACHE[key] = entry
+        _PROPOSAL_CACHE.move_to_end(key)
+        if len(_PROPOSAL_CACHE) > _PROPOSAL_CACHE_SIZE:
+            _PROPOSAL_CACHE.popitem(last=False)
+
+
+def _drop_cached_proposal(key: str) -> None:
+    """Forget any cached proposal for key."""
+    with _PROPOSAL_CACHE_LOCK:
+        _PROPOSAL_CACHE.pop(key, None)
+
+
 def write_proposal_request(
     stat_explorer_data: dict,
     pass1_results: List[dict],
     parameter_usage_map: Dict[str, List[str]],
-    ea_source_code: str,
-    workflow_id: str
+    ea_source_code: Optional[str],
+    workflow_id: str,
+    ea_source_path: Optional[Path] = None
 ) -> Path:
     """
     Write LLM proposal request JSON.
 
+    When ea_source_path is given the request references the baseline EA by
+    path and SHA256 instead of inlining the source.
+
     Args:
         stat_explorer_data: Output from Step 8B
         pass1_results: Pass 1 optimization results
         parameter_usage_map: Parameter usage map from Step 3
-        ea_source_code: EA source code (baseline)
+        ea_source_code: EA source code (baseline); ignored if ea_source_path is set
         workflow_id: Workflow identifier
+        ea_source_path: Path to the baseline EA source
 
     Returns:
         Path to request file
@@ -178,6 +327,15 @@ def write_proposal_request(
 
     request_path = llm_dir / "step8c_request.json"
 
+    if ea_source_path is not None:
+        ea_source_path = Path(ea_source_path)
+        ea_source = {
+            "ea_source_path": str(ea_source_path),
+            "ea_source_sha256": hashlib.sha256(ea_source_path.read_bytes()).hexdigest()
+        }
+    else:
+        ea_source = {"ea_source_code": ea_source_code}
+
     request = {
         "step": "8C",
         "purpose": "Generate improvement proposals based on evidence from optimization results",
@@ -188,85 +346,53 @@ def write_proposal_request(
                 "top_10_passes": pass1_results[:10] if pass1_results else []
             },
             "parameter_usage_map": parameter_usage_map,
-            "ea_source_code": ea_source_code
+            **ea_source
         },
         "instructions": {
             "rules": [
-                "Every recommendation MUST cite evidence from stat_explorer or pass1_results",
-                "If evidence is weak, return empty lists for that area",
-                "New logic is allowed but MUST be tied to observed patterns (e.g., session bias)",
+                *_EVIDENCE_RULES,
                 f"Session-based sizing changes require profit concentration >= {STAT_MIN_SESSION_PROFIT_SHARE}%",
-                "Patches MUST NOT modify injected OnTester or safety guard code",
-                "Look for EA_STRESS_ONTESTER_INJECTED and EA_STRESS_SAFETY_INJECTED markers"
+                *_PATCH_RULES
             ],
             "allow_new_logic": LLM_ALLOW_NEW_LOGIC
         },
-        "output_schema": {
-            "type": "object",
-            "required": ["param_actions", "range_refinements", "expected_impact", "risks", "review_required"],
-            "properties": {
-                "param_actions": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "required": ["name", "action", "rationale", "evidence"],
-                        "properties": {
-                            "name": {"type": "string"},
-                            "action": {"type": "string", "enum": ["narrow_range", "fix", "remove"]},
-                            "rationale": {"type": "string"},
-                            "evidence": {"type": "array", "items": {"type": "string"}}
-                        }
-                    }
-                },
-                "range_refinements": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "required": ["name", "start", "step", "stop"],
-                        "properties": {
-                            "name": {"type": "string"},
-                            "start": {"type": "number"},
-                            "step": {"type": "number"},
-                            "stop": {"type": "number"},
-                            "reason": {"type": "string"}
-                        }
-                    }
-                },
-                "ea_patch": {
-                    "type": ["object", "null"],
-                    "properties": {
-                        "description": {"type": "string"},
-                        "diff": {"type": "string"}
-                    }
-                },
-                "expected_impact": {"type": "array", "items": {"type": "string"}},
-                "risks": {"type": "array", "items": {"type": "string"}},
-                "review_required": {"type": "boolean"}
-            }
-        }
+        "output_schema": _RESPONSE_SCHEMA
     }
 
-    with open(request_path, 'w') as f:
-        json.dump(request, f, indent=2)
+    write_json_atomic(request_path, request)
 
     return request_path
 
 
-def read_proposal_response(workflow_id: str) -> Optional[dict]:
+def read_proposal_response(
+    workflow_id: str,
+    path: Optional[Path] = None
+) -> Optional[dict]:
     """
     Read LLM proposal response if it exists.
 
+    Args:
+        workflow_id: Workflow identifier
+        path: Pre-resolved response path; skips the existence probe
+
     Returns:
         Response dict or None if not found
     """
+    if path is not None:
+        return _load_response(path)
+
     response_path = Path(RUNS_DIR) / "analysis" / workflow_id / "llm" / "step8c_response.json"
 
     if not response_path.exists():
         return None
 
+    return _load_response(response_path)
+
+
+def _load_response(path: Union[str, Path]) -> Optional[dict]:
+    """Parse a response file, treating unreadable or malformed JSON as absent."""
     try:
-        with open(response_path, 'r') as f:
-            return json.load(f)
+        return read_json(path)
     except (json.JSONDecodeError, IOError):
         return None
 
@@ -275,8 +401,9 @@ def generate_llm_proposal(
     stat_explorer_data: dict,
     pass1_results: List[dict],
     parameter_usage_map: Dict[str, List[str]],
-    ea_source_code: str,
-    workflow_id: str
+    ea_source_code: Optional[str],
+    workflow_id: str,
+    ea_source_path: Optional[Path] = None
 ) -> LLMProposalResult:
     """
     Generate LLM improvement proposal using offline flow.
@@ -291,8 +418,9 @@ def generate_llm_proposal(
         stat_explorer_data: Output from Step 8B
         pass1_results: Pass 1 optimization results
         parameter_usage_map: Parameter usage map from Step 3
-        ea_source_code: EA source code (baseline)
+        ea_source_code: EA source code (baseline); ignored if ea_source_path is set
         workflow_id: Workflow identifier
+        ea_source_path: Path to the baseline EA source, referenced by digest
 
     Returns:
         LLMProposalResult with proposal data or status
@@ -310,14 +438,22 @@ def generate_llm_proposal(
         request_path = llm_dir / "step8c_request.json"
         response_path = llm_dir / "step8c_response.json"
 
+        # One directory listing answers both the request and response probes
+        try:
+            with os.scandir(llm_dir) as it:
+                entries = {entry.name: entry for entry in it}
+        except FileNotFoundError:
+            entries = {}
+
         # Write request if not exists
-        if not request_path.exists():
+        if request_path.name not in entries:
             write_proposal_request(
                 stat_explorer_data=stat_explorer_data,
                 pass1_results=pass1_results,
                 parameter_usage_map=parameter_usage_map,
                 ea_source_code=ea_source_code,
-                workflow_id=workflow_id
+                workflow_id=workflow_id,
+                ea_source_path=ea_source_path
             )
 
             return LLMProposalResult(
@@ -327,10 +463,28 @@ def generate_llm_proposal(
                 error_message="Waiting for external LLM to provide step8c_response.json"
             )
 
-        # Check for response
-        response = read_proposal_response(workflow_id)
+        # Reuse the parsed result while the response file is unchanged
+        cache_key = str(response_path)
+        response_entry = entries.get(response_path.name)
+        response = None
+        response_stamp = None
+        if response_entry is not None:
+            try:
+                st = response_entry.stat()
+                response_stamp = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                response_entry = None
+
+        if response_entry is not None:
+            cached = _cached_proposal(cache_key, response_stamp)
+            if cached is not None:
+                return cached
+
+            # Check for response
+            response = _load_response(response_entry.path)
 
         if response is None:
+            _drop_cached_proposal(cache_key)
             return LLMProposalResult(
                 success=True,
                 status="request_written",
@@ -342,6 +496,7 @@ def generate_llm_proposal(
         is_valid, error_msg = _validate_response_schema(response)
 
         if not is_valid:
+            _drop_cached_proposal(cache_key)
             return LLMProposalResult(
                 success=False,
                 status="error",
@@ -379,7 +534,7 @@ def generate_llm_proposal(
                 diff=response["ea_patch"]["diff"]
             )
 
-        return LLMProposalResult(
+        result = LLMProposalResult(
             success=True,
             status="validated",
             request_path=str(request_path),
@@ -391,6 +546,9 @@ def generate_llm_proposal(
             risks=response["risks"],
             review_required=response["review_required"]
         )
+        if response_stamp is not None:
+            _cache_proposal(cache_key, response_stamp, result)
+        return result
 
     except Exception as e:
         return LLMProposalResult(
@@ -400,12 +558,45 @@ def generate_llm_proposal(
         )
 
 
+def generate_llm_proposals_batch(
+    requests: Dict[str, Dict[str, Any]],
+    max_workers: Optional[int] = None
+) -> Dict[str, LLMProposalResult]:
+    """
+    Poll Step 8C for several workflows in one call.
+
+    Each workflow's poll is file I/O and JSON parsing, so a thread pool
+    overlaps them; generate_llm_proposal only touches its own workflow's
+    llm/ directory and cache entry.
+
+    Args:
+        requests: generate_llm_proposal keyword arguments (without
+            workflow_id) per workflow_id
+        max_workers: Thread pool size; None or 1 polls sequentially
+
+    Returns:
+        LLMProposalResult per workflow_id, in the order of requests
+    """
+    def _poll(workflow_id: str) -> LLMProposalResult:
+        return generate_llm_proposal(workflow_id=workflow_id, **requests[workflow_id])
+
+    if not max_workers or max_workers <= 1 or len(requests) <= 1:
+        return {workflow_id: _poll(workflow_id) for workflow_id in requests}
+
+    # Deferred: concurrent.futures is only needed for pooled polling
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(requests, executor.map(_poll, requests)))
+
+
 def validate_llm_proposal(
     stat_explorer_data: dict,
     pass1_results: List[dict],
     parameter_usage_map: Dict[str, List[str]],
-    ea_source_code: str,
-    workflow_id: str
+    ea_source_code: Optional[str],
+    workflow_id: str,
+    ea_source_path: Optional[Path] = None
 ) -> LLMProposalResult:
     """Convenience function for generating LLM proposal."""
     return generate_llm_proposal(
@@ -413,5 +604,6 @@ def validate_llm_proposal(
         pass1_results=pass1_results,
         parameter_usage_map=parameter_usage_map,
         ea_source_code=ea_source_code,
-        workflow_id=workflow_id
+        workflow_id=workflow_id,
+        ea_source_path=ea_source_path
     )
@@ -11,12 +11,15 @@ Per PRD Section 3, Step 8D:
 - Apply the approved patch at the end of Step 8D
 """
 
-from dataclasses import dataclass, asdict
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, Tuple
+import hashlib
 import json
-import shutil
-from datetime import datetime
+import os
+import threading
+from datetime import datetime, timezone
 
 
 from ...config import (
@@ -24,10 +27,15 @@ from ...config import (
     LLM_REVIEW_REQUIRED,
     LLM_MAX_REFINEMENT_CYCLES
 )
-from .step08c_llm_proposal import LLMProposalResult, EAPatch
+from .step08c_llm_proposal import (
+    LLMProposalResult,
+    EAPatch,
+    _proposal_payload,
+)
+from ...jsonio import dumps as json_dumps, read_json, write_bytes_atomic, write_json_atomic
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewDecision:
     """Review decision for LLM proposal."""
     approved: bool
@@ -36,7 +44,7 @@ class ReviewDecision:
     timestamp: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewResult:
     """Result from manual review step."""
     success: bool
@@ -57,10 +65,30 @@ class ReviewResult:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        result = asdict(self)
-        if self.decision:
-            result['decision'] = asdict(self.decision)
-        return result
+        decision = self.decision
+        return {
+            'success': self.success,
+            'status': self.status,
+            'review_required': self.review_required,
+            'baseline_ea_path': self.baseline_ea_path,
+            'active_ea_path': self.active_ea_path,
+            'patch_applied': self.patch_applied,
+            'patched_ea_path': self.patched_ea_path,
+            'decision': {
+                'approved': decision.approved,
+                'feedback': decision.feedback,
+                'reviewer_notes': decision.reviewer_notes,
+                'timestamp': decision.timestamp,
+            } if decision else None,
+            'review_package_path': self.review_package_path,
+            'error_message': self.error_message,
+            'refinement_cycle': self.refinement_cycle,
+        }
+
+
+def _utc_timestamp() -> str:
+    """Timezone-aware UTC timestamp at second resolution."""
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
 
 
 def _create_review_package(
@@ -79,35 +107,8 @@ def _create_review_package(
 
     package = {
         "workflow_id": workflow_id,
-        "created_at": datetime.utcnow().isoformat(),
         "baseline_ea": str(baseline_ea_path),
-        "proposal": {
-            "param_actions": [
-                {
-                    "name": a.name,
-                    "action": a.action,
-                    "rationale": a.rationale,
-                    "evidence": a.evidence
-                }
-                for a in proposal.param_actions
-            ],
-            "range_refinements": [
-                {
-                    "name": r.name,
-                    "start": r.start,
-                    "step": r.step,
-                    "stop": r.stop,
-                    "reason": r.reason
-                }
-                for r in proposal.range_refinements
-            ],
-            "ea_patch": {
-                "description": proposal.ea_patch.description,
-                "diff": proposal.ea_patch.diff
-            } if proposal.ea_patch else None,
-            "expected_impact": proposal.expected_impact,
-            "risks": proposal.risks
-        },
+        "proposal": _proposal_payload(proposal),
         "instructions": {
             "to_approve": "Create step8d_decision.json with: {\"approved\": true}",
             "to_reject": "Create step8d_decision.json with: {\"approved\": false}",
@@ -116,38 +117,103 @@ def _create_review_package(
     }
 
     package_path = review_dir / "review_package.json"
-    with open(package_path, 'w') as f:
-        json.dump(package, f, indent=2)
+    hash_path = review_dir / ".package_hash"
+
+    # Polls re-create the same package; skip the write when nothing changed
+    package_hash = _package_hash(package)
+    if package_path.exists():
+        try:
+            if hash_path.read_text(encoding='ascii') == package_hash:
+                return package_path
+        except (OSError, ValueError):
+            pass
+
+    package["created_at"] = _utc_timestamp()
+    write_json_atomic(package_path, package)
+    write_bytes_atomic(hash_path, package_hash.encode('ascii'))
 
     return package_path
 
 
-def _read_review_decision(workflow_id: str) -> Optional[ReviewDecision]:
+def _package_hash(package: dict) -> str:
+    """Digest of the review package content (excluding created_at)."""
+    data = json_dumps(package, indent=False, sort_keys=True)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _read_review_decision(
+    workflow_id: str,
+    path: Optional[Path] = None
+) -> Optional[ReviewDecision]:
     """
     Read review decision from file.
 
+    Args:
+        workflow_id: Workflow identifier
+        path: Pre-resolved decision path; skips the existence probe
+
     Returns:
         ReviewDecision or None if not found
     """
-    decision_path = Path(RUNS_DIR) / "analysis" / workflow_id / "patches" / "step8d_decision.json"
-
-    if not decision_path.exists():
-        return None
+    if path is not None:
+        decision_path = path
+    else:
+        decision_path = Path(RUNS_DIR) / "analysis" / workflow_id / "patches" / "step8d_decision.json"
+        if not decision_path.exists():
+            return None
 
     try:
-        with open(decision_path, 'r') as f:
-            data = json.load(f)
+        data = read_json(decision_path)
 
         return ReviewDecision(
             approved=data.get("approved", False),
             feedback=data.get("feedback"),
             reviewer_notes=data.get("notes"),
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=_utc_timestamp()
         )
     except (json.JSONDecodeError, IOError):
         return None
 
 
+# Leading markers of a unified diff (file header or bare hunk)
+_UNIFIED_DIFF_PREFIXES = ("---", "@@")
+
+# Baseline EA source per path, with the (st_mtime_ns, st_size) it was read at.
+# Bounded LRU so a large batch review does not pin every baseline in memory.
+_BASELINE_CACHE_SIZE = 8
+_BASELINE_CACHE: "OrderedDict[str, Tuple[int, int, bytes]]" = OrderedDict()
+_BASELINE_CACHE_LOCK = threading.Lock()
+
+# Patch insertion marker and fallback separator, matched on raw UTF-8 bytes
+_PATCH_MARKER = b"// INSERT_PATCH_HERE"
+_PATCH_SEPARATOR = b"\n\n// --- LLM PATCH ---\n"
+_UTF16_BOMS = (b"\xff\xfe", b"\xfe\xff")
+
+
+def _read_baseline(baseline_ea_path: Path) -> bytes:
+    """
+    Read the raw baseline EA source, reusing the last read while the file's
+    mtime and size are unchanged (review polls re-apply the same baseline).
+    """
+    st = baseline_ea_path.stat()
+    key = str(baseline_ea_path)
+    with _BASELINE_CACHE_LOCK:
+        cached = _BASELINE_CACHE.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _BASELINE_CACHE.move_to_end(key)
+            return cached[2]
+
+    with open(baseline_ea_path, 'rb') as f:
+        baseline_bytes = f.read()
+
+    with _BASELINE_CACHE_LOCK:
+        _BASELINE_CACHE[key] = (st.st_mtime_ns, st.st_size, baseline_bytes)
+        _BASELINE_CACHE.move_to_end(key)
+        if len(_BASELINE_CACHE) > _BASELINE_CACHE_SIZE:
+            _BASELINE_CACHE.popitem(last=False)
+    return baseline_bytes
+
+
 def _apply_patch(
     baseline_ea_path: Path,
     patch: EAPatch,
@@ -168,37 +234,49 @@ def _apply_patch(
         patches_dir = Path(RUNS_DIR) / "analysis" / workflow_id / "patches"
         patches_dir.mkdir(parents=True, exist_ok=True)
 
-        # Read baseline EA
-        with open(baseline_ea_path, 'r', encoding='utf-8') as f:
-            baseline_code = f.read()
-
         # Generate patched filename
         stem = baseline_ea_path.stem
         patched_path = patches_dir / f"{stem}_v{version}.mq5"
 
         # If diff is a code block (not unified diff), append it
         # This is simplified - real implementation would parse unified diffs
-        if patch.diff.startswith("---") or patch.diff.startswith("@@"):
+        if patch.diff.startswith(_UNIFIED_DIFF_PREFIXES):
             # Unified diff format - would need proper diff application
-            # For now, just copy baseline (patch application not implemented)
-            patched_code = baseline_code
+            # For now, just copy baseline (patch application not implemented);
+            # copyfile lets the kernel move the bytes without decoding them
+            import shutil  # Deferred: only this branch copies files
+
+            shutil.copyfile(baseline_ea_path, patched_path)
         else:
+            # Read baseline EA (cached until the file changes); patching works
+            # on UTF-8 bytes so the source is never decoded
+            baseline_bytes = _read_baseline(baseline_ea_path)
+            if baseline_bytes.startswith(_UTF16_BOMS):
+                raise ValueError("UTF-16 EA source is not supported for patching")
+            diff_bytes = patch.diff.encode('utf-8')
+
             # Assume diff is code to append/insert
             # Look for insertion point marker
-            if "// INSERT_PATCH_HERE" in baseline_code:
-                patched_code = baseline_code.replace("// INSERT_PATCH_HERE", patch.diff)
+            if _PATCH_MARKER in baseline_bytes:
+                patched_bytes = baseline_bytes.replace(_PATCH_MARKER, diff_bytes)
             else:
                 # Append before last closing brace or at end
-                patched_code = baseline_code + "\n\n// --- LLM PATCH ---\n" + patch.diff
+                patched_bytes = baseline_bytes + _PATCH_SEPARATOR + diff_bytes
 
-        with open(patched_path, 'w', encoding='utf-8') as f:
-            f.write(patched_code)
+            with open(patched_path, 'wb') as f:
+                f.write(patched_bytes)
 
-        # Also save patch diff for reference
+        # Also save patch diff for reference (unchanged on repeat polls)
         diff_path = patches_dir / f"{stem}_v{version}.patch"
-        with open(diff_path, 'w', encoding='utf-8') as f:
-            f.write(f"Description: {patch.description}\n\n")
-            f.write(patch.diff)
+        diff_text = f"Description: {patch.description}\n\n{patch.diff}"
+        try:
+            with open(diff_path, 'r', encoding='utf-8') as f:
+                diff_unchanged = f.read() == diff_text
+        except OSError:
+            diff_unchanged = False
+        if not diff_unchanged:
+            with open(diff_path, 'w', encoding='utf-8') as f:
+                f.write(diff_text)
 
         return patched_path
 
@@ -210,7 +288,8 @@ def review_proposal(
     proposal: LLMProposalResult,
     baseline_ea_path: Path,
     workflow_id: str,
-    refinement_cycle: int = 0
+    refinement_cycle: int = 0,
+    decision_path: Optional[Path] = None
 ) -> ReviewResult:
     """
     Handle manual review of LLM proposal.
@@ -226,6 +305,7 @@ def review_proposal(
         baseline_ea_path: Path to baseline EA
         workflow_id: Workflow identifier
         refinement_cycle: Current refinement cycle (0 = first review)
+        decision_path: Pre-resolved step8d_decision.json path (batch polling)
 
     Returns:
         ReviewResult with review status
@@ -282,7 +362,7 @@ def review_proposal(
         )
 
         # Check for review decision
-        decision = _read_review_decision(workflow_id)
+        decision = _read_review_decision(workflow_id, decision_path)
 
         if decision is None:
             # Still waiting for review
@@ -373,6 +453,70 @@ def review_proposal(
         )
 
 
+def review_proposals(
+    proposals: Dict[str, LLMProposalResult],
+    baseline_ea_paths: Dict[str, Path],
+    refinement_cycle: int = 0,
+    max_workers: Optional[int] = None
+) -> Dict[str, ReviewResult]:
+    """
+    Poll the review of several workflows with one walk of the analysis dir.
+
+    The analysis directory is listed once and each matching workflow's
+    patches/ directory once; decisions found in a listing are opened
+    directly instead of being probed again per workflow.
+
+    Args:
+        proposals: LLM proposal per workflow_id
+        baseline_ea_paths: Baseline EA path per workflow_id
+        refinement_cycle: Current refinement cycle (0 = first review)
+        max_workers: Thread pool size for the per-workflow reviews;
+            None or 1 reviews sequentially
+
+    Returns:
+        ReviewResult per workflow_id
+    """
+    analysis_dir = Path(RUNS_DIR) / "analysis"
+    try:
+        with os.scandir(analysis_dir) as it:
+            workflow_dirs = {
+                entry.name: entry.path for entry in it
+                if entry.name in proposals and entry.is_dir()
+            }
+    except FileNotFoundError:
+        workflow_dirs = {}
+
+    def _review(workflow_id: str) -> ReviewResult:
+        decision_path = None
+        workflow_dir = workflow_dirs.get(workflow_id)
+        if workflow_dir is not None:
+            try:
+                with os.scandir(os.path.join(workflow_dir, "patches")) as it:
+                    for entry in it:
+                        if entry.name == "step8d_decision.json":
+                            decision_path = Path(entry.path)
+                            break
+            except FileNotFoundError:
+                pass
+
+        return review_proposal(
+            proposal=proposals[workflow_id],
+            baseline_ea_path=baseline_ea_paths[workflow_id],
+            workflow_id=workflow_id,
+            refinement_cycle=refinement_cycle,
+            decision_path=decision_path
+        )
+
+    if not max_workers or max_workers <= 1 or len(proposals) <= 1:
+        return {workflow_id: _review(workflow_id) for workflow_id in proposals}
+
+    # Imported here so sequential reviews never load concurrent.futures
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(proposals, executor.map(_review, proposals)))
+
+
 def validate_review(
     proposal: LLMProposalResult,
     baseline_ea_path: Path,
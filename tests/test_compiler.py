@@ -2,6 +2,7 @@
 
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 import subprocess
 
@@ -17,9 +18,10 @@ from ea_stress.mt5.terminal import MT5Installation
 class TestCompilationError(unittest.TestCase):
     """Test CompilationError dataclass."""
 
-    def test_error_creation(self):
-        """Test creating a compilation error."""
-        error = CompilationError(
+    @classmethod
+    def setUpClass(cls):
+        """Build the canonical error shared by the read-only tests."""
+        cls.sample_error = CompilationError(
             file="MyEA.mq5",
             line=123,
             column=45,
@@ -27,21 +29,17 @@ class TestCompilationError(unittest.TestCase):
             code="001",
             message="unexpected token"
         )
+
+    def test_error_creation(self):
+        """Test creating a compilation error."""
+        error = self.sample_error
         self.assertEqual(error.file, "MyEA.mq5")
         self.assertEqual(error.line, 123)
         self.assertEqual(error.severity, "error")
 
     def test_error_string(self):
         """Test error string representation."""
-        error = CompilationError(
-            file="MyEA.mq5",
-            line=123,
-            column=45,
-            severity="error",
-            code="001",
-            message="unexpected token"
-        )
-        result = str(error)
+        result = str(self.sample_error)
         self.assertIn("MyEA.mq5", result)
         self.assertIn("123", result)
         self.assertIn("error", result)
@@ -50,9 +48,10 @@ class TestCompilationError(unittest.TestCase):
 class TestCompilationResult(unittest.TestCase):
     """Test CompilationResult dataclass."""
 
-    def test_successful_compilation(self):
-        """Test successful compilation result."""
-        result = CompilationResult(
+    @classmethod
+    def setUpClass(cls):
+        """Build canonical success and failure results shared by the tests."""
+        cls.success_result = CompilationResult(
             success=True,
             ex5_path=Path("test.ex5"),
             errors=[],
@@ -62,41 +61,35 @@ class TestCompilationResult(unittest.TestCase):
             exit_code=0,
             command="metaeditor64.exe /compile test.mq5"
         )
-        self.assertTrue(result.success)
-        self.assertEqual(result.error_count, 0)
-        self.assertEqual(result.warning_count, 0)
-
-    def test_failed_compilation(self):
-        """Test failed compilation result."""
-        errors = [
-            CompilationError("test.mq5", 10, 5, "error", "001", "syntax error")
-        ]
-        result = CompilationResult(
+        cls.failure_result = CompilationResult(
             success=False,
             ex5_path=None,
-            errors=errors,
+            errors=[
+                CompilationError("test.mq5", 10, 5, "error", "001", "syntax error")
+            ],
             warnings=[],
             stdout="",
             stderr="error",
             exit_code=1,
             command="metaeditor64.exe /compile test.mq5"
         )
+
+    def test_successful_compilation(self):
+        """Test successful compilation result."""
+        result = self.success_result
+        self.assertTrue(result.success)
+        self.assertEqual(result.error_count, 0)
+        self.assertEqual(result.warning_count, 0)
+
+    def test_failed_compilation(self):
+        """Test failed compilation result."""
+        result = self.failure_result
         self.assertFalse(result.success)
         self.assertEqual(result.error_count, 1)
 
     def test_result_string(self):
         """Test result string representation."""
-        result = CompilationResult(
-            success=True,
-            ex5_path=Path("test.ex5"),
-            errors=[],
-            warnings=[],
-            stdout="",
-            stderr="",
-            exit_code=0,
-            command=""
-        )
-        result_str = str(result)
+        result_str = str(self.success_result)
         self.assertIn("SUCCESS", result_str)
         self.assertIn("0 errors", result_str)
 
@@ -106,26 +99,31 @@ class TestMT5Compiler(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.mock_installation = Mock(spec=MT5Installation)
-        self.mock_installation.metaeditor_path = Path("C:/MT5/metaeditor64.exe")
+        # MT5Compiler only reads metaeditor_path, so no spec'd Mock is needed
+        self.mock_installation = SimpleNamespace(
+            metaeditor_path=Path("C:/MT5/metaeditor64.exe")
+        )
+
+        # Every test needs Path.exists patched; tests tweak the shared mock
+        exists_patcher = patch.object(Path, 'exists', return_value=True)
+        self.mock_exists = exists_patcher.start()
+        self.addCleanup(exists_patcher.stop)
 
     def test_compiler_init_success(self):
         """Test compiler initialization with valid MetaEditor."""
-        with patch.object(Path, 'exists', return_value=True):
-            compiler = MT5Compiler(self.mock_installation)
-            self.assertEqual(compiler.metaeditor_path, Path("C:/MT5/metaeditor64.exe"))
+        compiler = MT5Compiler(self.mock_installation)
+        self.assertEqual(compiler.metaeditor_path, Path("C:/MT5/metaeditor64.exe"))
 
     def test_compiler_init_no_metaeditor(self):
         """Test compiler initialization fails without MetaEditor."""
-        with patch.object(Path, 'exists', return_value=False):
-            with self.assertRaises(ValueError) as ctx:
-                MT5Compiler(self.mock_installation)
-            self.assertIn("MetaEditor not found", str(ctx.exception))
+        self.mock_exists.return_value = False
+        with self.assertRaises(ValueError) as ctx:
+            MT5Compiler(self.mock_installation)
+        self.assertIn("MetaEditor not found", str(ctx.exception))
 
     def test_parse_error_output(self):
         """Test parsing compilation errors from output."""
-        with patch.object(Path, 'exists', return_value=True):
-            compiler = MT5Compiler(self.mock_installation)
+        compiler = MT5Compiler(self.mock_installation)
 
         output = """MyEA.mq5(123,45) : error 001: unexpected token
 MyEA.mq5(150,10) : warning 202: variable not used
@@ -146,8 +144,7 @@ MyEA.mq5(150,10) : warning 202: variable not used
 
     def test_parse_no_errors(self):
         """Test parsing output with no errors."""
-        with patch.object(Path, 'exists', return_value=True):
-            compiler = MT5Compiler(self.mock_installation)
+        compiler = MT5Compiler(self.mock_installation)
 
         output = "Compilation successful\n0 error(s), 0 warning(s)"
         errors, warnings = compiler._parse_output(output)
@@ -156,11 +153,8 @@ MyEA.mq5(150,10) : warning 202: variable not used
         self.assertEqual(len(warnings), 0)
 
     @patch('subprocess.run')
-    @patch.object(Path, 'exists')
-    def test_compile_success(self, mock_exists, mock_run):
+    def test_compile_success(self, mock_run):
         """Test successful compilation."""
-        # Setup mocks
-        mock_exists.return_value = True
         mock_run.return_value = Mock(
             returncode=0,
             stdout="Compilation successful",
@@ -186,33 +180,21 @@ MyEA.mq5(150,10) : warning 202: variable not used
             stderr=""
         )
 
-        with patch.object(Path, 'exists') as mock_exists:
-            # MetaEditor exists, source exists
-            mock_exists.return_value = True
-            compiler = MT5Compiler(self.mock_installation)
-            source_path = Path("C:/MT5/MQL5/Experts/MyEA.mq5")
-
-            # Override for ex5 file check - should not exist
-            def exists_check():
-                # Count how many times exists() was called
-                if not hasattr(exists_check, 'call_count'):
-                    exists_check.call_count = 0
-                exists_check.call_count += 1
-                # .ex5 file check is at the end, return False for it
-                if exists_check.call_count > 2:
-                    return False
-                return True
-
-            mock_exists.side_effect = exists_check
-            result = compiler.compile(source_path)
+        # MetaEditor exists, source exists
+        compiler = MT5Compiler(self.mock_installation)
+        source_path = Path("C:/MT5/MQL5/Experts/MyEA.mq5")
+
+        # First two exists() calls succeed; the trailing .ex5 checks do not
+        self.mock_exists.side_effect = iter([True, True, False, False, False, False])
+        result = compiler.compile(source_path)
 
         self.assertFalse(result.success)
         self.assertEqual(result.error_count, 1)
         self.assertEqual(result.errors[0].line, 50)
 
-    @patch.object(Path, 'exists')
-    def test_compile_source_not_found(self, mock_exists):
+    def test_compile_source_not_found(self):
         """Test compilation with missing source file."""
+        mock_exists = self.mock_exists
         mock_exists.side_effect = lambda: mock_exists.call_count <= 1
 
         compiler = MT5Compiler(self.mock_installation)
@@ -221,11 +203,8 @@ MyEA.mq5(150,10) : warning 202: variable not used
         with self.assertRaises(FileNotFoundError):
             compiler.compile(source_path)
 
-    @patch.object(Path, 'exists')
-    def test_compile_invalid_extension(self, mock_exists):
+    def test_compile_invalid_extension(self):
         """Test compilation with invalid file extension."""
-        mock_exists.return_value = True
-
         compiler = MT5Compiler(self.mock_installation)
         source_path = Path("C:/MT5/MQL5/Experts/MyEA.txt")
 
@@ -234,10 +213,8 @@ MyEA.mq5(150,10) : warning 202: variable not used
         self.assertIn("Invalid source file extension", str(ctx.exception))
 
     @patch('subprocess.run')
-    @patch.object(Path, 'exists')
-    def test_compile_timeout(self, mock_exists, mock_run):
+    def test_compile_timeout(self, mock_run):
         """Test compilation timeout."""
-        mock_exists.return_value = True
         mock_run.side_effect = subprocess.TimeoutExpired(cmd='metaeditor', timeout=10)
 
         compiler = MT5Compiler(self.mock_installation)
@@ -249,51 +226,34 @@ MyEA.mq5(150,10) : warning 202: variable not used
         self.assertEqual(result.error_count, 1)
         self.assertIn("timed out", result.errors[0].message.lower())
 
-    def test_validate_ex5_success(self):
-        """Test validating existing .ex5 file."""
-        with patch.object(Path, 'exists', return_value=True):
-            with patch.object(Path, 'is_file', return_value=True):
-                with patch.object(Path, 'stat') as mock_stat:
-                    mock_stat.return_value.st_size = 1024
-
-                    compiler = MT5Compiler(self.mock_installation)
-                    ex5_path = Path("test.ex5")
-
-                    result = compiler.validate_ex5(ex5_path)
-                    self.assertTrue(result)
-
-    def test_validate_ex5_not_exists(self):
-        """Test validating non-existent .ex5 file."""
-        with patch.object(Path, 'exists', return_value=True):
-            compiler = MT5Compiler(self.mock_installation)
-            ex5_path = Path("missing.ex5")
-
-            with patch.object(Path, 'exists', return_value=False):
-                result = compiler.validate_ex5(ex5_path)
-                self.assertFalse(result)
-
-    def test_validate_ex5_empty(self):
-        """Test validating empty .ex5 file."""
-        with patch.object(Path, 'exists', return_value=True):
-            with patch.object(Path, 'is_file', return_value=True):
-                with patch.object(Path, 'stat') as mock_stat:
-                    mock_stat.return_value.st_size = 0
+    @patch.object(Path, 'is_file', return_value=True)
+    @patch.object(Path, 'stat')
+    def test_validate_ex5_matrix(self, mock_stat, mock_is_file):
+        """Test validating .ex5 files: present, missing and empty."""
+        compiler = MT5Compiler(self.mock_installation)
 
-                    compiler = MT5Compiler(self.mock_installation)
-                    ex5_path = Path("empty.ex5")
+        cases = [
+            # (case, exists, st_size, expected)
+            ("exists_nonempty", True, 1024, True),
+            ("not_exists", False, None, False),
+            ("empty", True, 0, False),
+        ]
+        for case, exists, size, expected in cases:
+            with self.subTest(case=case):
+                self.mock_exists.return_value = exists
+                mock_stat.return_value.st_size = size
 
-                    result = compiler.validate_ex5(ex5_path)
-                    self.assertFalse(result)
+                result = compiler.validate_ex5(Path(f"{case}.ex5"))
+                self.assertIs(result, expected)
 
     def test_get_compiled_path(self):
         """Test getting compiled path for source file."""
-        with patch.object(Path, 'exists', return_value=True):
-            compiler = MT5Compiler(self.mock_installation)
-            source_path = Path("C:/MT5/MQL5/Experts/MyEA.mq5")
+        compiler = MT5Compiler(self.mock_installation)
+        source_path = Path("C:/MT5/MQL5/Experts/MyEA.mq5")
 
-            ex5_path = compiler.get_compiled_path(source_path)
+        ex5_path = compiler.get_compiled_path(source_path)
 
-            self.assertEqual(ex5_path, Path("C:/MT5/MQL5/Experts/MyEA.ex5"))
+        self.assertEqual(ex5_path, Path("C:/MT5/MQL5/Experts/MyEA.ex5"))
 
 
 class TestCompileEA(unittest.TestCase):
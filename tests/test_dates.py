@@ -0,0 +1,49 @@
+"""
+Tests for the shared backtest date window
+"""
+
+import unittest
+from datetime import date, datetime, timedelta
+
+from ea_stress.workflow.dates import (
+    backtest_date_range,
+    format_mt5_date,
+    today_ordinal,
+)
+
+
+class TestBacktestDateRange(unittest.TestCase):
+    """Test backtest_date_range and its helpers"""
+
+    def test_format_mt5_date_matches_strftime(self):
+        """Test ordinal-based date formatting matches MT5 strftime output"""
+        today = datetime.now()
+        for days in (0, 365, 4 * 365):
+            expected = (today - timedelta(days=days)).strftime('%Y.%m.%d')
+            actual = format_mt5_date(datetime.fromordinal(today.toordinal() - days))
+            self.assertEqual(actual, expected)
+
+    def test_date_range_cached_per_day(self):
+        """Test date range is computed once per (day, years) key"""
+        today_ord = datetime(2025, 1, 17).toordinal()
+        first = backtest_date_range(today_ord, 4, 1)
+        second = backtest_date_range(today_ord, 4, 1)
+
+        self.assertIs(first, second)
+        self.assertEqual(first[3:], ("2021.01.18", "2025.01.17", "2024.01.18"))
+
+    def test_date_range_leap_day(self):
+        """Test a Feb 29 end date counts back whole 365-day years"""
+        from_date, to_date, split_date, _, _, _ = backtest_date_range(datetime(2024, 2, 29).toordinal(), 4, 1)
+
+        self.assertEqual(from_date, datetime(2020, 3, 1))
+        self.assertEqual(to_date, datetime(2024, 2, 29))
+        self.assertEqual(split_date, datetime(2023, 3, 1))
+
+    def test_today_ordinal_is_local_date(self):
+        """Test the window ends on the local calendar day"""
+        self.assertEqual(today_ordinal(), date.today().toordinal())
+
+
+if __name__ == '__main__':
+    unittest.main()
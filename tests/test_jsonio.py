@@ -0,0 +1,116 @@
+"""Tests for the shared JSON file helpers."""
+
+import json
+import math
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ea_stress.jsonio import (
+    dumps,
+    has_non_finite,
+    loads,
+    read_json,
+    write_bytes_atomic,
+    write_json_atomic,
+)
+
+
+class TestWriteJsonAtomic:
+    """Test atomic JSON writes."""
+
+    def test_write_json_with_and_without_orjson(self):
+        """Test output parses identically with either encoder."""
+        payload = {"inputs": {"ea_source_code": "// EA code\nint x = 1;"}, "rules": ["a", "b"]}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "request.json"
+            write_json_atomic(path, payload)
+            assert json.loads(path.read_bytes()) == payload
+
+            with patch('ea_stress.jsonio.orjson', None):
+                write_json_atomic(path, payload)
+            assert path.read_text() == json.dumps(payload, indent=2)
+
+    def test_write_json_keeps_utf8(self):
+        """Test non-ASCII text is written as UTF-8 by both encoders."""
+        payload = {"ea_name": "TestEA €£¥"}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "state.json"
+            write_json_atomic(path, payload)
+            assert "TestEA €£¥".encode("utf-8") in path.read_bytes()
+            assert read_json(path) == payload
+
+            with patch('ea_stress.jsonio.orjson', None):
+                write_json_atomic(path, payload)
+            assert "TestEA €£¥".encode("utf-8") in path.read_bytes()
+            assert read_json(path) == payload
+
+    def test_write_json_is_atomic(self):
+        """Test a failed write leaves the previous file intact and no temp file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "request.json"
+            write_json_atomic(path, {"version": 1})
+
+            with patch('ea_stress.jsonio.os.replace', side_effect=OSError("rename failed")):
+                with pytest.raises(OSError):
+                    write_json_atomic(path, {"version": 2})
+
+            with patch('ea_stress.jsonio.os.fsync', side_effect=OSError("disk full")):
+                with pytest.raises(OSError):
+                    write_bytes_atomic(path, b"{}")
+
+            assert json.loads(path.read_bytes()) == {"version": 1}
+            assert list(Path(tmpdir).iterdir()) == [path]
+
+
+class TestNonFiniteFloats:
+    """Test inf/NaN survive encoding and decoding."""
+
+    def test_has_non_finite(self):
+        """Test nested inf/NaN values are detected."""
+        assert has_non_finite({"a": [1.0, {"b": float('inf')}]})
+        assert has_non_finite((float('nan'),))
+        assert not has_non_finite({"a": [1.0, 2, "inf", None]})
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip_non_finite(self, use_orjson):
+        """Test inf/NaN round-trip through a file with either encoder."""
+        payload = {"profit_factor": float('inf'), "drawdown": float('-inf'), "sharpe": float('nan')}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "stat_explorer.json"
+            if use_orjson:
+                write_json_atomic(path, payload)
+                data = read_json(path)
+            else:
+                with patch('ea_stress.jsonio.orjson', None):
+                    write_json_atomic(path, payload)
+                    data = read_json(path)
+
+            assert b"Infinity" in path.read_bytes()
+            assert data["profit_factor"] == float('inf')
+            assert data["drawdown"] == float('-inf')
+            assert math.isnan(data["sharpe"])
+
+    def test_loads_stdlib_tokens(self):
+        """Test Infinity/NaN tokens written by stdlib json are accepted."""
+        data = loads(json.dumps({"pf": float('inf'), "x": 1}).encode('utf-8'))
+        assert data == {"pf": float('inf'), "x": 1}
+
+    def test_loads_malformed_raises_stdlib_error(self):
+        """Test malformed input still raises json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            loads(b'{"param_actions": [')
+
+    def test_sorted_compact_dumps(self):
+        """Test sort_keys/indent options match between encoders."""
+        payload = {"b": 1, "a": [1, 2]}
+        fast = dumps(payload, indent=False, sort_keys=True)
+        with patch('ea_stress.jsonio.orjson', None):
+            slow = dumps(payload, indent=False, sort_keys=True)
+        assert json.loads(fast) == json.loads(slow) == payload
+        assert fast.index(b'"a"') < fast.index(b'"b"')
@@ -2,9 +2,8 @@
 
 import unittest
 from pathlib import Path
-from datetime import datetime
-import tempfile
-import xml.etree.ElementTree as ET
+import uuid
+from xml.sax.saxutils import escape
 
 from ea_stress.mt5.parser import (
     MT5XMLParser,
@@ -14,19 +13,159 @@ from ea_stress.mt5.parser import (
     parse_backtest_xml
 )
 
+# SpreadsheetML namespace and the fixed parts of a fixture workbook
+NS = 'urn:schemas-microsoft-com:office:spreadsheet'
+_WORKBOOK_OPEN = (
+    "<?xml version='1.0' encoding='utf-8'?>\n"
+    f'<ss:Workbook xmlns:ss="{NS}"><ss:Worksheet ss:Name="{{name}}"><ss:Table>'
+)
+_WORKBOOK_CLOSE = '</ss:Table></ss:Worksheet></ss:Workbook>'
+
+# Backtest "Result" sheet row: metric name and value, both String cells
+_METRIC_ROW = (
+    '<ss:Row><ss:Cell><ss:Data ss:Type="String">{k}</ss:Data></ss:Cell>'
+    '<ss:Cell><ss:Data ss:Type="String">{v}</ss:Data></ss:Cell></ss:Row>'
+)
+
+
+def _row(cell_type: str, values) -> str:
+    """Render one <ss:Row> whose cells all share a data type."""
+    cells = ''.join(
+        f'<ss:Cell><ss:Data ss:Type="{cell_type}">{escape(str(v))}</ss:Data></ss:Cell>'
+        for v in values
+    )
+    return f'<ss:Row>{cells}</ss:Row>'
+
+
+def _workbook_bytes(sheet_name: str, rows) -> bytes:
+    """Render a single-sheet SpreadsheetML workbook from pre-rendered rows."""
+    body = ''.join(rows)
+    return (_WORKBOOK_OPEN.format(name=escape(sheet_name)) + body + _WORKBOOK_CLOSE).encode('utf-8')
+
+
+def _write_workbook(path: Path, sheet_name: str, rows) -> Path:
+    """Write a single-sheet SpreadsheetML workbook from pre-rendered rows."""
+    path.write_bytes(_workbook_bytes(sheet_name, rows))
+    return path
+
+
+_OPTIMIZATION_HEADERS = (
+    'Pass', 'Result', 'Profit', 'Profit Factor', 'Expected Payoff',
+    'Drawdown %', 'Trades', 'Sharpe Ratio', 'Recovery Factor', 'Win %'
+)
+
+
+def _optimization_rows(passes_data: list) -> list:
+    """Render the header and one row per pass for an optimization workbook."""
+    headers = list(_OPTIMIZATION_HEADERS)
+
+    # Add parameter columns from first pass
+    if passes_data:
+        headers.extend(passes_data[0].get('parameters', {}).keys())
+
+    rows = [_row('String', headers)]
+    for idx, pass_info in enumerate(passes_data, start=1):
+        rows.append(_row('Number', (
+            idx,
+            pass_info['result'],
+            pass_info['profit'],
+            pass_info['profit_factor'],
+            pass_info['expected_payoff'],
+            pass_info['max_drawdown_pct'],
+            pass_info['total_trades'],
+            pass_info['sharpe_ratio'],
+            pass_info['recovery_factor'],
+            pass_info['win_rate'],
+            *pass_info.get('parameters', {}).values()
+        )))
+    return rows
+
+
+def _write_optimization_xml(xml_path: Path, passes_data: list) -> Path:
+    """Write an optimization workbook with one row per pass."""
+    return _write_workbook(xml_path, 'Optimization Graph', _optimization_rows(passes_data))
+
+
+def _backtest_bytes(metrics: dict) -> bytes:
+    """Render a backtest "Result" workbook with one row per metric."""
+    return _workbook_bytes(
+        'Result',
+        (_METRIC_ROW.format(k=escape(key), v=escape(str(value))) for key, value in metrics.items())
+    )
+
+
+def _optimization_parser(passes_data: list) -> MT5XMLParser:
+    """Parse an optimization workbook straight from memory."""
+    return MT5XMLParser.from_bytes(
+        _workbook_bytes('Optimization Graph', _optimization_rows(passes_data))
+    )
+
+
+def _pass(**overrides) -> dict:
+    """Build pass data from the baseline pass used across these tests."""
+    pass_info = {
+        'result': 1.25,
+        'profit': 1500.0,
+        'profit_factor': 1.8,
+        'expected_payoff': 15.0,
+        'max_drawdown_pct': 12.5,
+        'total_trades': 100,
+        'sharpe_ratio': 1.2,
+        'recovery_factor': 7.5,
+        'win_rate': 65.0,
+        'parameters': {}
+    }
+    pass_info.update(overrides)
+    return pass_info
+
+
+# Second pass shared by the two-pass and min-trades fixtures
+_WEAKER_PASS = dict(
+    result=1.15,
+    profit=1200.0,
+    profit_factor=1.6,
+    expected_payoff=12.0,
+    max_drawdown_pct=15.0,
+    sharpe_ratio=1.0,
+    recovery_factor=6.0,
+    win_rate=60.0,
+)
+
 
 class TestMT5XMLParser(unittest.TestCase):
     """Test MT5 XML report parsing."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.test_dir = Path(tempfile.mkdtemp())
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary root shared by all tests in the class."""
+        # Imported here so runs that deselect this class skip tempfile's imports
+        import tempfile
 
-    def tearDown(self):
-        """Clean up test files."""
-        for file in self.test_dir.glob("*.xml"):
-            file.unlink()
-        self.test_dir.rmdir()
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.test_root = Path(cls._tmp.name)
+
+        # Read-only fixtures shared by several tests
+        cls.single_pass_xml = _write_optimization_xml(
+            cls.test_root / "single_pass.xml", [_pass()]
+        )
+        cls.two_pass_xml = _write_optimization_xml(cls.test_root / "two_pass.xml", [
+            _pass(parameters={'FastMA': 10, 'SlowMA': 30}),
+            _pass(**_WEAKER_PASS, total_trades=80, parameters={'FastMA': 15, 'SlowMA': 40}),
+        ])
+        cls.filtered_xml = _write_optimization_xml(cls.test_root / "filtered.xml", [
+            _pass(),
+            _pass(**_WEAKER_PASS, total_trades=5),  # Below minimum
+        ])
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary root and everything under it."""
+        cls._tmp.cleanup()
+
+    def setUp(self):
+        """Give each test its own subdirectory so file names don't collide."""
+        self.test_dir = self.test_root / uuid.uuid4().hex
+        self.test_dir.mkdir()
 
     def create_optimization_xml(self, passes_data: list, suffix: str = "") -> Path:
         """Create a mock optimization XML file.
@@ -39,78 +178,7 @@ class TestMT5XMLParser(unittest.TestCase):
             Path to created XML file
         """
         filename = f"optimization{suffix}.xml" if suffix else "optimization.xml"
-        xml_path = self.test_dir / filename
-
-        # Build XML structure
-        root = ET.Element(
-            '{urn:schemas-microsoft-com:office:spreadsheet}Workbook'
-        )
-
-        # Create worksheet
-        worksheet = ET.SubElement(
-            root,
-            '{urn:schemas-microsoft-com:office:spreadsheet}Worksheet',
-            attrib={'{urn:schemas-microsoft-com:office:spreadsheet}Name': 'Optimization Graph'}
-        )
-
-        table = ET.SubElement(worksheet, '{urn:schemas-microsoft-com:office:spreadsheet}Table')
-
-        # Header row
-        header_row = ET.SubElement(table, '{urn:schemas-microsoft-com:office:spreadsheet}Row')
-        headers = [
-            'Pass', 'Result', 'Profit', 'Profit Factor', 'Expected Payoff',
-            'Drawdown %', 'Trades', 'Sharpe Ratio', 'Recovery Factor', 'Win %'
-        ]
-
-        # Add parameter columns from first pass
-        if passes_data:
-            for param_name in passes_data[0].get('parameters', {}).keys():
-                headers.append(param_name)
-
-        for header in headers:
-            cell = ET.SubElement(header_row, '{urn:schemas-microsoft-com:office:spreadsheet}Cell')
-            data = ET.SubElement(
-                cell,
-                '{urn:schemas-microsoft-com:office:spreadsheet}Data',
-                attrib={'{urn:schemas-microsoft-com:office:spreadsheet}Type': 'String'}
-            )
-            data.text = header
-
-        # Data rows
-        for idx, pass_info in enumerate(passes_data, start=1):
-            row = ET.SubElement(table, '{urn:schemas-microsoft-com:office:spreadsheet}Row')
-
-            values = [
-                str(idx),
-                str(pass_info['result']),
-                str(pass_info['profit']),
-                str(pass_info['profit_factor']),
-                str(pass_info['expected_payoff']),
-                str(pass_info['max_drawdown_pct']),
-                str(pass_info['total_trades']),
-                str(pass_info['sharpe_ratio']),
-                str(pass_info['recovery_factor']),
-                str(pass_info['win_rate'])
-            ]
-
-            # Add parameter values
-            for param_value in pass_info.get('parameters', {}).values():
-                values.append(str(param_value))
-
-            for value in values:
-                cell = ET.SubElement(row, '{urn:schemas-microsoft-com:office:spreadsheet}Cell')
-                data = ET.SubElement(
-                    cell,
-                    '{urn:schemas-microsoft-com:office:spreadsheet}Data',
-                    attrib={'{urn:schemas-microsoft-com:office:spreadsheet}Type': 'Number'}
-                )
-                data.text = value
-
-        # Write XML
-        tree = ET.ElementTree(root)
-        tree.write(xml_path, encoding='utf-8', xml_declaration=True)
-
-        return xml_path
+        return _write_optimization_xml(self.test_dir / filename, passes_data)
 
     def create_backtest_xml(self, metrics: dict) -> Path:
         """Create a mock backtest XML file.
@@ -123,75 +191,13 @@ class TestMT5XMLParser(unittest.TestCase):
         """
         xml_path = self.test_dir / "backtest.xml"
 
-        root = ET.Element(
-            '{urn:schemas-microsoft-com:office:spreadsheet}Workbook'
-        )
-
-        worksheet = ET.SubElement(
-            root,
-            '{urn:schemas-microsoft-com:office:spreadsheet}Worksheet',
-            attrib={'{urn:schemas-microsoft-com:office:spreadsheet}Name': 'Result'}
-        )
-
-        table = ET.SubElement(worksheet, '{urn:schemas-microsoft-com:office:spreadsheet}Table')
-
-        # Add metric rows
-        for key, value in metrics.items():
-            row = ET.SubElement(table, '{urn:schemas-microsoft-com:office:spreadsheet}Row')
-
-            # Key cell
-            key_cell = ET.SubElement(row, '{urn:schemas-microsoft-com:office:spreadsheet}Cell')
-            key_data = ET.SubElement(
-                key_cell,
-                '{urn:schemas-microsoft-com:office:spreadsheet}Data',
-                attrib={'{urn:schemas-microsoft-com:office:spreadsheet}Type': 'String'}
-            )
-            key_data.text = key
-
-            # Value cell
-            value_cell = ET.SubElement(row, '{urn:schemas-microsoft-com:office:spreadsheet}Cell')
-            value_data = ET.SubElement(
-                value_cell,
-                '{urn:schemas-microsoft-com:office:spreadsheet}Data',
-                attrib={'{urn:schemas-microsoft-com:office:spreadsheet}Type': 'String'}
-            )
-            value_data.text = str(value)
-
-        tree = ET.ElementTree(root)
-        tree.write(xml_path, encoding='utf-8', xml_declaration=True)
+        xml_path.write_bytes(_backtest_bytes(metrics))
 
         return xml_path
 
     def test_parse_optimization_results(self):
         """Test parsing optimization XML."""
-        passes_data = [
-            {
-                'result': 1.25,
-                'profit': 1500.0,
-                'profit_factor': 1.8,
-                'expected_payoff': 15.0,
-                'max_drawdown_pct': 12.5,
-                'total_trades': 100,
-                'sharpe_ratio': 1.2,
-                'recovery_factor': 7.5,
-                'win_rate': 65.0,
-                'parameters': {'FastMA': 10, 'SlowMA': 30}
-            },
-            {
-                'result': 1.15,
-                'profit': 1200.0,
-                'profit_factor': 1.6,
-                'expected_payoff': 12.0,
-                'max_drawdown_pct': 15.0,
-                'total_trades': 80,
-                'sharpe_ratio': 1.0,
-                'recovery_factor': 6.0,
-                'win_rate': 60.0,
-                'parameters': {'FastMA': 15, 'SlowMA': 40}
-            }
-        ]
-
-        xml_path = self.create_optimization_xml(passes_data)
+        xml_path = self.two_pass_xml
         parser = MT5XMLParser(xml_path)
         results = parser.parse_optimization_results(min_trades=10)
 
@@ -215,34 +221,7 @@ class TestMT5XMLParser(unittest.TestCase):
 
     def test_min_trades_filter(self):
         """Test filtering by minimum trades."""
-        passes_data = [
-            {
-                'result': 1.25,
-                'profit': 1500.0,
-                'profit_factor': 1.8,
-                'expected_payoff': 15.0,
-                'max_drawdown_pct': 12.5,
-                'total_trades': 100,
-                'sharpe_ratio': 1.2,
-                'recovery_factor': 7.5,
-                'win_rate': 65.0,
-                'parameters': {}
-            },
-            {
-                'result': 1.15,
-                'profit': 1200.0,
-                'profit_factor': 1.6,
-                'expected_payoff': 12.0,
-                'max_drawdown_pct': 15.0,
-                'total_trades': 5,  # Below minimum
-                'sharpe_ratio': 1.0,
-                'recovery_factor': 6.0,
-                'win_rate': 60.0,
-                'parameters': {}
-            }
-        ]
-
-        xml_path = self.create_optimization_xml(passes_data)
+        xml_path = self.filtered_xml
         parser = MT5XMLParser(xml_path)
         results = parser.parse_optimization_results(min_trades=10)
 
@@ -269,8 +248,7 @@ class TestMT5XMLParser(unittest.TestCase):
             'Maximum consecutive losses': '5'
         }
 
-        xml_path = self.create_backtest_xml(metrics)
-        parser = MT5XMLParser(xml_path)
+        parser = MT5XMLParser.from_bytes(_backtest_bytes(metrics))
         result = parser.parse_backtest_metrics()
 
         self.assertIsNotNone(result)
@@ -286,6 +264,9 @@ class TestMT5XMLParser(unittest.TestCase):
         self.assertEqual(result.max_consecutive_wins, 8)
         self.assertEqual(result.max_consecutive_losses, 5)
 
+        # The path-based convenience function parses the same report identically
+        self.assertEqual(parse_backtest_xml(self.create_backtest_xml(metrics)), result)
+
     def test_merge_forward_metrics(self):
         """Test merging forward testing metrics."""
         # Create back period results
@@ -344,27 +325,25 @@ class TestMT5XMLParser(unittest.TestCase):
 
     def test_convenience_functions(self):
         """Test convenience functions."""
-        passes_data = [
-            {
-                'result': 1.25,
-                'profit': 1500.0,
-                'profit_factor': 1.8,
-                'expected_payoff': 15.0,
-                'max_drawdown_pct': 12.5,
-                'total_trades': 100,
-                'sharpe_ratio': 1.2,
-                'recovery_factor': 7.5,
-                'win_rate': 65.0,
-                'parameters': {}
-            }
-        ]
-
-        xml_path = self.create_optimization_xml(passes_data)
+        xml_path = self.single_pass_xml
         results = parse_optimization_xml(xml_path, min_trades=10)
 
         self.assertEqual(len(results), 1)
         self.assertAlmostEqual(results[0].profit, 1500.0)
 
+    def test_from_bytes_matches_file_parser(self):
+        """Test the in-memory constructor parses like the file-based one."""
+        parser = MT5XMLParser.from_bytes(self.two_pass_xml.read_bytes())
+
+        file_parser = MT5XMLParser(self.two_pass_xml)
+
+        self.assertIsNone(parser.xml_path)
+        self.assertEqual(vars(parser).keys(), vars(file_parser).keys())
+        self.assertEqual(
+            parser.parse_optimization_results(min_trades=10),
+            file_parser.parse_optimization_results(min_trades=10)
+        )
+
     def test_missing_file(self):
         """Test handling of missing XML file."""
         with self.assertRaises(FileNotFoundError):
@@ -372,8 +351,7 @@ class TestMT5XMLParser(unittest.TestCase):
 
     def test_empty_results(self):
         """Test parsing XML with no data rows."""
-        xml_path = self.create_optimization_xml([])
-        parser = MT5XMLParser(xml_path)
+        parser = _optimization_parser([])
         results = parser.parse_optimization_results()
 
         self.assertEqual(len(results), 0)
@@ -399,8 +377,7 @@ class TestMT5XMLParser(unittest.TestCase):
             }
         ]
 
-        xml_path = self.create_optimization_xml(passes_data)
-        parser = MT5XMLParser(xml_path)
+        parser = _optimization_parser(passes_data)
         results = parser.parse_optimization_results(min_trades=10)
 
         self.assertEqual(len(results), 1)
@@ -1,20 +1,25 @@
 """Test state transitions for WorkflowState."""
 
+import logging
+import math
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from ea_stress.models import WorkflowState, WorkflowStatus, StepStatus
 
+log = logging.getLogger(__name__)
+
 # Use ASCII-compatible checkmark
 CHECK = "[OK]"
 
 
 def test_valid_transitions():
     """Test valid state transitions."""
-    print("Testing valid state transitions...")
+    log.debug("Testing valid state transitions...")
 
     # Create a workflow in PENDING state
     state = WorkflowState(
@@ -25,36 +30,36 @@ def test_valid_transitions():
     )
 
     assert state.status == WorkflowStatus.PENDING
-    print("[OK] Initial state: PENDING")
+    log.debug("[OK] Initial state: PENDING")
 
     # PENDING -> RUNNING
     assert state.start() == True
     assert state.status == WorkflowStatus.RUNNING
     assert state.started_at is not None
-    print("[OK] PENDING -> RUNNING (via start())")
+    log.debug("[OK] PENDING -> RUNNING (via start())")
 
     # RUNNING -> PAUSED
     assert state.pause() == True
     assert state.status == WorkflowStatus.PAUSED
-    print("[OK] RUNNING -> PAUSED (via pause())")
+    log.debug("[OK] RUNNING -> PAUSED (via pause())")
 
     # PAUSED -> RUNNING
     assert state.resume() == True
     assert state.status == WorkflowStatus.RUNNING
-    print("[OK] PAUSED -> RUNNING (via resume())")
+    log.debug("[OK] PAUSED -> RUNNING (via resume())")
 
     # RUNNING -> COMPLETED
     assert state.complete() == True
     assert state.status == WorkflowStatus.COMPLETED
     assert state.completed_at is not None
-    print("[OK] RUNNING -> COMPLETED (via complete())")
+    log.debug("[OK] RUNNING -> COMPLETED (via complete())")
 
-    print("\nAll valid transitions passed!")
+    log.debug("All valid transitions passed!")
 
 
 def test_invalid_transitions():
     """Test invalid state transitions are rejected."""
-    print("\nTesting invalid state transitions...")
+    log.debug("Testing invalid state transitions...")
 
     # Try to complete from PENDING (should fail)
     state = WorkflowState(
@@ -68,7 +73,7 @@ def test_invalid_transitions():
     assert result == False
     assert state.status == WorkflowStatus.PENDING
     assert len(state.warnings) > 0
-    print("[OK] PENDING -> COMPLETED rejected")
+    log.debug("[OK] PENDING -> COMPLETED rejected")
 
     # Try to transition from COMPLETED (terminal state)
     state2 = WorkflowState(
@@ -81,14 +86,14 @@ def test_invalid_transitions():
     result = state2.transition_to(WorkflowStatus.RUNNING)
     assert result == False
     assert state2.status == WorkflowStatus.COMPLETED
-    print("[OK] COMPLETED -> RUNNING rejected (terminal state)")
+    log.debug("[OK] COMPLETED -> RUNNING rejected (terminal state)")
 
-    print("\nAll invalid transitions properly rejected!")
+    log.debug("All invalid transitions properly rejected!")
 
 
 def test_failure_and_retry():
     """Test failure state and retry logic."""
-    print("\nTesting failure and retry...")
+    log.debug("Testing failure and retry...")
 
     state = WorkflowState(
         workflow_id="test-004",
@@ -99,26 +104,26 @@ def test_failure_and_retry():
 
     state.start()
     assert state.status == WorkflowStatus.RUNNING
-    print("[OK] Started workflow")
+    log.debug("[OK] Started workflow")
 
     # Fail with error message
     assert state.fail("Test error occurred") == True
     assert state.status == WorkflowStatus.FAILED
     assert len(state.errors) > 0
     assert state.completed_at is not None
-    print("[OK] RUNNING -> FAILED (via fail())")
+    log.debug("[OK] RUNNING -> FAILED (via fail())")
 
     # Retry from failed state
     assert state.retry() == True
     assert state.status == WorkflowStatus.RUNNING
-    print("[OK] FAILED -> RUNNING (via retry())")
+    log.debug("[OK] FAILED -> RUNNING (via retry())")
 
-    print("\nFailure and retry logic works correctly!")
+    log.debug("Failure and retry logic works correctly!")
 
 
 def test_step_transitions():
     """Test step-level status updates."""
-    print("\nTesting step-level transitions...")
+    log.debug("Testing step-level transitions...")
 
     state = WorkflowState(
         workflow_id="test-005",
@@ -131,27 +136,27 @@ def test_step_transitions():
     state.update_step("step01", StepStatus.RUNNING)
     assert state.get_step_status("step01") == StepStatus.RUNNING
     assert state.steps["step01"].started_at is not None
-    print("[OK] Step marked as RUNNING")
+    log.debug("[OK] Step marked as RUNNING")
 
     # Complete step
     state.update_step("step01", StepStatus.COMPLETED, metadata={"result": "success"})
     assert state.get_step_status("step01") == StepStatus.COMPLETED
     assert state.steps["step01"].completed_at is not None
     assert state.is_step_completed("step01") == True
-    print("[OK] Step marked as COMPLETED")
+    log.debug("[OK] Step marked as COMPLETED")
 
     # Fail a step
     state.update_step("step02", StepStatus.FAILED, error="Step failed")
     assert state.get_step_status("step02") == StepStatus.FAILED
     assert state.steps["step02"].error == "Step failed"
-    print("[OK] Step marked as FAILED with error")
+    log.debug("[OK] Step marked as FAILED with error")
 
-    print("\nStep-level transitions work correctly!")
+    log.debug("Step-level transitions work correctly!")
 
 
 def test_persistence_with_transitions():
     """Test that state transitions persist correctly."""
-    print("\nTesting persistence with state transitions...")
+    log.debug("Testing persistence with state transitions...")
 
     import tempfile
 
@@ -173,27 +178,125 @@ def test_persistence_with_transitions():
 
         # Save state
         state.save(temp_path)
-        print("[OK] Saved workflow state")
+        log.debug("[OK] Saved workflow state")
 
         # Load and verify
         loaded = WorkflowState.load(temp_path)
         assert loaded.status == WorkflowStatus.PAUSED
         assert loaded.started_at is not None
         assert loaded.is_step_completed("step01") == True
-        print("[OK] Loaded workflow state with correct status and steps")
+        log.debug("[OK] Loaded workflow state with correct status and steps")
 
     finally:
         temp_path.unlink(missing_ok=True)
 
-    print("\nPersistence with transitions works correctly!")
+    log.debug("Persistence with transitions works correctly!")
+
+
+def test_persistence_preserves_unicode():
+    """Test that saved state keeps non-ASCII text as UTF-8 and round-trips."""
+    log.debug("Testing persistence of non-ASCII state...")
+
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        temp_path = Path(tmpdir) / "state.json"
+
+        state = WorkflowState(
+            workflow_id="test-007",
+            ea_name="TestEA €£¥",
+            ea_path="/path/to/test.mq5",
+            status=WorkflowStatus.PENDING
+        )
+        state.update_step("step01", StepStatus.COMPLETED, metadata={"note": "ñ"})
+        state.save(temp_path)
+
+        assert "TestEA €£¥".encode("utf-8") in temp_path.read_bytes()
+
+        loaded = WorkflowState.load(temp_path)
+        assert loaded.ea_name == "TestEA €£¥"
+        assert loaded.steps["step01"].metadata == {"note": "ñ"}
+        log.debug("[OK] Non-ASCII state saved as UTF-8 and loaded back")
+
+
+def _non_finite_state():
+    state = WorkflowState(
+        workflow_id="test-009",
+        ea_name="TestEA",
+        ea_path="/path/to/test.mq5",
+        status=WorkflowStatus.PENDING
+    )
+    state.update_step(
+        "step05",
+        StepStatus.COMPLETED,
+        metadata={"profit_factor": float('inf'), "sharpe": float('nan')}
+    )
+    return state
+
+
+def _assert_non_finite_round_trip(temp_path):
+    loaded = WorkflowState.load(temp_path)
+    metadata = loaded.steps["step05"].metadata
+    assert metadata["profit_factor"] == float('inf')
+    assert math.isnan(metadata["sharpe"])
+
+
+def test_persistence_keeps_non_finite_metrics():
+    """Test inf/NaN metrics survive a save/load round trip (orjson installed)."""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        temp_path = Path(tmpdir) / "state.json"
+        _non_finite_state().save(temp_path)
+
+        assert b"Infinity" in temp_path.read_bytes()
+        _assert_non_finite_round_trip(temp_path)
+        log.debug("[OK] Non-finite metrics round-trip")
+
+
+def test_persistence_keeps_non_finite_metrics_without_orjson():
+    """Test inf/NaN metrics survive a save/load round trip via stdlib json."""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        temp_path = Path(tmpdir) / "state.json"
+        with patch('ea_stress.jsonio.orjson', None):
+            _non_finite_state().save(temp_path)
+            _assert_non_finite_round_trip(temp_path)
+
+        # A stdlib-written checkpoint still loads once orjson is available
+        _assert_non_finite_round_trip(temp_path)
+        log.debug("[OK] Non-finite metrics round-trip without orjson")
+
+
+def test_state_models_are_slotted():
+    """Test workflow state records carry no per-instance __dict__."""
+    state = WorkflowState(
+        workflow_id="test-008",
+        ea_name="TestEA",
+        ea_path="/path/to/test.mq5",
+        status=WorkflowStatus.PENDING
+    )
+    state.update_step("step01", StepStatus.RUNNING)
+
+    assert not hasattr(state, "__dict__")
+    assert not hasattr(state.steps["step01"], "__dict__")
+    assert WorkflowState.from_dict(state.to_dict()).to_dict() == state.to_dict()
+    log.debug("[OK] WorkflowState and StepResult are slotted")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+
     test_valid_transitions()
     test_invalid_transitions()
     test_failure_and_retry()
     test_step_transitions()
     test_persistence_with_transitions()
+    test_persistence_preserves_unicode()
+    test_persistence_keeps_non_finite_metrics()
+    test_persistence_keeps_non_finite_metrics_without_orjson()
+    test_state_models_are_slotted()
 
     print("\n" + "="*50)
     print("All state transition tests passed! [OK]")
@@ -4,56 +4,65 @@ Tests for Step 1: Load EA
 
 import os
 import tempfile
+import uuid
 from pathlib import Path
 import unittest
 
 from ea_stress.workflow.steps.step01_load import load_ea, validate_ea_path, LoadResult
 
 
-class TestStep01Load(unittest.TestCase):
-    """Test cases for EA load step."""
+# (filename, body, gate, is_mq5, is_mq4, error fragment or None)
+_LOAD_CASES = (
+    ("test_ea.mq5", "// Test EA\ninput int Period = 14;\n", True, True, False, None),
+    ("test_ea.mq4", "// Test EA MQ4\ninput int Period = 14;\n", True, False, True, None),
+    ("test.MQ5", "// Test\n", True, True, False, None),
+    ("test_ea.txt", "// Not an EA file\n", False, False, False, "Invalid file extension"),
+    ("test.cpp", "// C++ file\n", False, False, False, "Invalid file extension"),
+)
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        """Clean up test files."""
-        import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-
-    def test_load_valid_mq5_file(self):
-        """Test loading a valid .mq5 file."""
-        # Create a test .mq5 file
-        test_file = os.path.join(self.temp_dir, "test_ea.mq5")
-        with open(test_file, 'w', encoding='utf-8') as f:
-            f.write("// Test EA\ninput int Period = 14;\n")
 
-        result = load_ea(test_file)
-
-        self.assertTrue(result.file_exists)
-        self.assertTrue(result.is_mq5)
-        self.assertFalse(result.is_mq4)
-        self.assertIsNone(result.error)
-        self.assertTrue(result.passed_gate())
-        self.assertGreater(result.file_size, 0)
-        self.assertEqual(result.file_path, test_file)
+class TestStep01Load(unittest.TestCase):
+    """Test cases for EA load step."""
 
-    def test_load_valid_mq4_file(self):
-        """Test loading a valid .mq4 file."""
-        # Create a test .mq4 file
-        test_file = os.path.join(self.temp_dir, "test_ea.mq4")
-        with open(test_file, 'w', encoding='utf-8') as f:
-            f.write("// Test EA MQ4\ninput int Period = 14;\n")
+    @classmethod
+    def setUpClass(cls):
+        """Create one temp root for the class, on tmpfs when available."""
+        ram_dir = os.environ.get("XDG_RUNTIME_DIR", "/dev/shm")
+        cls._tmp = tempfile.TemporaryDirectory(
+            dir=ram_dir if os.path.isdir(ram_dir) and os.access(ram_dir, os.W_OK) else None
+        )
 
-        result = load_ea(test_file)
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temp root and everything under it."""
+        cls._tmp.cleanup()
 
-        self.assertTrue(result.file_exists)
-        self.assertFalse(result.is_mq5)
-        self.assertTrue(result.is_mq4)
-        self.assertIsNone(result.error)
-        self.assertTrue(result.passed_gate())
+    def setUp(self):
+        """Give each test its own subdirectory under the shared root."""
+        self.temp_dir = os.path.join(self._tmp.name, uuid.uuid4().hex)
+        os.mkdir(self.temp_dir)
+
+    def test_load_extension_matrix(self):
+        """Test loading files of each extension: flags, gate and error."""
+        for filename, body, gate, is_mq5, is_mq4, error in _LOAD_CASES:
+            with self.subTest(filename=filename):
+                test_file = os.path.join(self.temp_dir, filename)
+                with open(test_file, 'w', encoding='utf-8') as f:
+                    f.write(body)
+
+                result = load_ea(test_file)
+
+                self.assertIs(result.file_exists, gate)
+                self.assertIs(result.passed_gate(), gate)
+                self.assertIs(result.is_mq5, is_mq5)
+                self.assertIs(result.is_mq4, is_mq4)
+                self.assertGreater(result.file_size, 0)
+                self.assertEqual(result.file_path, test_file)
+                if error is None:
+                    self.assertIsNone(result.error)
+                else:
+                    self.assertIsNotNone(result.error)
+                    self.assertIn(error, result.error)
 
     def test_load_nonexistent_file(self):
         """Test loading a file that doesn't exist."""
@@ -75,19 +84,6 @@ class TestStep01Load(unittest.TestCase):
         self.assertIsNotNone(result.error)
         self.assertIn("not a file", result.error)
 
-    def test_load_invalid_extension(self):
-        """Test loading a file with invalid extension."""
-        test_file = os.path.join(self.temp_dir, "test_ea.txt")
-        with open(test_file, 'w', encoding='utf-8') as f:
-            f.write("// Not an EA file\n")
-
-        result = load_ea(test_file)
-
-        self.assertFalse(result.file_exists)
-        self.assertFalse(result.passed_gate())
-        self.assertIsNotNone(result.error)
-        self.assertIn("Invalid file extension", result.error)
-
     def test_load_empty_file(self):
         """Test loading an empty but valid .mq5 file."""
         test_file = os.path.join(self.temp_dir, "empty.mq5")
@@ -142,6 +138,12 @@ class TestStep01Load(unittest.TestCase):
         self.assertIn('gate_passed', result_dict)
         self.assertTrue(result_dict['gate_passed'])
 
+    def test_load_result_has_no_instance_dict(self):
+        """Test LoadResult is slotted and carries no per-instance __dict__."""
+        result = load_ea(os.path.join(self.temp_dir, "nonexistent.mq5"))
+
+        self.assertFalse(hasattr(result, '__dict__'))
+
     def test_validate_ea_path_helper_valid(self):
         """Test validate_ea_path helper with valid file."""
         test_file = os.path.join(self.temp_dir, "test.mq5")
@@ -175,31 +177,11 @@ class TestStep01Load(unittest.TestCase):
         self.assertTrue(result.file_exists)
         self.assertTrue(result.passed_gate())
 
-    def test_load_case_insensitive_extension(self):
-        """Test that extension matching is case-insensitive."""
-        # Test .MQ5
-        test_file_upper = os.path.join(self.temp_dir, "test.MQ5")
-        with open(test_file_upper, 'w', encoding='utf-8') as f:
-            f.write("// Test\n")
-
-        result = load_ea(test_file_upper)
-        self.assertTrue(result.file_exists)
-        self.assertTrue(result.is_mq5)
-
     def test_gate_failure_on_nonexistent(self):
         """Test that gate fails for nonexistent file."""
         result = load_ea("nonexistent.mq5")
         self.assertFalse(result.passed_gate())
 
-    def test_gate_failure_on_invalid_extension(self):
-        """Test that gate fails for invalid extension."""
-        test_file = os.path.join(self.temp_dir, "test.cpp")
-        with open(test_file, 'w', encoding='utf-8') as f:
-            f.write("// C++ file\n")
-
-        result = load_ea(test_file)
-        self.assertFalse(result.passed_gate())
-
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,28 +2,53 @@
 Tests for Step 1B: OnTester function injection
 """
 
+import json
 import os
 import tempfile
+from pathlib import Path
+
 import pytest
 from ea_stress.workflow.steps.step01b_ontester import (
     inject_ontester,
     OnTesterResult,
-    validate_ontester_injection
+    validate_ontester_injection,
+    _generate_ontester_code
 )
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+# Components every generated OnTester block must contain
+_REQUIRED_ONTESTER_TOKENS = (
+    # System marker and main OnTester function
+    b"EA_STRESS_ONTESTER_INJECTED",
+    b"double OnTester()",
+    # Required statistics
+    b"TesterStatistics(STAT_PROFIT)",
+    b"TesterStatistics(STAT_PROFIT_FACTOR)",
+    b"TesterStatistics(STAT_EQUITY_DDREL_PERCENT)",
+    b"TesterStatistics(STAT_TRADES)",
+    # Gates: min trades, profit > 0
+    b"return -1000.0",
+    b"return -500.0",
+    # R^2 calculation
+    b"CalculateRSquared()",
+    b"double CalculateRSquared()",
+    # Formula components
+    b"dd_factor",
+    b"pf_bonus",
+    b"trade_scale",
+    b"r_squared",
+    # Linear regression
+    b"sum_x",
+    b"sum_y",
+    b"sum_xy",
+    b"sum_x2",
+    b"ss_total",
+    b"ss_residual",
+)
 
 
-@pytest.fixture
-def sample_ea_without_ontester(temp_dir):
-    """Create a sample EA without OnTester function."""
-    ea_path = os.path.join(temp_dir, "TestEA.mq5")
-    content = """
+# EA sources used by the fixtures and tests, pre-encoded as UTF-8
+_EA_NO_ONTESTER = b"""
 //+------------------------------------------------------------------+
 //| Test EA without OnTester
 //+------------------------------------------------------------------+
@@ -47,16 +72,8 @@ void OnTick()
     // Trading logic here
 }
 """
-    with open(ea_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    return ea_path
-
 
-@pytest.fixture
-def sample_ea_with_our_ontester(temp_dir):
-    """Create a sample EA with our OnTester already injected."""
-    ea_path = os.path.join(temp_dir, "TestEAWithOurs.mq5")
-    content = """
+_EA_OUR_ONTESTER = b"""
 //+------------------------------------------------------------------+
 //| Test EA with our OnTester
 //+------------------------------------------------------------------+
@@ -81,16 +98,8 @@ double OnTester()
     return 100.0;
 }
 """
-    with open(ea_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    return ea_path
-
 
-@pytest.fixture
-def sample_ea_with_external_ontester(temp_dir):
-    """Create a sample EA with external OnTester (conflict)."""
-    ea_path = os.path.join(temp_dir, "TestEAWithExternal.mq5")
-    content = """
+_EA_EXTERNAL_ONTESTER = b"""
 //+------------------------------------------------------------------+
 //| Test EA with external OnTester
 //+------------------------------------------------------------------+
@@ -115,8 +124,85 @@ double OnTester()
     return TesterStatistics(STAT_PROFIT);
 }
 """
-    with open(ea_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+
+_EA_COMMENTED_ONTESTER = b"""
+//+------------------------------------------------------------------+
+//| Test EA with commented OnTester
+//+------------------------------------------------------------------+
+
+int OnInit()
+{
+    return(INIT_SUCCEEDED);
+}
+
+// double OnTester()
+// {
+//     return 100.0;
+// }
+
+void OnTick()
+{
+    // Trading logic
+}
+"""
+
+_EA_UNICODE = """
+//+------------------------------------------------------------------+
+//| Test EA with Unicode: €£¥
+//+------------------------------------------------------------------+
+
+input string Comment = "Testing: €£¥";
+
+int OnInit()
+{
+    return(INIT_SUCCEEDED);
+}
+
+void OnTick()
+{
+    // Trading logic
+}
+""".encode("utf-8")
+
+
+def _write_ea(path, data: bytes) -> None:
+    """Write pre-encoded EA source with a single os.write."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o600)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for test files."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def sample_ea_without_ontester(temp_dir):
+    """Create a sample EA without OnTester function."""
+    ea_path = temp_dir / "TestEA.mq5"
+    _write_ea(ea_path, _EA_NO_ONTESTER)
+    return ea_path
+
+
+@pytest.fixture
+def sample_ea_with_our_ontester(temp_dir):
+    """Create a sample EA with our OnTester already injected."""
+    ea_path = temp_dir / "TestEAWithOurs.mq5"
+    _write_ea(ea_path, _EA_OUR_ONTESTER)
+    return ea_path
+
+
+@pytest.fixture
+def sample_ea_with_external_ontester(temp_dir):
+    """Create a sample EA with external OnTester (conflict)."""
+    ea_path = temp_dir / "TestEAWithExternal.mq5"
+    _write_ea(ea_path, _EA_EXTERNAL_ONTESTER)
     return ea_path
 
 
@@ -127,7 +213,7 @@ def test_inject_ontester_new_ea(sample_ea_without_ontester, temp_dir):
     assert result.status == "injected"
     assert result.passed_gate() is True
     assert result.modified_ea_path is not None
-    assert os.path.exists(result.modified_ea_path)
+    assert Path(result.modified_ea_path).exists()
     assert result.has_existing_ontester is False
     assert result.existing_ontester_is_ours is False
     assert result.error_message is None
@@ -149,10 +235,50 @@ def test_inject_ontester_already_present(sample_ea_with_our_ontester, temp_dir):
     assert result.passed_gate() is True
     assert result.has_existing_ontester is True
     assert result.existing_ontester_is_ours is True
-    assert result.modified_ea_path == sample_ea_with_our_ontester
+    assert result.modified_ea_path == str(sample_ea_with_our_ontester)
     assert result.error_message is None
 
 
+def test_inject_ontester_already_present_large_ea(temp_dir):
+    """Test that a large EA injected by us is detected from its tail."""
+    ea_path = temp_dir / "TestEALarge.mq5"
+    padding = b"// filler line for a large EA source file\n" * 2000
+    _write_ea(ea_path, padding + _EA_OUR_ONTESTER)
+
+    result = inject_ontester(ea_path, temp_dir)
+
+    assert result.status == "already_present"
+    assert result.existing_ontester_is_ours is True
+    assert result.modified_ea_path == str(ea_path)
+
+
+def test_inject_ontester_conflict_in_large_ea(temp_dir):
+    """Test that an external OnTester early in a large EA is still a conflict."""
+    ea_path = temp_dir / "TestEALargeExternal.mq5"
+    padding = b"// filler line for a large EA source file\n" * 2000
+    _write_ea(ea_path, _EA_EXTERNAL_ONTESTER + padding)
+
+    result = inject_ontester(ea_path, temp_dir)
+
+    assert result.status == "conflict"
+
+
+def test_reinject_own_output_is_already_present(temp_dir):
+    """Test that re-running injection on our own output is already_present."""
+    for name, body in (("TestEASmall.mq5", _EA_NO_ONTESTER),
+                       ("TestEABig.mq5", _EA_NO_ONTESTER * 200)):
+        ea_path = temp_dir / name
+        _write_ea(ea_path, body)
+
+        injected = inject_ontester(ea_path, temp_dir / "out")
+        assert injected.status == "injected"
+
+        result = inject_ontester(injected.modified_ea_path, temp_dir / "out")
+        assert result.status == "already_present", name
+        assert result.existing_ontester_is_ours is True
+        assert validate_ontester_injection(injected.modified_ea_path).status == "already_present"
+
+
 def test_inject_ontester_conflict(sample_ea_with_external_ontester, temp_dir):
     """Test detecting conflict with external OnTester."""
     result = inject_ontester(sample_ea_with_external_ontester, temp_dir)
@@ -178,9 +304,16 @@ def test_inject_ontester_custom_min_trades(sample_ea_without_ontester, temp_dir)
         assert "total_trades < 20" in content
 
 
+def test_generate_ontester_code_cached_per_min_trades():
+    """Test that the OnTester block is rendered once per min_trades value."""
+    assert _generate_ontester_code(15) is _generate_ontester_code(15)
+    assert "total_trades < 15" in _generate_ontester_code(15)
+    assert "total_trades < 16" in _generate_ontester_code(16)
+
+
 def test_inject_ontester_file_not_found(temp_dir):
     """Test handling of non-existent file."""
-    non_existent = os.path.join(temp_dir, "NonExistent.mq5")
+    non_existent = temp_dir / "NonExistent.mq5"
     result = inject_ontester(non_existent, temp_dir)
 
     assert result.status == "error"
@@ -190,14 +323,14 @@ def test_inject_ontester_file_not_found(temp_dir):
 
 def test_inject_ontester_creates_output_dir(sample_ea_without_ontester, temp_dir):
     """Test that output directory is created if it doesn't exist."""
-    output_dir = os.path.join(temp_dir, "subdir", "output")
-    assert not os.path.exists(output_dir)
+    output_dir = temp_dir / "subdir" / "output"
+    assert not output_dir.exists()
 
     result = inject_ontester(sample_ea_without_ontester, output_dir)
 
     assert result.status == "injected"
-    assert os.path.exists(output_dir)
-    assert os.path.exists(result.modified_ea_path)
+    assert output_dir.exists()
+    assert Path(result.modified_ea_path).exists()
 
 
 def test_ontester_result_to_dict(sample_ea_without_ontester, temp_dir):
@@ -214,81 +347,57 @@ def test_ontester_result_to_dict(sample_ea_without_ontester, temp_dir):
     assert "existing_ontester_is_ours" in result_dict
 
 
-def test_ontester_code_structure(sample_ea_without_ontester, temp_dir):
-    """Test that generated OnTester code has all required components."""
+def test_ontester_result_paths_are_strings(sample_ea_without_ontester, temp_dir):
+    """Test that Path inputs still yield str paths in the result."""
     result = inject_ontester(sample_ea_without_ontester, temp_dir)
 
-    with open(result.modified_ea_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    assert isinstance(result.original_ea_path, str)
+    assert isinstance(result.modified_ea_path, str)
+    json.dumps(result.to_dict())
 
-        # Check for system marker
-        assert "EA_STRESS_ONTESTER_INJECTED" in content
-
-        # Check for main OnTester function
-        assert "double OnTester()" in content
-
-        # Check for all required statistics
-        assert "TesterStatistics(STAT_PROFIT)" in content
-        assert "TesterStatistics(STAT_PROFIT_FACTOR)" in content
-        assert "TesterStatistics(STAT_EQUITY_DDREL_PERCENT)" in content
-        assert "TesterStatistics(STAT_TRADES)" in content
 
-        # Check for gates
-        assert "return -1000.0" in content  # Min trades gate
-        assert "return -500.0" in content   # Profit > 0 gate
-
-        # Check for R^2 calculation
-        assert "CalculateRSquared()" in content
-        assert "double CalculateRSquared()" in content
-
-        # Check for formula components
-        assert "dd_factor" in content
-        assert "pf_bonus" in content
-        assert "trade_scale" in content
-        assert "r_squared" in content
+def test_ontester_code_structure(sample_ea_without_ontester, temp_dir):
+    """Test that generated OnTester code has all required components."""
+    result = inject_ontester(sample_ea_without_ontester, temp_dir)
 
-        # Check for linear regression
-        assert "sum_x" in content
-        assert "sum_y" in content
-        assert "sum_xy" in content
-        assert "sum_x2" in content
-        assert "ss_total" in content
-        assert "ss_residual" in content
+    data = Path(result.modified_ea_path).read_bytes()
+    missing = [token for token in _REQUIRED_ONTESTER_TOKENS if token not in data]
+    assert not missing, missing
 
 
 def test_ontester_ignores_commented_ontester(temp_dir):
     """Test that commented OnTester functions are ignored."""
-    ea_path = os.path.join(temp_dir, "TestEACommented.mq5")
-    content = """
-//+------------------------------------------------------------------+
-//| Test EA with commented OnTester
-//+------------------------------------------------------------------+
+    ea_path = temp_dir / "TestEACommented.mq5"
+    _write_ea(ea_path, _EA_COMMENTED_ONTESTER)
 
-int OnInit()
-{
-    return(INIT_SUCCEEDED);
-}
+    result = inject_ontester(ea_path, temp_dir)
 
-// double OnTester()
-// {
-//     return 100.0;
-// }
+    # Should inject since commented OnTester doesn't count
+    assert result.status == "injected"
+    assert result.has_existing_ontester is False
 
-void OnTick()
-{
-    // Trading logic
-}
-"""
-    with open(ea_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+
+def test_ontester_ignores_block_commented_ontester(temp_dir):
+    """Test that an OnTester inside a /* */ block comment is ignored."""
+    ea_path = temp_dir / "TestEABlockComment.mq5"
+    _write_ea(ea_path, _EA_NO_ONTESTER + b"/*\ndouble OnTester()\n{\n    return 1.0;\n}\n*/\n")
 
     result = inject_ontester(ea_path, temp_dir)
 
-    # Should inject since commented OnTester doesn't count
     assert result.status == "injected"
     assert result.has_existing_ontester is False
 
 
+def test_ontester_comment_markers_in_strings_do_not_hide_code(temp_dir):
+    """Test that "/*" inside a string literal does not hide a real OnTester."""
+    ea_path = temp_dir / "TestEAStringComment.mq5"
+    _write_ea(ea_path, b'input string Sep = "/*";\n' + _EA_EXTERNAL_ONTESTER + b'string End = "*/";\n')
+
+    result = inject_ontester(ea_path, temp_dir)
+
+    assert result.status == "conflict"
+
+
 def test_validate_ontester_injection(sample_ea_without_ontester, temp_dir):
     """Test validate_ontester_injection convenience function."""
     result = validate_ontester_injection(sample_ea_without_ontester)
@@ -299,26 +408,8 @@ def test_validate_ontester_injection(sample_ea_without_ontester, temp_dir):
 
 def test_ontester_unicode_handling(temp_dir):
     """Test handling of EA files with Unicode content."""
-    ea_path = os.path.join(temp_dir, "TestEAUnicode.mq5")
-    content = """
-//+------------------------------------------------------------------+
-//| Test EA with Unicode: €£¥
-//+------------------------------------------------------------------+
-
-input string Comment = "Testing: €£¥";
-
-int OnInit()
-{
-    return(INIT_SUCCEEDED);
-}
-
-void OnTick()
-{
-    // Trading logic
-}
-"""
-    with open(ea_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    ea_path = temp_dir / "TestEAUnicode.mq5"
+    _write_ea(ea_path, _EA_UNICODE)
 
     result = inject_ontester(ea_path, temp_dir)
 
@@ -331,12 +422,27 @@ void OnTick()
         assert "€£¥" in content
 
 
+def test_ontester_copy_preserves_original_bytes(temp_dir):
+    """Test that the modified EA starts with the original bytes unchanged."""
+    ea_path = temp_dir / "TestEACrlf.mq5"
+    original = _EA_NO_ONTESTER.replace(b"\n", b"\r\n") + b"// \xff\r\n"
+    _write_ea(ea_path, original)
+
+    result = inject_ontester(ea_path, temp_dir)
+
+    assert result.status == "injected"
+    data = Path(result.modified_ea_path).read_bytes()
+    assert data.startswith(original)
+    # Appended block follows the source's CRLF line endings
+    assert b"\n" not in data[len(original):].replace(b"\r\n", b"")
+
+
 def test_ontester_modified_filename(sample_ea_without_ontester, temp_dir):
     """Test that modified EA has correct filename suffix."""
     result = inject_ontester(sample_ea_without_ontester, temp_dir)
 
     assert result.modified_ea_path is not None
-    filename = os.path.basename(result.modified_ea_path)
+    filename = Path(result.modified_ea_path).name
     assert filename.endswith("_ontester.mq5")
     assert "TestEA" in filename
 
@@ -20,6 +20,7 @@ from ea_stress.workflow.steps.step04_analyze import (
     analyze_parameters,
     validate_analysis,
     validate_response_schema,
+    _is_valid,
     write_analysis_request,
     read_analysis_response,
     AnalysisResult
@@ -253,6 +254,30 @@ class TestStep04Analyze(unittest.TestCase):
         errors = validate_response_schema(valid_response)
         self.assertEqual(errors, [])
 
+    def test_is_valid_agrees_with_full_validation(self):
+        """Test fast pre-check matches validate_response_schema"""
+        responses = [
+            {
+                'wide_validation_params': {'FastMAPeriod': 20, 'UseFilter': True},
+                'optimization_ranges': [
+                    {'name': 'FastMAPeriod', 'optimize': True, 'start': 10, 'step': 5, 'stop': 50},
+                    {'name': 'UseFilter', 'optimize': False, 'default': 1, 'category': 'filter'}
+                ]
+            },
+            {'wide_validation_params': {}},
+            {'wide_validation_params': [], 'optimization_ranges': []},
+            {'wide_validation_params': {'A': None}, 'optimization_ranges': []},
+            {'wide_validation_params': {}, 'optimization_ranges': [{'name': 'A', 'optimize': True}]},
+            {'wide_validation_params': {}, 'optimization_ranges': [{'name': 'A', 'optimize': False}]},
+            {'wide_validation_params': {}, 'optimization_ranges': [{'name': 'A', 'optimize': "true"}]},
+            {'wide_validation_params': {}, 'optimization_ranges': [
+                {'name': 'A', 'optimize': False, 'default': 1, 'rationale': 5}
+            ]},
+        ]
+
+        for response in responses:
+            self.assertEqual(_is_valid(response), validate_response_schema(response) == [])
+
     def test_read_analysis_response_not_found(self):
         """Test read_analysis_response when file doesn't exist"""
         response = read_analysis_response(
@@ -3,6 +3,7 @@ Tests for Step 6: Create Optimization INI (Pass 1 - Wide)
 """
 
 import unittest
+from unittest.mock import patch
 from pathlib import Path
 import tempfile
 import shutil
@@ -10,9 +11,13 @@ from datetime import datetime, timedelta
 
 from ea_stress.workflow.steps.step06_ini import (
     create_optimization_ini,
+    create_optimization_inis_batch,
+    ensure_output_dir,
     OptimizationINIResult,
     validate_ini_generation,
     _timeframe_to_minutes,
+    _split_input_schema,
+    _compile_inputs_template,
 )
 
 
@@ -200,6 +205,26 @@ class TestStep06OptimizationINI(unittest.TestCase):
         self.assertFalse(result.success)
         self.assertIn("No optimization ranges", result.error_message)
 
+    def test_non_ascii_fields_written_as_utf8(self):
+        """Test non-ASCII names, symbols and string defaults are written as UTF-8"""
+        result = create_optimization_ini(
+            ex5_path=str(self.ex5_path),
+            symbol="GER40€",
+            timeframe="H1",
+            workflow_id=self.workflow_id,
+            optimization_ranges=[
+                {"name": "Période", "optimize": False, "default": 1},
+                {"name": "Comment", "optimize": False, "default": "Stratégie"},
+            ],
+            output_dir=str(self.output_dir),
+        )
+
+        self.assertTrue(result.success, result.error_message)
+        ini_content = Path(result.ini_path).read_text(encoding="utf-8")
+        self.assertIn("Symbol=GER40€", ini_content)
+        self.assertIn("Période=1", ini_content)
+        self.assertIn("Stratégie", ini_content)
+
     def test_all_fixed_parameters(self):
         """Test INI with all fixed parameters (no optimization)"""
         fixed_ranges = [
@@ -296,6 +321,8 @@ class TestStep06OptimizationINI(unittest.TestCase):
         self.assertEqual(_timeframe_to_minutes("W1"), 10080)
         self.assertEqual(_timeframe_to_minutes("MN1"), 43200)
         self.assertEqual(_timeframe_to_minutes("UNKNOWN"), 60)  # Default
+        self.assertEqual(_timeframe_to_minutes("h2"), 120)  # Non-standard hours
+        self.assertEqual(_timeframe_to_minutes("M20"), 20)  # Non-standard minutes
 
     def test_validate_ini_generation_success(self):
         """Test validation of successful INI generation"""
@@ -371,6 +398,142 @@ class TestStep06OptimizationINI(unittest.TestCase):
         self.assertTrue(new_output_dir.exists())
         self.assertTrue(Path(result.ini_path).exists())
 
+    def test_inputs_template_reused_across_defaults(self):
+        """Test compiled TesterInputs template is shared by schemas differing only in defaults"""
+        changed_defaults = [dict(r, default=r["default"] + 1) for r in self.optimization_ranges]
+
+        key_a, defaults_a = _split_input_schema(self.optimization_ranges)
+        key_b, defaults_b = _split_input_schema(changed_defaults)
+
+        self.assertEqual(key_a, key_b)
+        self.assertIs(_compile_inputs_template(key_a), _compile_inputs_template(key_b))
+        self.assertEqual(
+            _compile_inputs_template(key_b).format(*defaults_b),
+            "FastMAPeriod=21||10||5||50||Y\n"
+            "SlowMAPeriod=51||30||10||100||Y\n"
+            "StopLoss=101||0||0||0||N\n"
+            "TakeProfit=201||0||0||0||N\n",
+        )
+
+    def test_inputs_template_keeps_int_and_float_ranges_apart(self):
+        """Test an int range and an equal float range render their own values"""
+        int_range = [{"name": "A", "optimize": True, "start": 10, "step": 1, "stop": 20, "default": 10}]
+        float_range = [{"name": "A", "optimize": True, "start": 10.0, "step": 1, "stop": 20, "default": 10.0}]
+
+        int_key, int_defaults = _split_input_schema(int_range)
+        float_key, float_defaults = _split_input_schema(float_range)
+
+        self.assertEqual(_compile_inputs_template(int_key).format(*int_defaults), "A=10||10||1||20||Y\n")
+        self.assertEqual(_compile_inputs_template(float_key).format(*float_defaults), "A=10.0||10.0||1||20||Y\n")
+
+    def test_batch_creates_inis_in_order(self):
+        """Test batch generation across a symbol sweep"""
+        symbols = ["EURUSD", "GBPUSD", "USDJPY"]
+        configs = [
+            {
+                "ex5_path": str(self.ex5_path),
+                "symbol": symbol,
+                "timeframe": "H1",
+                "workflow_id": self.workflow_id,
+                "optimization_ranges": self.optimization_ranges,
+                "output_dir": str(self.output_dir),
+            }
+            for symbol in symbols
+        ]
+
+        for max_workers in (None, 4):
+            results = create_optimization_inis_batch(configs, max_workers=max_workers)
+
+            self.assertEqual(len(results), 3)
+            for symbol, result in zip(symbols, results):
+                self.assertTrue(result.success)
+                self.assertIn(symbol, result.report_name)
+                ini_content = Path(result.ini_path).read_text(encoding="utf-8")
+                self.assertIn(f"Symbol={symbol}", ini_content)
+
+    def test_batch_prepares_output_dir_once(self):
+        """Test batch generation creates a shared output directory only once"""
+        new_output_dir = Path(self.temp_dir) / "sweep" / "inis"
+        configs = [
+            {
+                "ex5_path": str(self.ex5_path),
+                "symbol": symbol,
+                "timeframe": "H1",
+                "workflow_id": self.workflow_id,
+                "optimization_ranges": self.optimization_ranges,
+                "output_dir": str(new_output_dir),
+            }
+            for symbol in ["EURUSD", "GBPUSD", "USDJPY"]
+        ]
+
+        with patch(
+            "ea_stress.workflow.steps.step06_ini.ensure_output_dir",
+            wraps=ensure_output_dir,
+        ) as mock_ensure:
+            results = create_optimization_inis_batch(configs)
+
+        self.assertEqual(mock_ensure.call_count, 1)
+        self.assertTrue(all(r.success for r in results))
+        self.assertTrue(new_output_dir.exists())
+
+    def test_batch_reports_output_dir_failure_per_config(self):
+        """Test an output directory that cannot be created fails only its configs"""
+        blocker = Path(self.temp_dir) / "blocker"
+        blocker.write_text("not a directory", encoding="utf-8")
+        configs = [
+            {
+                "ex5_path": str(self.ex5_path),
+                "symbol": symbol,
+                "timeframe": "H1",
+                "workflow_id": self.workflow_id,
+                "optimization_ranges": self.optimization_ranges,
+                "output_dir": str(output_dir),
+            }
+            for symbol, output_dir in [("EURUSD", blocker / "inis"), ("GBPUSD", self.output_dir)]
+        ]
+
+        bad, good = create_optimization_inis_batch(configs)
+
+        self.assertFalse(bad.success)
+        self.assertIn("Error creating output directory", bad.error_message)
+        self.assertIn(str(blocker / "inis"), bad.error_message)
+        self.assertTrue(good.success)
+
+    def test_fsync_control(self):
+        """Test INI write flushes to disk only when fsync is requested"""
+        for fsync in (True, False):
+            with patch("ea_stress.workflow.steps.step06_ini.os.fsync") as mock_fsync:
+                result = create_optimization_ini(
+                    ex5_path=str(self.ex5_path),
+                    symbol="EURUSD",
+                    timeframe="H1",
+                    workflow_id=self.workflow_id,
+                    optimization_ranges=self.optimization_ranges,
+                    output_dir=str(self.output_dir),
+                    fsync=fsync,
+                )
+
+            self.assertTrue(result.success)
+            self.assertEqual(mock_fsync.called, fsync)
+
+    def test_ini_uses_platform_line_endings(self):
+        """Test INI newlines follow os.linesep, as a text-mode write would"""
+        for linesep in ("\n", "\r\n"):
+            with patch("ea_stress.workflow.steps.step06_ini.os.linesep", linesep):
+                result = create_optimization_ini(
+                    ex5_path=str(self.ex5_path),
+                    symbol="EURUSD",
+                    timeframe="H1",
+                    workflow_id=self.workflow_id,
+                    optimization_ranges=self.optimization_ranges,
+                    output_dir=str(self.output_dir),
+                )
+
+            self.assertTrue(result.success)
+            data = Path(result.ini_path).read_bytes()
+            self.assertTrue(data.startswith(b"[Tester]" + linesep.encode("ascii")))
+            self.assertEqual(data.count(b"\n"), data.count(linesep.encode("ascii")))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 """Tests for Step 7: Run Optimization."""
 
+import os
 import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -286,6 +287,7 @@ class TestCountPassesInXml(unittest.TestCase):
             self.assertEqual(count, 3)
         finally:
             xml_path.unlink()
+            xml_path.with_suffix('.passes').unlink(missing_ok=True)
 
     def test_count_passes_header_only(self):
         """Return 0 when XML has only header row."""
@@ -307,12 +309,109 @@ class TestCountPassesInXml(unittest.TestCase):
             self.assertEqual(count, 0)
         finally:
             xml_path.unlink()
+            xml_path.with_suffix('.passes').unlink(missing_ok=True)
 
     def test_count_passes_file_not_found(self):
         """Return 0 when XML file doesn't exist."""
         count = _count_passes_in_xml(Path("/nonexistent/file.xml"))
         self.assertEqual(count, 0)
 
+    def test_count_passes_many_rows(self):
+        """Every row in a larger report is counted exactly once."""
+        xml_path = Path("test_optimization_many.xml")
+        xml_path.write_text("<Table>" + "<Row><Cell>1</Cell></Row>" * 500 + "</Table>", encoding='utf-8')
+
+        try:
+            count = _count_passes_in_xml(xml_path)
+            self.assertEqual(count, 499)
+        finally:
+            xml_path.unlink()
+            xml_path.with_suffix('.passes').unlink(missing_ok=True)
+
+    def test_count_passes_empty_file_not_opened(self):
+        """Return 0 for a 0-byte report without opening it."""
+        xml_path = Path("test_optimization_zero.xml")
+        xml_path.write_bytes(b"")
+
+        try:
+            with patch('builtins.open') as mock_open:
+                count = _count_passes_in_xml(xml_path)
+            self.assertEqual(count, 0)
+            mock_open.assert_not_called()
+        finally:
+            xml_path.unlink()
+            xml_path.with_suffix('.passes').unlink(missing_ok=True)
+
+    def test_count_passes_uses_sidecar(self):
+        """A fresh .passes sidecar short-circuits the rescan."""
+        xml_path = Path("test_optimization_sidecar.xml")
+        xml_path.write_text("<Table>" + "<Row><Cell>1</Cell></Row>" * 6 + "</Table>", encoding='utf-8')
+        sidecar = xml_path.with_suffix('.passes')
+
+        try:
+            self.assertEqual(_count_passes_in_xml(xml_path), 5)
+            xml_stat = xml_path.stat()
+            self.assertEqual(
+                sidecar.read_text(encoding='utf-8'),
+                f"{xml_stat.st_size} {xml_stat.st_mtime_ns} 5"
+            )
+
+            with patch('ea_stress.workflow.steps.step07_optimize.mmap.mmap') as mock_mmap:
+                self.assertEqual(_count_passes_in_xml(xml_path), 5)
+            mock_mmap.assert_not_called()
+
+            # Rewriting the report invalidates the sidecar
+            xml_path.write_text("<Table>" + "<Row><Cell>1</Cell></Row>" * 3 + "</Table>", encoding='utf-8')
+            self.assertEqual(_count_passes_in_xml(xml_path), 2)
+        finally:
+            xml_path.unlink()
+            sidecar.unlink(missing_ok=True)
+
+    def test_count_passes_sidecar_rejects_same_mtime_rewrite(self):
+        """A rewrite within the same mtime tick is caught by the size check."""
+        xml_path = Path("test_optimization_same_tick.xml")
+        xml_path.write_text("<Table>" + "<Row><Cell>1</Cell></Row>" * 6 + "</Table>", encoding='utf-8')
+        sidecar = xml_path.with_suffix('.passes')
+
+        try:
+            self.assertEqual(_count_passes_in_xml(xml_path), 5)
+            mtime_ns = xml_path.stat().st_mtime_ns
+
+            xml_path.write_text("<Table>" + "<Row><Cell>1</Cell></Row>" * 3 + "</Table>", encoding='utf-8')
+            os.utime(xml_path, ns=(mtime_ns, mtime_ns))
+            self.assertEqual(_count_passes_in_xml(xml_path), 2)
+        finally:
+            xml_path.unlink()
+            sidecar.unlink(missing_ok=True)
+
+    def test_count_passes_only_first_table(self):
+        """Only rows of the results table count, not comments or later tables."""
+        xml_content = """<?xml version="1.0"?>
+<Workbook xmlns="urn:schemas-microsoft-com:office:spreadsheet">
+  <!-- <Row> legend placeholder -->
+  <Worksheet>
+    <Table>
+      <Row><Cell>Pass</Cell><Cell>Result</Cell></Row>
+      <Row><Cell>1</Cell><Cell>1234.56</Cell></Row>
+      <Row><Cell>2</Cell><Cell>2345.67</Cell></Row>
+    </Table>
+  </Worksheet>
+  <Worksheet>
+    <Table>
+      <Row><Cell>Legend</Cell></Row>
+    </Table>
+  </Worksheet>
+</Workbook>"""
+
+        xml_path = Path("test_optimization_tables.xml")
+        xml_path.write_text(xml_content, encoding='utf-8')
+
+        try:
+            self.assertEqual(_count_passes_in_xml(xml_path), 2)
+        finally:
+            xml_path.unlink()
+            xml_path.with_suffix('.passes').unlink(missing_ok=True)
+
     def test_count_passes_malformed_xml(self):
         """Return 0 for malformed XML (exception handling)."""
         xml_path = Path("test_malformed.xml")
@@ -326,6 +425,22 @@ class TestCountPassesInXml(unittest.TestCase):
             self.assertEqual(count, 0)
         finally:
             xml_path.unlink()
+            xml_path.with_suffix('.passes').unlink(missing_ok=True)
+
+    def test_count_passes_truncated_xml(self):
+        """A truncated report counts the rows read so far and is not cached."""
+        xml_path = Path("test_optimization_truncated.xml")
+        xml_path.write_text(
+            "<Workbook><Table>" + "<Row><Cell>1</Cell></Row>" * 6 + "<Row><Cell>7",
+            encoding='utf-8'
+        )
+
+        try:
+            self.assertEqual(_count_passes_in_xml(xml_path), 5)
+            self.assertFalse(xml_path.with_suffix('.passes').exists())
+        finally:
+            xml_path.unlink()
+            xml_path.with_suffix('.passes').unlink(missing_ok=True)
 
 
 class TestValidateOptimization(unittest.TestCase):
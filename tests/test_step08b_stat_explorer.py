@@ -2,11 +2,15 @@
 Tests for Step 8B: Stat Explorer
 """
 
+import json
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime, timezone
+from datetime import date, datetime
 
+from ea_stress.mt5.tester import BacktestResult
+from ea_stress.workflow.dates import backtest_date_range
 from ea_stress.workflow.steps.step08b_stat_explorer import (
     run_stat_explorer,
     validate_stat_explorer,
@@ -22,7 +26,38 @@ from ea_stress.workflow.steps.step08b_stat_explorer import (
     _compute_long_short_stats,
     _compute_profit_concentration,
     _compute_parameter_sensitivity,
-    _identify_session_bias
+    _identify_session_bias,
+    _trades_to_soa,
+    TradeArrays,
+    _pearson_and_median,
+    _session_lookup,
+    _parse_trade_history_from_html,
+    _compute_backtest_window,
+)
+
+
+# MT5 HTML report with an Orders table and a Deals table holding two round trips
+_DEALS_HTML = (
+    "<html><body><table>"
+    "<tr><th colspan=13><div><b>Orders</b></div></th></tr>"
+    "<tr><td>Open Time</td><td>Order</td><td>Symbol</td><td>Type</td></tr>"
+    "<tr><th colspan=13><div><b>Deals</b></div></th></tr>"
+    "<tr><td>Time</td><td>Deal</td><td>Symbol</td><td>Type</td><td>Direction</td>"
+    "<td>Volume</td><td>Price</td><td>Order</td><td>Commission</td><td>Swap</td>"
+    "<td>Profit</td><td>Balance</td><td>Comment</td></tr>"
+    "<tr><td>2024.01.01 00:00:00</td><td>1</td><td></td><td>balance</td><td></td>"
+    "<td></td><td></td><td></td><td>0.00</td><td>0.00</td><td>3 000.00</td><td>3 000.00</td><td></td></tr>"
+    "<tr><td>2024.01.02 08:15:00</td><td>2</td><td>EURUSD</td><td>buy</td><td>in</td>"
+    "<td>0.1</td><td>1.1</td><td>2</td><td>0.00</td><td>0.00</td><td>0.00</td><td>3 000.00</td><td></td></tr>"
+    "<tr><td>2024.01.02 09:00:00</td><td>3</td><td>EURUSD</td><td>sell</td><td>out</td>"
+    "<td>0.1</td><td>1.2</td><td>3</td><td>0.00</td><td>0.00</td><td>1 250.50</td><td>4 250.50</td><td></td></tr>"
+    "<tr><td>2024.01.05 14:00:00</td><td>4</td><td>EURUSD</td><td>sell</td><td>in</td>"
+    "<td>0.1</td><td>1.2</td><td>4</td><td>0.00</td><td>0.00</td><td>0.00</td><td>4 250.50</td><td></td></tr>"
+    "<tr><td>2024.01.05 20:30:00</td><td>5</td><td>EURUSD</td><td>buy</td><td>out</td>"
+    "<td>0.1</td><td>1.3</td><td>5</td><td>0.00</td><td>0.00</td><td>-100.00</td><td>4 150.50</td><td></td></tr>"
+    "<tr><td></td><td></td><td></td><td></td><td></td><td></td><td></td><td></td>"
+    "<td>0.00</td><td>0.00</td><td>1 150.50</td><td>4 150.50</td><td></td></tr>"
+    "</table></body></html>"
 )
 
 
@@ -39,6 +74,61 @@ class TestStatExplorerHelpers(unittest.TestCase):
         self.assertEqual(windows["London"], (7, 16))
         self.assertEqual(windows["NewYork"], (13, 22))
 
+    def test_session_lookup(self):
+        """Test hour to session table uses first matching window."""
+        names, lut = _session_lookup("UTC")
+        self.assertEqual(names, ("Asia", "London", "NewYork"))
+        self.assertEqual(len(lut), 24)
+        self.assertEqual(lut[0], 0)
+        self.assertEqual(lut[7], 1)
+        self.assertEqual(lut[14], 1)  # London/NewYork overlap -> London
+        self.assertEqual(lut[16], 2)
+        self.assertEqual(lut[22], -1)
+        self.assertIs(_session_lookup("UTC"), _session_lookup("UTC"))
+
+    def test_parse_trade_history_from_html(self):
+        """Test Deals table parsing from a UTF-16 MT5 HTML report."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "report.htm"
+            path.write_bytes(_DEALS_HTML.encode('utf-16'))
+            trades = _parse_trade_history_from_html(path)
+
+        self.assertEqual(len(trades), 2)
+        self.assertEqual(trades[0]['type'], 'long')
+        self.assertEqual(trades[0]['hour'], 8)
+        self.assertEqual(trades[0]['dow'], 1)  # Tuesday
+        self.assertEqual(trades[0]['duration_minutes'], 45)
+        self.assertEqual(trades[0]['profit'], 1250.5)
+        self.assertEqual(trades[1]['type'], 'short')
+        self.assertEqual(trades[1]['dow'], 4)  # Friday
+        self.assertEqual(trades[1]['duration_minutes'], 390)
+        self.assertEqual(trades[1]['profit'], -100.0)
+
+    def test_parse_trade_history_skips_spacer_rows(self):
+        """Test spacer rows inside the Deals table do not end parsing early."""
+        second_trade = "<tr><td>2024.01.05 14:00:00</td>"
+        html = _DEALS_HTML.replace(
+            second_trade,
+            "<tr><td colspan=13></td></tr><tr></tr>" + second_trade,
+        ).replace(
+            "</table>",
+            "<tr><th colspan=13><div><b>Results</b></div></th></tr>"
+            "<tr><td>2024.01.09 10:00:00</td><td>6</td><td>EURUSD</td><td>buy</td><td>out</td>"
+            "<td>0.1</td><td>1.3</td><td>6</td><td>0.00</td><td>0.00</td><td>9.00</td><td>0.00</td><td></td></tr>"
+            "</table>",
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "report.htm"
+            path.write_bytes(html.encode('utf-16'))
+            trades = _parse_trade_history_from_html(path)
+
+        self.assertEqual([t['profit'] for t in trades], [1250.5, -100.0])
+
+    def test_parse_trade_history_missing_file(self):
+        """Test missing HTML report yields no trades."""
+        self.assertEqual(_parse_trade_history_from_html(Path("does_not_exist.htm")), [])
+
     def test_compute_session_stats(self):
         """Test session statistics computation."""
         trades = [
@@ -57,6 +147,21 @@ class TestStatExplorerHelpers(unittest.TestCase):
         self.assertEqual(stats["London"].trades, 1)
         self.assertEqual(stats["London"].profit, 200.0)
 
+    def test_compute_session_stats_win_rate(self):
+        """Test session win rate is a percentage and empty sessions stay zero."""
+        trades = [
+            {'hour': 1, 'profit': 10.0},
+            {'hour': 2, 'profit': -5.0},
+            {'hour': 3, 'profit': 5.0},
+            {'hour': 4, 'profit': 0.0},
+        ]
+
+        stats = _compute_session_stats(trades, "UTC")
+        self.assertEqual(stats["Asia"].trades, 4)
+        self.assertEqual(stats["Asia"].win_rate, 50.0)
+        self.assertEqual(stats["Asia"].pf, 1.0)
+        self.assertEqual(stats["NewYork"], SessionStats())
+
     def test_compute_hour_stats(self):
         """Test hourly statistics computation."""
         trades = [
@@ -72,6 +177,15 @@ class TestStatExplorerHelpers(unittest.TestCase):
         self.assertIn("09", stats)
         self.assertEqual(stats["09"].trades, 1)
 
+    def test_compute_hour_stats_skips_empty_hours(self):
+        """Test only hours with trades are reported, in hour order."""
+        trades = [{'hour': 23, 'profit': 5.0}, {'hour': 0, 'profit': -5.0}]
+
+        stats = _compute_hour_stats(trades)
+        self.assertEqual(list(stats), ["00", "23"])
+        self.assertEqual(stats["00"].win_rate, 0.0)
+        self.assertEqual(stats["23"].win_rate, 100.0)
+
     def test_compute_dow_stats(self):
         """Test day-of-week statistics computation."""
         trades = [
@@ -118,6 +232,51 @@ class TestStatExplorerHelpers(unittest.TestCase):
         self.assertEqual(stats["short"].trades, 2)
         self.assertEqual(stats["short"].profit, 350.0)
 
+    def test_trades_to_soa(self):
+        """Test single-pass trade list to parallel arrays conversion."""
+        trades = [
+            {'hour': 8, 'dow': 1, 'duration_minutes': 45, 'profit': 100.0, 'type': 'Sell'},
+            {'profit': -20.0},
+        ]
+
+        hours, dows, durations, profits, is_short = _trades_to_soa(trades)
+        self.assertEqual(hours, [8, 0])
+        self.assertEqual(dows, [1, 0])
+        self.assertEqual(durations, [45, 0])
+        self.assertEqual(profits, [100.0, -20.0])
+        self.assertEqual(is_short, [True, False])
+
+    def test_trades_to_soa_direction_case_insensitive(self):
+        """Test short detection covers short/sell in any case and defaults to long."""
+        trades = [{'type': t} for t in ('Short', 'SELL', 'sell', 'Buy', 'long', '')] + [{}]
+
+        self.assertEqual(_trades_to_soa(trades).is_short,
+                         [True, True, True, False, False, False, False])
+
+    def test_helpers_accept_prebuilt_soa(self):
+        """Test stat helpers give the same result for dicts and TradeArrays."""
+        trades = [
+            {'hour': 8, 'dow': 0, 'duration_minutes': 15, 'profit': 100.0, 'type': 'buy'},
+            {'hour': 14, 'dow': 4, 'duration_minutes': 400, 'profit': -40.0, 'type': 'sell'},
+            {'hour': 2, 'dow': 2, 'duration_minutes': 90, 'profit': 25.0, 'type': 'buy'},
+        ]
+        soa = _trades_to_soa(trades)
+        self.assertIsInstance(soa, TradeArrays)
+
+        self.assertEqual(_compute_session_stats(soa, "UTC"), _compute_session_stats(trades, "UTC"))
+        self.assertEqual(_compute_hour_stats(soa), _compute_hour_stats(trades))
+        self.assertEqual(_compute_dow_stats(soa), _compute_dow_stats(trades))
+        self.assertEqual(_compute_duration_buckets(soa), _compute_duration_buckets(trades))
+        self.assertEqual(_compute_long_short_stats(soa), _compute_long_short_stats(trades))
+        self.assertEqual(_compute_profit_concentration(soa), _compute_profit_concentration(trades))
+
+    def test_compute_duration_buckets_edges(self):
+        """Test duration bucket boundaries are left-closed."""
+        trades = [{'duration_minutes': d, 'profit': 1.0} for d in (29, 30, 119, 120, 359, 360)]
+
+        buckets = _compute_duration_buckets(trades)
+        self.assertEqual([b.trades for b in buckets.values()], [1, 2, 2, 1])
+
     def test_compute_profit_concentration(self):
         """Test profit concentration calculation."""
         trades = [
@@ -157,6 +316,66 @@ class TestStatExplorerHelpers(unittest.TestCase):
         self.assertIsNotNone(fast_ma_sens)
         self.assertLess(fast_ma_sens.corr_to_result, 0)
 
+    def test_compute_parameter_sensitivity_skips_non_numeric(self):
+        """Test non-numeric values are dropped per parameter, not per pass."""
+        pass1_results = [
+            {'result': 1000 - i * 10,
+             'params': {'Pass': i, 'FastMA': 10 + i, 'Mode': i if i % 3 == 0 else 'fast'}}
+            for i in range(60)
+        ]
+
+        sensitivities = {s.name: s for s in _compute_parameter_sensitivity(pass1_results)}
+        self.assertEqual(set(sensitivities), {'FastMA'})
+        self.assertEqual(sensitivities['FastMA'].corr_to_result, -1.0)
+        self.assertEqual(sensitivities['FastMA'].top_decile_median, 13.0)
+
+    def test_compute_parameter_sensitivity_tied_results(self):
+        """Test tied top-decile results short-circuit to no sensitivities."""
+        pass1_results = [{'result': 500, 'params': {'FastMA': 10 + i}} for i in range(40)]
+
+        with patch('ea_stress.workflow.steps.step08b_stat_explorer._pearson_and_median') as mock_kernel:
+            self.assertEqual(_compute_parameter_sensitivity(pass1_results), [])
+        mock_kernel.assert_not_called()
+
+    def test_pearson_and_median(self):
+        """Test fused correlation kernel against the two-pass formula."""
+        values = [10.0, 15.0, 20.0, 30.0, 55.0]
+        results = [1000.0, 950.0, 700.0, 710.0, 100.0]
+
+        n = len(values)
+        mean_v = sum(values) / n
+        mean_r = sum(results) / n
+        cov = sum((v - mean_v) * (r - mean_r) for v, r in zip(values, results)) / n
+        std_v = (sum((v - mean_v) ** 2 for v in values) / n) ** 0.5
+        std_r = (sum((r - mean_r) ** 2 for r in results) / n) ** 0.5
+
+        corr, median_val = _pearson_and_median(list(reversed(values)), list(reversed(results)))
+        self.assertAlmostEqual(corr, cov / (std_v * std_r), places=12)
+        self.assertEqual(median_val, 20.0)
+
+    def test_pearson_and_median_constant_series(self):
+        """Test constant series report no correlation."""
+        corr, median_val = _pearson_and_median([0.1, 0.1, 0.1], [3.0, 2.0, 1.0])
+        self.assertIsNone(corr)
+        self.assertIsNone(median_val)
+
+    def test_backtest_window_matches_step5(self):
+        """Test the window uses the same dates as Step 5 validation."""
+        today_ord = datetime(2025, 6, 30).toordinal()
+        with patch('ea_stress.workflow.steps.step08b_stat_explorer.today_ordinal', return_value=today_ord):
+            start, end, forward = _compute_backtest_window(4, 3)
+
+        from_date, to_date, split_date, _, _, _ = backtest_date_range(today_ord, 4, 1)
+        self.assertEqual((start, end, forward), (from_date, to_date, split_date))
+        self.assertEqual(end, datetime(2025, 6, 30))
+
+    def test_compute_backtest_window_ends_today(self):
+        """Test default window ends on the current local date, like Step 5."""
+        start, end, forward = _compute_backtest_window()
+        self.assertEqual(end.date(), date.today())
+        self.assertLess(start, forward)
+        self.assertLess(forward, end)
+
     def test_identify_session_bias(self):
         """Test session bias flag identification."""
         session_stats = {
@@ -195,6 +414,37 @@ class TestStatExplorerResult(unittest.TestCase):
         self.assertEqual(data['session_stats']['London']['trades'], 50)
         self.assertEqual(len(data['parameter_sensitivity']), 1)
 
+    def test_to_dict_minimal(self):
+        """Test minimal serialization drops empty containers only."""
+        result = StatExplorerResult(
+            success=True,
+            trade_count=0,
+            parameter_sensitivity=[
+                ParameterSensitivity(name="FastMA", corr_to_result=-0.8, top_decile_median=12.0)
+            ],
+        )
+
+        data = result.to_dict(minimal=True)
+        self.assertEqual(data['trade_count'], 0)
+        self.assertIsNone(data['error_message'])
+        self.assertEqual(len(data['parameter_sensitivity']), 1)
+        for key in ('session_stats', 'hour_stats', 'dow_stats', 'trade_duration_buckets',
+                    'long_short', 'profit_concentration', 'session_bias_flags'):
+            self.assertNotIn(key, data)
+            self.assertIn(key, result.to_dict())
+
+    def test_records_are_slotted(self):
+        """Test stat records carry no per-instance __dict__."""
+        for record in (SessionStats(), BucketStats(),
+                       ParameterSensitivity(name="FastMA", corr_to_result=0.1, top_decile_median=1.0),
+                       StatExplorerResult(success=True)):
+            self.assertFalse(hasattr(record, '__dict__'))
+
+        self.assertEqual(
+            StatExplorerResult(success=True, long_short={"long": BucketStats(trades=2, profit=3.0)}).to_dict()['long_short'],
+            {"long": {"trades": 2, "profit": 3.0, "pf": 0.0, "win_rate": 0.0}},
+        )
+
 
 class TestStatExplorer(unittest.TestCase):
     """Test main Stat Explorer function."""
@@ -206,6 +456,11 @@ class TestStatExplorer(unittest.TestCase):
             {'result': 900, 'params': {'Pass': 2, 'FastMA': 15}},
             {'result': 800, 'params': {'Pass': 3, 'FastMA': 20}},
         ]
+        # Larger sweep whose top decile holds enough passes to correlate
+        self.sweep_pass1_results = [
+            {'result': 1000 - i * 10, 'params': {'Pass': i + 1, 'FastMA': 10 + i}}
+            for i in range(30)
+        ]
         self.top_pass_params = {'FastMA': 10}
         self.ex5_path = Path("C:/MT5/Experts/test_ea.ex5")
         self.symbol = "EURUSD"
@@ -214,50 +469,105 @@ class TestStatExplorer(unittest.TestCase):
         self.mt5_terminal_path = Path("C:/MT5/terminal64.exe")
 
     @patch('ea_stress.workflow.steps.step08b_stat_explorer.MT5Tester')
-    @patch('ea_stress.workflow.steps.step08b_stat_explorer.Path.mkdir')
-    def test_run_stat_explorer_success(self, mock_mkdir, mock_tester_class):
+    def test_run_stat_explorer_success(self, mock_tester_class):
         """Test successful Stat Explorer run."""
         # Mock backtest result
         mock_result = Mock()
         mock_result.success = True
-        mock_result.xml_report = Path("C:/MT5/reports/test.xml")
-        mock_result.html_report = None
+        mock_result.xml_path = Path("C:/MT5/reports/test.xml")
+        mock_result.report_path = None
 
         mock_tester = Mock()
         mock_tester.run_backtest.return_value = mock_result
         mock_tester_class.return_value = mock_tester
 
-        result = run_stat_explorer(
-            pass1_results=self.pass1_results,
-            top_pass_params=self.top_pass_params,
-            ex5_path=self.ex5_path,
-            symbol=self.symbol,
-            timeframe=self.timeframe,
-            workflow_id=self.workflow_id,
-            mt5_terminal_path=self.mt5_terminal_path
-        )
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch('ea_stress.workflow.steps.step08b_stat_explorer.RUNS_DIR', tmp_dir):
+            result = run_stat_explorer(
+                pass1_results=self.pass1_results,
+                top_pass_params=self.top_pass_params,
+                ex5_path=self.ex5_path,
+                symbol=self.symbol,
+                timeframe=self.timeframe,
+                workflow_id=self.workflow_id,
+                mt5_terminal_path=self.mt5_terminal_path
+            )
+
+            self.assertTrue(result.success, result.error_message)
+            self.assertTrue(Path(result.stat_explorer_path).exists())
+        self.assertEqual(result.trade_count, 0)  # No HTML report
+
+    @patch('ea_stress.workflow.steps.step08b_stat_explorer.MT5Tester')
+    def test_run_stat_explorer_parameter_sensitivity(self, mock_tester_class):
+        """Test a full Pass 1 sweep yields parameter sensitivity records."""
+        mock_result = Mock()
+        mock_result.success = True
+        mock_result.xml_path = Path("C:/MT5/reports/test.xml")
+        mock_result.report_path = None
+        mock_tester_class.return_value.run_backtest.return_value = mock_result
+
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch('ea_stress.workflow.steps.step08b_stat_explorer.RUNS_DIR', tmp_dir):
+            result = run_stat_explorer(
+                pass1_results=self.sweep_pass1_results,
+                top_pass_params=self.top_pass_params,
+                ex5_path=self.ex5_path,
+                symbol=self.symbol,
+                timeframe=self.timeframe,
+                workflow_id=self.workflow_id,
+                mt5_terminal_path=self.mt5_terminal_path
+            )
 
-        self.assertTrue(result.success)
-        self.assertIsNotNone(result.stat_explorer_path)
-        self.assertEqual(result.trade_count, 0)  # No HTML parsing implemented
+        self.assertTrue(result.success, result.error_message)
         self.assertGreater(len(result.parameter_sensitivity), 0)
 
     @patch('ea_stress.workflow.steps.step08b_stat_explorer.MT5Tester')
-    @patch('ea_stress.workflow.steps.step08b_stat_explorer.Path.mkdir')
-    def test_run_stat_explorer_with_fallback(self, mock_mkdir, mock_tester_class):
+    def test_run_stat_explorer_reads_backtest_result_reports(self, mock_tester_class):
+        """Test trades and XML path come from a real BacktestResult's reports."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            report_path = Path(tmp_dir) / "report.htm"
+            report_path.write_bytes(_DEALS_HTML.encode('utf-16'))
+            xml_path = Path(tmp_dir) / "report.xml"
+            xml_path.write_bytes(b"<Workbook/>")
+            mock_tester_class.return_value.run_backtest.return_value = BacktestResult(
+                success=True, report_path=report_path, xml_path=xml_path
+            )
+
+            with patch('ea_stress.workflow.steps.step08b_stat_explorer.RUNS_DIR', tmp_dir):
+                result = run_stat_explorer(
+                    pass1_results=self.pass1_results,
+                    top_pass_params=self.top_pass_params,
+                    ex5_path=self.ex5_path,
+                    symbol=self.symbol,
+                    timeframe=self.timeframe,
+                    workflow_id=self.workflow_id,
+                    mt5_terminal_path=self.mt5_terminal_path
+                )
+
+            self.assertTrue(result.success, result.error_message)
+            self.assertFalse(result.fallback_to_step5)
+            self.assertEqual(result.trade_count, 2)
+            self.assertEqual(result.backtest_xml_path, str(xml_path))
+            self.assertEqual(json.loads(Path(result.stat_explorer_path).read_text())['trade_count'], 2)
+
+    @patch('ea_stress.workflow.steps.step08b_stat_explorer.MT5Tester')
+    def test_run_stat_explorer_with_fallback(self, mock_tester_class):
         """Test Stat Explorer with fallback to Step 5."""
         # Mock backtest failure
         mock_result = Mock()
         mock_result.success = False
-        mock_result.xml_report = None
+        mock_result.xml_path = None
+        mock_result.report_path = None
 
         mock_tester = Mock()
         mock_tester.run_backtest.return_value = mock_result
         mock_tester_class.return_value = mock_tester
 
-        step5_xml = Path("C:/MT5/reports/step5.xml")
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                patch('ea_stress.workflow.steps.step08b_stat_explorer.RUNS_DIR', tmp_dir):
+            step5_xml = Path(tmp_dir) / "step5.xml"
+            step5_xml.write_bytes(b"<Workbook/>")
 
-        with patch.object(Path, 'exists', return_value=True):
             result = run_stat_explorer(
                 pass1_results=self.pass1_results,
                 top_pass_params=self.top_pass_params,
@@ -269,8 +579,9 @@ class TestStatExplorer(unittest.TestCase):
                 step5_xml_path=step5_xml
             )
 
-        self.assertTrue(result.success)
+        self.assertTrue(result.success, result.error_message)
         self.assertTrue(result.fallback_to_step5)
+        self.assertEqual(result.backtest_xml_path, str(step5_xml))
 
     @patch('ea_stress.workflow.steps.step08b_stat_explorer.MT5Tester')
     @patch('ea_stress.workflow.steps.step08b_stat_explorer.Path.mkdir')
@@ -279,7 +590,7 @@ class TestStatExplorer(unittest.TestCase):
         # Mock backtest failure
         mock_result = Mock()
         mock_result.success = False
-        mock_result.xml_report = None
+        mock_result.xml_path = None
 
         mock_tester = Mock()
         mock_tester.run_backtest.return_value = mock_result
@@ -299,6 +610,34 @@ class TestStatExplorer(unittest.TestCase):
         self.assertFalse(result.success)
         self.assertIn("no Step 5 fallback", result.error_message)
 
+    @patch('ea_stress.workflow.steps.step08b_stat_explorer.MT5Tester')
+    @patch('ea_stress.workflow.steps.step08b_stat_explorer.Path.mkdir')
+    def test_run_stat_explorer_backtest_config(self, mock_mkdir, mock_tester_class):
+        """Test top pass params reach the tester as a read-only view."""
+        mock_result = Mock()
+        mock_result.success = False
+        mock_result.xml_path = None
+
+        mock_tester = Mock()
+        mock_tester.run_backtest.return_value = mock_result
+        mock_tester_class.return_value = mock_tester
+
+        run_stat_explorer(
+            pass1_results=self.pass1_results,
+            top_pass_params=self.top_pass_params,
+            ex5_path=self.ex5_path,
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            workflow_id=self.workflow_id,
+            mt5_terminal_path=self.mt5_terminal_path
+        )
+
+        config = mock_tester.run_backtest.call_args[0][0]
+        self.assertEqual(config.expert, "test_ea.ex5")
+        self.assertEqual(dict(config.inputs), self.top_pass_params)
+        with self.assertRaises(TypeError):
+            config.inputs['FastMA'] = 99
+
     @patch('ea_stress.workflow.steps.step08b_stat_explorer.MT5Tester')
     @patch('ea_stress.workflow.steps.step08b_stat_explorer.Path.mkdir')
     def test_run_stat_explorer_exception(self, mock_mkdir, mock_tester_class):
@@ -1,8 +1,11 @@
 """Tests for Step 8C: LLM Improvement Proposal."""
 
 import pytest
+import hashlib
 import json
+import os
 import tempfile
+from dataclasses import asdict
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -14,8 +17,14 @@ from ea_stress.workflow.steps.step08c_llm_proposal import (
     write_proposal_request,
     read_proposal_response,
     generate_llm_proposal,
+    generate_llm_proposals_batch,
     validate_llm_proposal,
-    _validate_response_schema
+    _validate_response_schema,
+    _RESPONSE_SCHEMA,
+    _PROPOSAL_CACHE,
+    _PROPOSAL_CACHE_SIZE,
+    _cache_proposal,
+    _cached_proposal,
 )
 
 
@@ -127,6 +136,56 @@ class TestValidateResponseSchema:
         assert not is_valid
         assert "ea_patch" in error
 
+    def test_non_object_response(self):
+        """Test a JSON array or scalar response is a schema error, not a crash."""
+        for response in ([], ["param_actions"], "text", 42, None):
+            assert _validate_response_schema(response) == (False, "Response must be a JSON object")
+
+    def test_validator_follows_schema_required_lists(self):
+        """Test every schema-required field is enforced by the validator."""
+        valid = {
+            "param_actions": [
+                {"name": "MA", "action": "fix", "rationale": "r", "evidence": []}
+            ],
+            "range_refinements": [{"name": "MA", "start": 1, "step": 1, "stop": 5}],
+            "expected_impact": [],
+            "risks": [],
+            "review_required": False
+        }
+        assert _validate_response_schema(valid) == (True, "")
+
+        for field in _RESPONSE_SCHEMA["required"]:
+            response = {k: v for k, v in valid.items() if k != field}
+            assert _validate_response_schema(response) == (False, f"Missing required field: {field}")
+
+        range_items = _RESPONSE_SCHEMA["properties"]["range_refinements"]["items"]
+        for field in range_items["required"]:
+            response = dict(valid, range_refinements=[
+                {k: v for k, v in valid["range_refinements"][0].items() if k != field}
+            ])
+            is_valid, error = _validate_response_schema(response)
+            assert not is_valid
+            assert field in error
+
+    def test_missing_item_fields_reported_in_schema_order(self):
+        """Test every missing item field is listed, in schema order."""
+        response = {
+            "param_actions": [{"evidence": [], "name": "MA"}],
+            "range_refinements": [],
+            "expected_impact": [],
+            "risks": [],
+            "review_required": True
+        }
+        assert _validate_response_schema(response) == (
+            False, "param_actions[0] missing required fields: action, rationale"
+        )
+
+        response["param_actions"] = []
+        response["range_refinements"] = [{"stop": 5, "name": "MA"}]
+        assert _validate_response_schema(response) == (
+            False, "range_refinements[0] missing required fields: start, step"
+        )
+
 
 class TestWriteProposalRequest:
     """Test request file writing."""
@@ -151,6 +210,31 @@ class TestWriteProposalRequest:
                 assert request["step"] == "8C"
                 assert "stat_explorer" in request["inputs"]
                 assert "output_schema" in request
+                assert request["output_schema"] == _RESPONSE_SCHEMA
+                rules = request["instructions"]["rules"]
+                assert len(rules) == 6
+                assert rules[3].startswith("Session-based sizing changes require profit concentration >=")
+                assert request["inputs"]["ea_source_code"] == "// EA code here"
+
+    def test_write_request_references_ea_source_path(self):
+        """Test request references the EA by path and digest instead of inlining it."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ea_path = Path(tmpdir) / "MyEA.mq5"
+            ea_path.write_bytes(b"// EA code here")
+            with patch('ea_stress.workflow.steps.step08c_llm_proposal.RUNS_DIR', tmpdir):
+                request_path = write_proposal_request(
+                    stat_explorer_data={},
+                    pass1_results=[],
+                    parameter_usage_map={},
+                    ea_source_code=None,
+                    workflow_id="test123",
+                    ea_source_path=ea_path
+                )
+
+            inputs = json.loads(request_path.read_bytes())["inputs"]
+            assert "ea_source_code" not in inputs
+            assert inputs["ea_source_path"] == str(ea_path)
+            assert inputs["ea_source_sha256"] == hashlib.sha256(b"// EA code here").hexdigest()
 
 
 class TestReadProposalResponse:
@@ -180,6 +264,18 @@ class TestReadProposalResponse:
                 assert result is not None
                 assert result["review_required"] is False
 
+    def test_read_malformed_response(self):
+        """Test truncated response JSON is treated as not yet available."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch('ea_stress.workflow.steps.step08c_llm_proposal.RUNS_DIR', tmpdir):
+                response_dir = Path(tmpdir) / "analysis" / "test123" / "llm"
+                response_dir.mkdir(parents=True)
+                (response_dir / "step8c_response.json").write_text('{"param_actions": [')
+
+                assert read_proposal_response("test123") is None
+                with patch('ea_stress.jsonio.orjson', None):
+                    assert read_proposal_response("test123") is None
+
     def test_read_nonexistent_response(self):
         """Test reading nonexistent response returns None."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -187,6 +283,15 @@ class TestReadProposalResponse:
                 result = read_proposal_response("nonexistent")
                 assert result is None
 
+    def test_read_response_from_explicit_path(self):
+        """Test a pre-resolved path is read without deriving it from RUNS_DIR."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            response_path = Path(tmpdir) / "step8c_response.json"
+            response_path.write_text('{"risks": []}')
+
+            assert read_proposal_response("ignored", path=response_path) == {"risks": []}
+            assert read_proposal_response("ignored", path=Path(tmpdir) / "missing.json") is None
+
 
 class TestGenerateLLMProposal:
     """Test main proposal generation function."""
@@ -275,6 +380,98 @@ class TestGenerateLLMProposal:
                     assert len(result.range_refinements) == 1
                     assert result.review_required is True
 
+    def test_unchanged_response_reuses_parsed_result(self):
+        """Test repeated polls skip re-reading an unchanged response file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch('ea_stress.workflow.steps.step08c_llm_proposal.RUNS_DIR', tmpdir):
+                with patch('ea_stress.workflow.steps.step08c_llm_proposal.LLM_IMPROVEMENT_ENABLED', True):
+                    response_dir = Path(tmpdir) / "analysis" / "test123" / "llm"
+                    response_dir.mkdir(parents=True)
+                    (response_dir / "step8c_request.json").write_text('{"step": "8C"}')
+                    response_path = response_dir / "step8c_response.json"
+                    response = {
+                        "param_actions": [],
+                        "range_refinements": [],
+                        "expected_impact": [],
+                        "risks": ["None"],
+                        "review_required": True
+                    }
+                    response_path.write_text(json.dumps(response))
+
+                    kwargs = dict(
+                        stat_explorer_data={},
+                        pass1_results=[],
+                        parameter_usage_map={},
+                        ea_source_code="// code",
+                        workflow_id="test123"
+                    )
+                    first = generate_llm_proposal(**kwargs)
+                    assert first.status == "validated"
+
+                    with patch(
+                        'ea_stress.workflow.steps.step08c_llm_proposal.read_json'
+                    ) as mock_read:
+                        second = generate_llm_proposal(**kwargs)
+                    mock_read.assert_not_called()
+                    assert second == first
+
+                    # Callers get independent copies; mutating one leaves the cache intact
+                    assert second is not first
+                    second.risks.append("Mutated")
+                    assert generate_llm_proposal(**kwargs).risks == ["None"]
+
+                    # A response rewritten within the same mtime tick is parsed again
+                    st = response_path.stat()
+                    response["risks"] = ["Changed"]
+                    response_path.write_text(json.dumps(response))
+                    os.utime(response_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+                    third = generate_llm_proposal(**kwargs)
+                    assert third is not first
+                    assert third.risks == ["Changed"]
+
+    def test_proposal_cache_is_bounded(self):
+        """Test the proposal cache evicts least recently used entries."""
+        with patch.dict(_PROPOSAL_CACHE, clear=True):
+            for i in range(_PROPOSAL_CACHE_SIZE + 5):
+                _cache_proposal(f"resp{i}.json", (i, 100), LLMProposalResult(success=True, status="validated"))
+
+            assert len(_PROPOSAL_CACHE) == _PROPOSAL_CACHE_SIZE
+            assert _cached_proposal("resp0.json", (0, 100)) is None
+            last = _PROPOSAL_CACHE_SIZE + 4
+            assert _cached_proposal(f"resp{last}.json", (last, 100)) is not None
+            assert _cached_proposal(f"resp{last}.json", (last, 101)) is None
+
+    def test_batch_polls_each_workflow(self):
+        """Test batched polling returns each workflow's own status, in order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch('ea_stress.workflow.steps.step08c_llm_proposal.RUNS_DIR', tmpdir):
+                with patch('ea_stress.workflow.steps.step08c_llm_proposal.LLM_IMPROVEMENT_ENABLED', True):
+                    llm_dir = Path(tmpdir) / "analysis" / "wf_done" / "llm"
+                    llm_dir.mkdir(parents=True)
+                    (llm_dir / "step8c_request.json").write_text('{"step": "8C"}')
+                    (llm_dir / "step8c_response.json").write_text(json.dumps({
+                        "param_actions": [],
+                        "range_refinements": [],
+                        "expected_impact": [],
+                        "risks": [],
+                        "review_required": True
+                    }))
+
+                    inputs = dict(
+                        stat_explorer_data={},
+                        pass1_results=[],
+                        parameter_usage_map={},
+                        ea_source_code="// code"
+                    )
+                    for max_workers in (None, 4):
+                        results = generate_llm_proposals_batch(
+                            {"wf_new": inputs, "wf_done": inputs},
+                            max_workers=max_workers
+                        )
+                        assert list(results) == ["wf_new", "wf_done"]
+                        assert results["wf_new"].status == "request_written"
+                        assert results["wf_done"].status == "validated"
+
 
 class TestLLMProposalResultSerialization:
     """Test result serialization."""
@@ -304,6 +501,13 @@ class TestLLMProposalResultSerialization:
         assert d["param_actions"][0]["name"] == "MA"
         assert d["ea_patch"]["description"] == "Test patch"
         assert d["review_required"] is True
+        assert d == asdict(result)
+
+    def test_to_dict_without_patch_matches_asdict(self):
+        """Test the explicit to_dict keeps the asdict layout with no patch."""
+        result = LLMProposalResult(success=False, status="error", error_message="boom")
+        assert result.to_dict() == asdict(result)
+        assert not hasattr(result, "__dict__")
 
 
 class TestConvenienceFunction:
@@ -3,6 +3,7 @@
 import pytest
 import json
 import tempfile
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -10,10 +11,14 @@ from ea_stress.workflow.steps.step08d_review import (
     ReviewResult,
     ReviewDecision,
     review_proposal,
+    review_proposals,
     validate_review,
     _create_review_package,
     _read_review_decision,
-    _apply_patch
+    _apply_patch,
+    _read_baseline,
+    _BASELINE_CACHE,
+    _BASELINE_CACHE_SIZE
 )
 from ea_stress.workflow.steps.step08c_llm_proposal import (
     LLMProposalResult,
@@ -86,6 +91,49 @@ class TestCreateReviewPackage:
                 assert "instructions" in package
                 assert package["proposal"]["ea_patch"]["description"] == "Add filter"
 
+                proposal_dict = sample_proposal.to_dict()
+                assert package["proposal"] == {k: proposal_dict[k] for k in package["proposal"]}
+                assert set(package["proposal"]) == {
+                    "param_actions", "range_refinements", "ea_patch", "expected_impact", "risks"
+                }
+
+    def test_unchanged_package_is_not_rewritten(self, sample_proposal):
+        """Test repeat polls keep the existing package until the proposal changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch('ea_stress.workflow.steps.step08d_review.RUNS_DIR', tmpdir):
+                ea_path = Path(tmpdir) / "TestEA.mq5"
+                ea_path.write_text("// EA code")
+
+                package_path = _create_review_package(sample_proposal, ea_path, "test123")
+                first = package_path.read_bytes()
+
+                with patch('ea_stress.workflow.steps.step08d_review.write_json_atomic') as mock_write:
+                    assert _create_review_package(sample_proposal, ea_path, "test123") == package_path
+                mock_write.assert_not_called()
+
+                sample_proposal.risks = ["Different risk"]
+                _create_review_package(sample_proposal, ea_path, "test123")
+                assert package_path.read_bytes() != first
+                assert json.loads(package_path.read_bytes())["proposal"]["risks"] == ["Different risk"]
+
+    def test_package_hash_written_atomically(self, sample_proposal):
+        """Test the hash file is replaced atomically and a corrupt one forces a rewrite."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch('ea_stress.workflow.steps.step08d_review.RUNS_DIR', tmpdir):
+                ea_path = Path(tmpdir) / "TestEA.mq5"
+                ea_path.write_text("// EA code")
+
+                package_path = _create_review_package(sample_proposal, ea_path, "test123")
+                hash_path = package_path.parent / ".package_hash"
+                package_hash = hash_path.read_text(encoding='ascii')
+                assert not list(package_path.parent.glob("*.tmp"))
+
+                hash_path.write_bytes(b"\xff\xfe torn")
+                with patch('ea_stress.workflow.steps.step08d_review.write_json_atomic') as mock_write:
+                    _create_review_package(sample_proposal, ea_path, "test123")
+                mock_write.assert_called_once()
+                assert hash_path.read_text(encoding='ascii') == package_hash
+
 
 class TestReadReviewDecision:
     """Test review decision reading."""
@@ -107,6 +155,8 @@ class TestReadReviewDecision:
                 assert decision is not None
                 assert decision.approved is True
                 assert decision.reviewer_notes == "Looks good"
+                assert datetime.fromisoformat(decision.timestamp).utcoffset() == timedelta(0)
+                assert "." not in decision.timestamp
 
     def test_read_rejected_decision(self):
         """Test reading rejected decision with feedback."""
@@ -132,6 +182,18 @@ class TestReadReviewDecision:
                 decision = _read_review_decision("nonexistent")
                 assert decision is None
 
+    def test_read_decision_from_explicit_path(self):
+        """Test a pre-resolved path is read without deriving it from RUNS_DIR."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            decision_path = Path(tmpdir) / "step8d_decision.json"
+            decision_path.write_text('{"approved": true}')
+
+            decision = _read_review_decision("ignored", path=decision_path)
+            assert decision is not None
+            assert decision.approved is True
+
+            assert _read_review_decision("ignored", path=Path(tmpdir) / "missing.json") is None
+
 
 class TestApplyPatch:
     """Test patch application."""
@@ -144,11 +206,11 @@ class TestApplyPatch:
                 ea_path = Path(tmpdir) / "TestEA.mq5"
                 ea_path.write_text("// Original EA code\n// INSERT_PATCH_HERE\n// More code")
 
-                patch = EAPatch(description="Test patch", diff="// Patched code")
+                ea_patch = EAPatch(description="Test patch", diff="// Patched code")
 
                 patched_path = _apply_patch(
                     baseline_ea_path=ea_path,
-                    patch=patch,
+                    patch=ea_patch,
                     workflow_id="test123",
                     version=2
                 )
@@ -167,11 +229,11 @@ class TestApplyPatch:
                 ea_path = Path(tmpdir) / "TestEA.mq5"
                 ea_path.write_text("// Original EA code")
 
-                patch = EAPatch(description="Test patch", diff="// New function")
+                ea_patch = EAPatch(description="Test patch", diff="// New function")
 
                 patched_path = _apply_patch(
                     baseline_ea_path=ea_path,
-                    patch=patch,
+                    patch=ea_patch,
                     workflow_id="test123"
                 )
 
@@ -180,6 +242,100 @@ class TestApplyPatch:
                 assert "LLM PATCH" in content
                 assert "New function" in content
 
+    def test_apply_patch_works_on_raw_bytes(self):
+        """Test marker replacement keeps the surrounding baseline bytes intact."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch('ea_stress.workflow.steps.step08d_review.RUNS_DIR', tmpdir):
+                ea_path = Path(tmpdir) / "TestEA.mq5"
+                ea_path.write_bytes("// Größe\r\n// INSERT_PATCH_HERE\r\n".encode('utf-8'))
+                ea_patch = EAPatch(description="Test patch", diff="int größe = 1;")
+
+                patched_path = _apply_patch(baseline_ea_path=ea_path, patch=ea_patch, workflow_id="test123")
+                assert patched_path.read_bytes() == "// Größe\r\nint größe = 1;\r\n".encode('utf-8')
+
+                ea_path.write_bytes("// INSERT_PATCH_HERE".encode('utf-16'))
+                assert _apply_patch(baseline_ea_path=ea_path, patch=ea_patch, workflow_id="test123") is None
+
+    def test_apply_patch_rereads_changed_baseline(self):
+        """Test cached baseline is reused until the file changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch('ea_stress.workflow.steps.step08d_review.RUNS_DIR', tmpdir):
+                ea_path = Path(tmpdir) / "TestEA.mq5"
+                ea_path.write_text("// Version one")
+                ea_patch = EAPatch(description="Test patch", diff="// New function")
+
+                with patch('builtins.open', wraps=open) as mock_open:
+                    _apply_patch(baseline_ea_path=ea_path, patch=ea_patch, workflow_id="test123")
+                    _apply_patch(baseline_ea_path=ea_path, patch=ea_patch, workflow_id="test123")
+                baseline_reads = [c for c in mock_open.call_args_list if c.args[0] == ea_path]
+                assert len(baseline_reads) == 1
+
+                ea_path.write_text("// Version two, longer")
+                patched_path = _apply_patch(baseline_ea_path=ea_path, patch=ea_patch, workflow_id="test123")
+                assert "Version two" in patched_path.read_text()
+
+    def test_baseline_cache_is_bounded(self):
+        """Test the baseline cache evicts the least recently used source."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.dict(_BASELINE_CACHE, clear=True):
+                paths = []
+                for i in range(_BASELINE_CACHE_SIZE + 2):
+                    ea_path = Path(tmpdir) / f"EA{i}.mq5"
+                    ea_path.write_text(f"// EA {i}")
+                    paths.append(ea_path)
+                    assert _read_baseline(ea_path) == f"// EA {i}".encode()
+
+                assert len(_BASELINE_CACHE) == _BASELINE_CACHE_SIZE
+                assert str(paths[0]) not in _BASELINE_CACHE
+                assert str(paths[-1]) in _BASELINE_CACHE
+
+    def test_apply_patch_keeps_unchanged_patch_file(self):
+        """Test the .patch file is only rewritten when its content changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch('ea_stress.workflow.steps.step08d_review.RUNS_DIR', tmpdir):
+                ea_path = Path(tmpdir) / "TestEA.mq5"
+                ea_path.write_text("// Original EA code")
+                ea_patch = EAPatch(description="Test patch", diff="// New function")
+                diff_path = Path(tmpdir) / "analysis" / "test123" / "patches" / "TestEA_v2.patch"
+
+                _apply_patch(baseline_ea_path=ea_path, patch=ea_patch, workflow_id="test123")
+                with patch('builtins.open', wraps=open) as mock_open:
+                    _apply_patch(baseline_ea_path=ea_path, patch=ea_patch, workflow_id="test123")
+                diff_writes = [
+                    c for c in mock_open.call_args_list
+                    if c.args[0] == diff_path and c.args[1] == 'w'
+                ]
+                assert diff_writes == []
+
+                ea_patch.description = "Changed"
+                _apply_patch(baseline_ea_path=ea_path, patch=ea_patch, workflow_id="test123")
+                assert diff_path.read_text().startswith("Description: Changed")
+
+    def test_apply_patch_unified_diff_keeps_baseline(self):
+        """Test unified diffs (file header or bare hunk) leave the baseline as-is."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch('ea_stress.workflow.steps.step08d_review.RUNS_DIR', tmpdir):
+                ea_path = Path(tmpdir) / "TestEA.mq5"
+                ea_path.write_text("// Original EA code\n// INSERT_PATCH_HERE\n")
+
+                for diff in ("--- a/TestEA.mq5\n+++ b/TestEA.mq5\n", "@@ -1 +1 @@\n-x\n+y\n"):
+                    ea_patch = EAPatch(description="Unified", diff=diff)
+                    patched_path = _apply_patch(baseline_ea_path=ea_path, patch=ea_patch, workflow_id="test123")
+                    assert patched_path.read_bytes() == ea_path.read_bytes()
+
+    def test_apply_patch_unified_diff_copies_without_reading(self):
+        """Test the unified-diff branch copies the file instead of decoding it."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch('ea_stress.workflow.steps.step08d_review.RUNS_DIR', tmpdir):
+                ea_path = Path(tmpdir) / "TestEA.mq5"
+                ea_path.write_bytes(b"// EA code\r\nint x = 1;\r\n")
+                ea_patch = EAPatch(description="Unified", diff="--- a\n+++ b\n")
+
+                with patch('ea_stress.workflow.steps.step08d_review._read_baseline') as mock_read:
+                    patched_path = _apply_patch(baseline_ea_path=ea_path, patch=ea_patch, workflow_id="test123")
+                mock_read.assert_not_called()
+                assert patched_path.read_bytes() == ea_path.read_bytes()
+
 
 class TestReviewProposal:
     """Test main review function."""
@@ -314,6 +470,35 @@ class TestReviewProposal:
                     assert result.active_ea_path == str(ea_path)
                     assert result.passed_gate()
 
+    def test_review_proposals_batch(self, sample_proposal):
+        """Test batched review resolves each workflow's decision."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch('ea_stress.workflow.steps.step08d_review.RUNS_DIR', tmpdir):
+                with patch('ea_stress.workflow.steps.step08d_review.LLM_REVIEW_REQUIRED', True):
+                    ea_path = Path(tmpdir) / "TestEA.mq5"
+                    ea_path.write_text("// EA code")
+
+                    decision_dir = Path(tmpdir) / "analysis" / "wf_rejected" / "patches"
+                    decision_dir.mkdir(parents=True)
+                    (decision_dir / "step8d_decision.json").write_text('{"approved": false}')
+
+                    for max_workers in (None, 4):
+                        results = review_proposals(
+                            proposals={
+                                "wf_rejected": sample_proposal,
+                                "wf_pending": sample_proposal,
+                            },
+                            baseline_ea_paths={
+                                "wf_rejected": ea_path,
+                                "wf_pending": ea_path,
+                            },
+                            max_workers=max_workers
+                        )
+
+                        assert list(results) == ["wf_rejected", "wf_pending"]
+                        assert results["wf_rejected"].status == "rejected"
+                        assert results["wf_pending"].status == "pending_review"
+
 
 class TestReviewResultSerialization:
     """Test result serialization."""
@@ -337,6 +522,21 @@ class TestReviewResultSerialization:
         assert d["decision"]["approved"] is True
         assert d["decision"]["reviewer_notes"] == "LGTM"
 
+    def test_to_dict_matches_asdict(self):
+        """Test the explicit to_dict keeps the asdict layout."""
+        from dataclasses import asdict
+
+        for decision in (None, ReviewDecision(approved=False, feedback="no", timestamp="t")):
+            result = ReviewResult(
+                success=True,
+                status="rejected",
+                review_required=True,
+                decision=decision,
+                refinement_cycle=2
+            )
+            assert result.to_dict() == asdict(result)
+            assert not hasattr(result, "__dict__")
+
 
 class TestConvenienceFunction:
     """Test convenience function."""